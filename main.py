@@ -4,19 +4,80 @@
 
 import sys
 import os
+import argparse
+import multiprocessing
+import tracemalloc
 from pathlib import Path
 
-from PySide6.QtGui import QGuiApplication, QFontDatabase, QFont
-from PySide6.QtQml import QQmlApplicationEngine, qmlRegisterSingletonType
-from PySide6.QtCore import QUrl
-
-from src.models.app_store import AppStore
-from src.models.sample_content import get_sample_subjects
-from src.models.updater import AppUpdater
+# Module level imports stay Qt-free: spawned curriculum loader processes
+# (see curricula.py) re-import this module as __mp_main__, and should not
+# pay for PySide6 and the app models they never use.
+from src.models.content_sources import find_sources, is_source
+from src.models.memory import format_diff, format_report, parse_size
+
+
+def _parse_options(argv):
+    """Split our own options from *argv*; the rest goes to Qt."""
+    parser = argparse.ArgumentParser(prog="main.py")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="print estimated memory per subsystem on exit")
+    parser.add_argument("--memory-trace", action="store_true",
+                        help="trace allocations with tracemalloc and print "
+                             "the growth from startup to exit")
+    parser.add_argument("--memory-budget", action="append", default=[],
+                        metavar="NAME=SIZE",
+                        help="memory budget of an evictable subsystem, e.g. "
+                             "topicCache=16M (0 = unlimited)")
+    parser.add_argument("--content", action="append", default=[],
+                        metavar="PATH",
+                        help="mount a curriculum directory or .zip content "
+                             "pack (repeatable; the first is active). "
+                             "Default: everything in <data dir>/curricula")
+    options, qt_args = parser.parse_known_args(argv[1:])
+    budgets = []
+    for spec in options.memory_budget:
+        name, _sep, size = spec.partition("=")
+        try:
+            budgets.append((name, parse_size(size)))
+        except ValueError as exc:
+            parser.error(f"--memory-budget {spec}: {exc}")
+    options.memory_budget = budgets
+    for path in options.content:
+        if not is_source(path):
+            parser.error(f"--content {path}: not a directory or .zip pack")
+    return options, argv[:1] + qt_args
+
+
+def _print_memory(store, trace):
+    out = sys.stderr
+    out.write(format_report(store.memoryReport()) + "\n")
+    if trace:
+        store.memorySnapshot("exit")
+        out.write("\nAllocation growth since startup:\n")
+        out.write(format_diff(store.memoryDiff("startup", "exit")) + "\n")
+    out.flush()
 
 
 def main():
-    app = QGuiApplication(sys.argv)
+    from PySide6.QtGui import QGuiApplication, QFontDatabase, QFont
+    from PySide6.QtQml import QQmlApplicationEngine, qmlRegisterSingletonType
+    from PySide6.QtCore import QStandardPaths, QUrl
+
+    from src.models.app_store import AppStore
+    from src.models.image_provider import PROVIDER_ID, ThumbnailCache, TopicImageProvider
+    from src.models.nav_metrics import NavigationMetrics
+    from src.models.network import NetworkManager
+    from src.models.render_monitor import RenderMonitor
+    from src.models.sample_content import get_sample_subjects
+    from src.models.study_timer import StudyTimer
+    from src.models.updater import AppUpdater
+    from src.models.user_data import UserDataTransfer
+
+    options, qt_argv = _parse_options(sys.argv)
+    if options.memory_trace:
+        tracemalloc.start()
+
+    app = QGuiApplication(qt_argv)
     app.setApplicationName("StudyToday")
     app.setOrganizationName("StudyToday")
 
@@ -27,22 +88,82 @@ def main():
 
     # Create store and load sample content
     store = AppStore()
-    store.setSyncStatus("syncing")
-
-    subjects = get_sample_subjects()
-    store.setSubjects(subjects)
-    store.setSyncStatus("done")
-    store.setLastSha("sample-local")
+    if options.memory_trace:
+        store.memorySnapshot("startup")
+    for name, budget in options.memory_budget:
+        if not store.setMemoryBudget(name, budget):
+            print(f"Unknown or non-evictable memory subsystem: {name}",
+                  file=sys.stderr)
+            sys.exit(2)
+    data_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+
+    # Installed curricula load in worker processes; without any, fall back
+    # to the bundled sample content
+    sources = options.content or find_sources(os.path.join(data_dir, "curricula"))
+    if sources:
+        store.mountCurricula(sources)
+    else:
+        store.setSyncStatus("syncing")
+        store.setSubjects(get_sample_subjects())
+        store.setSyncStatus("done")
+        store.setLastSha("sample-local")
+
+    # Notes persist in an append-only journal; replaying it also recovers
+    # edits made right before a crash.
+    store.openNoteJournal(os.path.join(data_dir, "notes.journal"))
+    app.aboutToQuit.connect(store.closeNoteJournal)
+
+    # Per-question progress, restored from its attempt log
+    store.openProgressLog(os.path.join(data_dir, "progress.log"))
+    app.aboutToQuit.connect(store.closeProgressLog)
+
+    # Study sessions, restored from their append-only log
+    store.openSessionLog(os.path.join(data_dir, "sessions.log"))
+
+    # Pomodoro timer; records focus time left behind by a crash
+    study_timer = StudyTimer(store)
+    study_timer.openCheckpoint(os.path.join(data_dir, "timer.json"))
+    app.aboutToQuit.connect(study_timer.shutdown)
 
     # QML engine
     engine = QQmlApplicationEngine()
 
+    # Shared HTTP client and worker pool for all network work
+    network = NetworkManager()
+    app.aboutToQuit.connect(network.shutdown)
+
     # Auto-updater
-    updater = AppUpdater()
+    updater = AppUpdater(network)
+
+    # Topic images: decoded off the GUI thread, thumbnails cached on disk
+    cache_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    images = TopicImageProvider(
+        ThumbnailCache(os.path.join(cache_dir, "thumbnails")),
+        os.path.join(data_dir, "content"),
+        network.http,
+    )
+    engine.addImageProvider(PROVIDER_ID, images)
+    app.aboutToQuit.connect(images.shutdown)
+
+    # Backup / restore of notes, bookmarks and sessions
+    user_data = UserDataTransfer(store)
+
+    if options.memory_report or options.memory_trace:
+        app.aboutToQuit.connect(lambda: _print_memory(store, options.memory_trace))
+
+    # Page navigation latency (cold vs. cached pages)
+    nav_metrics = NavigationMetrics()
+
+    # Idle/slow-hardware detection driving low-power rendering
+    render_monitor = RenderMonitor(store)
 
     # Expose to QML
     engine.rootContext().setContextProperty("appStore", store)
     engine.rootContext().setContextProperty("appUpdater", updater)
+    engine.rootContext().setContextProperty("userData", user_data)
+    engine.rootContext().setContextProperty("studyTimer", study_timer)
+    engine.rootContext().setContextProperty("navMetrics", nav_metrics)
+    engine.rootContext().setContextProperty("renderMonitor", render_monitor)
 
     # Add QML import path
     qml_dir = Path(__file__).parent / "src" / "qml"
@@ -56,6 +177,9 @@ def main():
         print("Failed to load QML. Check for errors above.", file=sys.stderr)
         sys.exit(1)
 
+    nav_metrics.attach(engine.rootObjects()[0])
+    render_monitor.attach(engine.rootObjects()[0])
+
     # Check for updates in background
     updater.checkForUpdates()
 
@@ -63,4 +187,11 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    if len(sys.argv) > 1 and sys.argv[1] == "validate":
+        from src.models.content_validator import main as validate_main
+        sys.exit(validate_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "conformance":
+        from src.models.parser_conformance import main as conformance_main
+        sys.exit(conformance_main(sys.argv[2:]))
     main()
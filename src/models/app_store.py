@@ -8,16 +8,51 @@ app_store.py - Main state management QObject for the StudyToday Qt/QML app.
 Exposes all application state as Q_PROPERTYs with change signals so that QML
 can bind to them reactively.  All mutating methods are decorated with @Slot so
 they can be called directly from QML.
+
+Change signals can be deferred with ``beginBatch()``/``commitBatch()`` (or the
+``batch()`` context manager from Python): inside a batch each signal is
+emitted at most once, when the outermost batch commits.
 """
 
 from __future__ import annotations
 
+import random
+import time
 import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from PySide6.QtCore import QObject, Property, Signal, Slot
 
+from src.models.curricula import CurriculumLibrary
+from src.models.incremental_parser import IncrementalParser
+from src.models.memory import MemoryAccountant, estimate_size
+from src.models.note_journal import NoteEditor
+from src.models.prefetch import ParsedTopicCache, PrefetchScheduler
+from src.models.progress import ProgressTracker
+from src.models.quiz import QuestionIndex, assemble_quiz, question_key
+from src.models.records import Subject, Topic
+from src.models.session_log import SessionLog
+
+# Recently answered questions kept out of newly generated quizzes
+_RECENT_ANSWERS = 200
+
+# Default memory budgets in bytes, per evictable subsystem (0 = unlimited)
+MEMORY_BUDGETS = {
+    "topicCache": 32 << 20,
+    "questionIndex": 0,
+    "subjectsVariant": 0,
+    "parseStates": 0,
+}
+
+# Budgets are checked at most this often (seconds), as sizing is not free
+_MEMORY_CHECK_INTERVAL = 0.5
+
+# Rendering modes: "auto" saves power on slow hardware only
+POWER_MODES = ("auto", "save", "full")
+
 
 class AppStore(QObject):
     """Central application state, designed to be registered as a QML context
@@ -30,34 +65,114 @@ class AppStore(QObject):
     subjectsChanged = Signal()
     bookmarksChanged = Signal()
     notesChanged = Signal()
+    noteChanged = Signal(str)  # one note's title/content changed (by id)
     sessionsChanged = Signal()
     syncStatusChanged = Signal()
     lastSyncShaChanged = Signal()
     currentPageChanged = Signal()
     currentSubjectIdChanged = Signal()
     currentTopicIdChanged = Signal()
+    progressChanged = Signal()
+    renderModeChanged = Signal()
+    curriculaChanged = Signal()
 
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
 
         # Internal state
-        self._subjects: list[dict[str, Any]] = []
+        self._subjects: list[Subject] = []
+        # QML view of _subjects, built on first read after each change
+        self._subjects_variant: Optional[list[dict[str, Any]]] = None
+        self._topics_by_id: dict[str, Topic] = {}
         self._bookmarks: list[dict[str, Any]] = []
         self._notes: list[dict[str, Any]] = []
         self._sessions: list[dict[str, Any]] = []
+        # Id indices kept in step with the lists above for O(1) de-duplication
+        self._bookmark_topic_ids: set[str] = set()
+        self._notes_by_id: dict[str, dict[str, Any]] = {}
+        self._session_ids: set[str] = set()
         self._sync_status: str = "idle"
         self._last_sync_sha: str = ""
         self._current_page: str = "home"
         self._current_subject_id: str = ""
         self._current_topic_id: str = ""
 
+        # Mounted curricula; the active ones are merged into _subjects
+        self._curricula = CurriculumLibrary(self, self)
+
+        # Batching: nesting depth and (signal name, args) awaiting emission,
+        # in first-notified order (dict used as an ordered set)
+        self._batch_depth: int = 0
+        self._pending_signals: dict[tuple[str, tuple], None] = {}
+
+        # Delta-based note edits with undo/redo and an optional journal
+        self._note_editor = NoteEditor(lambda: self._notes)
+
+        # Per-topic parse states: changed topics are re-parsed block by
+        # block against their previous version, keeping question ids stable
+        self._parser = IncrementalParser()
+        self._progress_log_path: str = ""
+
+        # Append-only log the study sessions are persisted to, once opened
+        self._session_log: Optional[SessionLog] = None
+
+        # Parsed topics, warmed ahead of navigation while the GUI is idle
+        self._topic_cache = ParsedTopicCache(self._parser)
+        self._prefetcher = PrefetchScheduler(self, self._topic_cache, self)
+
+        # Questions grouped for quiz assembly, and recently answered keys
+        # (an OrderedDict used as a bounded ordered set)
+        self._question_index = QuestionIndex(
+            lambda topic: self._parser.state(topic.id, topic.content).questions)
+        self._recent_answers: OrderedDict[str, None] = OrderedDict()
+
+        # Per-question progress bitsets; aggregates are rebuilt lazily
+        # after the subjects change
+        self._progress = ProgressTracker()
+        self._progress_stale: bool = True
+        self._progress_revision: int = 0
+
+        # Estimated memory per subsystem, with budgets enforced by evicting
+        # caches (which are rebuilt on demand)
+        self._memory = MemoryAccountant()
+        self._memory_checked: float = 0.0
+        self._register_memory()
+
+        # Rendering budget: the user's power mode plus what the render
+        # monitor observed about the window and the hardware
+        self._power_mode: str = "auto"
+        self._window_idle: bool = False
+        self._slow_hardware: bool = False
+
+    # ------------------------------------------------------------------ #
+    #  Change notification
+    # ------------------------------------------------------------------ #
+
+    def _notify(self, signal_name: str, *args: Any) -> None:
+        """Emit *signal_name* now, or queue it if a batch is open."""
+        if self._batch_depth:
+            self._pending_signals[(signal_name, args)] = None
+        else:
+            getattr(self, signal_name).emit(*args)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Context manager wrapping ``beginBatch()``/``commitBatch()``."""
+        self.beginBatch()
+        try:
+            yield
+        finally:
+            self.commitBatch()
+
     # ------------------------------------------------------------------ #
     #  Q_PROPERTY definitions
     # ------------------------------------------------------------------ #
 
     @Property(list, notify=subjectsChanged)
     def subjects(self) -> list:
-        return self._subjects
+        if self._subjects_variant is None:
+            self._subjects_variant = [s.to_variant() for s in self._subjects]
+        return self._subjects_variant
 
     @Property(list, notify=bookmarksChanged)
     def bookmarks(self) -> list:
@@ -71,6 +186,12 @@ class AppStore(QObject):
     def sessions(self) -> list:
         return self._sessions
 
+    @Property(list, notify=curriculaChanged)
+    def curricula(self) -> list:
+        """Mounted curricula as ``{"id", "naam", "path", "active",
+        "resident", "loading", "error", "subjectCount", "topicCount"}``."""
+        return self._curricula.variant()
+
     @Property(str, notify=syncStatusChanged)
     def syncStatus(self) -> str:
         return self._sync_status
@@ -87,21 +208,122 @@ class AppStore(QObject):
     def currentSubjectId(self) -> str:
         return self._current_subject_id
 
+    @Property(int, notify=progressChanged)
+    def progressRevision(self) -> int:
+        """Bumped on every progress change; reference it in QML bindings
+        that call ``topicProgress``/``subjectProgress``."""
+        return self._progress_revision
+
     @Property(str, notify=currentTopicIdChanged)
     def currentTopicId(self) -> str:
         return self._current_topic_id
 
+    @Property(str, notify=renderModeChanged)
+    def powerMode(self) -> str:
+        return self._power_mode
+
+    @Property(bool, notify=renderModeChanged)
+    def slowHardware(self) -> bool:
+        """True while frames render too slowly for smooth animation (as
+        judged by the render monitor)."""
+        return self._slow_hardware
+
+    @Property(bool, notify=renderModeChanged)
+    def lowPower(self) -> bool:
+        """True when transitions should be skipped to save frames."""
+        return self._power_mode == "save" or (
+            self._power_mode == "auto" and self._slow_hardware)
+
+    @Property(bool, notify=renderModeChanged)
+    def animationsActive(self) -> bool:
+        """False while decorative looping animations should be paused
+        (window idle, unfocused or hidden, or low-power mode)."""
+        return not self._window_idle and not self.lowPower
+
+    # --- Records (Python side; QML uses the variants above) ---
+
+    @property
+    def subject_records(self) -> list[Subject]:
+        """The subjects as records, without building the QML variant."""
+        return self._subjects
+
+    def topic_record(self, topic_id: str) -> Optional[Topic]:
+        """The topic record for *topic_id*, or ``None``."""
+        return self._topics_by_id.get(topic_id)
+
     # ------------------------------------------------------------------ #
     #  Slots — callable from QML
     # ------------------------------------------------------------------ #
 
+    # --- Batching ---
+
+    @Slot()
+    def beginBatch(self) -> None:
+        """Start deferring change signals; batches may nest."""
+        self._batch_depth += 1
+
+    @Slot()
+    def commitBatch(self) -> None:
+        """Close a batch; the outermost commit emits each pending signal once."""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            pending = list(self._pending_signals)
+            self._pending_signals.clear()
+            for name, args in pending:
+                getattr(self, name).emit(*args)
+
     # --- Subjects ---
 
     @Slot(list)
     def setSubjects(self, subjects: list) -> None:
-        """Replace the entire subjects list."""
-        self._subjects = list(subjects)
-        self.subjectsChanged.emit()
+        """Replace the entire subjects list.
+
+        Accepts plain dicts (e.g. from QML) or :class:`Subject` records;
+        both are stored as compact records.
+        """
+        self._subjects = [Subject.from_mapping(s) for s in subjects]
+        self._subjects_variant = None
+        self._topics_by_id = {
+            t.id: t for s in self._subjects for t in s.topics
+        }
+        self._topic_cache.clear()
+        self._parser.retain(self._topics_by_id, self._progress.recorded_topics())
+        self._question_index.invalidate(self._subjects)
+        self._progress_stale = True
+        self._progress_revision += 1
+        self._notify("progressChanged")
+        self._notify("subjectsChanged")
+        self.checkMemory()
+
+    # --- Curricula ---
+
+    @Slot(list)
+    def mountCurricula(self, paths: list) -> None:
+        """Mount content sources (directories or ``.zip`` packs) and load
+        them in the background.  The first one becomes active if none is."""
+        self._curricula.mount(str(p) for p in paths)
+
+    @Slot(str)
+    def unmountCurriculum(self, curriculum_id: str) -> None:
+        """Unmount a curriculum; its subjects leave the list."""
+        self._curricula.unmount(curriculum_id)
+
+    @Slot(str)
+    def switchCurriculum(self, curriculum_id: str) -> None:
+        """Make *curriculum_id* the only active curriculum."""
+        self._curricula.set_active([curriculum_id])
+
+    @Slot(list)
+    def setActiveCurricula(self, curriculum_ids: list) -> None:
+        """Activate exactly *curriculum_ids*; their subjects are merged."""
+        self._curricula.set_active(str(i) for i in curriculum_ids)
+
+    def notifyCurriculaChanged(self) -> None:
+        """Announce a change to :attr:`curricula` (queued while a batch is
+        open); called by the curriculum library."""
+        self._notify("curriculaChanged")
 
     # --- Sync ---
 
@@ -110,38 +332,64 @@ class AppStore(QObject):
         """Update the synchronisation status string."""
         if self._sync_status != status:
             self._sync_status = status
-            self.syncStatusChanged.emit()
+            self._notify("syncStatusChanged")
 
     @Slot(str)
     def setLastSha(self, sha: str) -> None:
         """Store the SHA of the last successful sync."""
         if self._last_sync_sha != sha:
             self._last_sync_sha = sha
-            self.lastSyncShaChanged.emit()
+            self._notify("lastSyncShaChanged")
 
     # --- Bookmarks ---
 
     @Slot(str)
     def addBookmark(self, topic_id: str) -> None:
         """Add a bookmark for *topic_id* (no-op if already bookmarked)."""
-        for bm in self._bookmarks:
-            if bm.get("topicId") == topic_id:
-                return
+        if topic_id in self._bookmark_topic_ids:
+            return
+        self._bookmark_topic_ids.add(topic_id)
         self._bookmarks.append({
             "topicId": topic_id,
             "timestamp": datetime.now().isoformat(),
         })
-        self.bookmarksChanged.emit()
+        self._notify("bookmarksChanged")
 
     @Slot(str)
     def removeBookmark(self, topic_id: str) -> None:
         """Remove the bookmark for *topic_id*."""
-        original_len = len(self._bookmarks)
+        if topic_id not in self._bookmark_topic_ids:
+            return
+        self._bookmark_topic_ids.discard(topic_id)
         self._bookmarks = [
             bm for bm in self._bookmarks if bm.get("topicId") != topic_id
         ]
-        if len(self._bookmarks) != original_len:
-            self.bookmarksChanged.emit()
+        self._notify("bookmarksChanged")
+
+    @Slot(list)
+    def addBookmarks(self, bookmarks: list) -> None:
+        """Add many bookmarks in one pass with a single change signal.
+
+        Items are topic id strings or bookmark dicts (``topicId`` plus an
+        optional ``timestamp``); already bookmarked topics are skipped.
+        """
+        existing = self._bookmark_topic_ids
+        now = datetime.now().isoformat()
+        added = False
+        for item in bookmarks:
+            if isinstance(item, str):
+                item = {"topicId": item}
+            topic_id = item.get("topicId")
+            if not topic_id or topic_id in existing:
+                continue
+            existing.add(topic_id)
+            self._bookmarks.append({
+                "topicId": topic_id,
+                "timestamp": item.get("timestamp") or now,
+            })
+            added = True
+        if added:
+            self._notify("bookmarksChanged")
 
     # --- Notes ---
 
@@ -156,26 +404,89 @@ class AppStore(QObject):
             "updatedAt": datetime.now().isoformat(),
         }
         self._notes.append(note)
-        self.notesChanged.emit()
+        self._notes_by_id[note["id"]] = note
+        self._note_editor.created([note])
+        self._notify("notesChanged")
+
+    @Slot(list)
+    def addNotes(self, notes: list) -> None:
+        """Add many notes in one pass with a single change signal.
+
+        Each item is a note dict with ``topicId``, ``title`` and ``content``.
+        ``id`` and ``updatedAt`` are kept when present (e.g. when restoring),
+        and notes whose ``id`` already exists are skipped.
+        """
+        now = datetime.now().isoformat()
+        added: list[dict[str, Any]] = []
+        for item in notes:
+            note_id = item.get("id") or str(uuid.uuid4())
+            if note_id in self._notes_by_id:
+                continue
+            note = {
+                "id": note_id,
+                "topicId": item.get("topicId", ""),
+                "title": item.get("title", ""),
+                "content": item.get("content", ""),
+                "updatedAt": item.get("updatedAt") or now,
+            }
+            self._notes_by_id[note_id] = note
+            added.append(note)
+        if added:
+            self._notes.extend(added)
+            self._note_editor.created(added)
+            self._notify("notesChanged")
 
     @Slot(str, str, str)
     def updateNote(self, note_id: str, title: str, content: str) -> None:
-        """Update an existing note identified by *note_id*."""
-        for note in self._notes:
-            if note.get("id") == note_id:
-                note["title"] = title
-                note["content"] = content
-                note["updatedAt"] = datetime.now().isoformat()
-                self.notesChanged.emit()
-                return
+        """Update an existing note identified by *note_id*.
+
+        Only the changed span of each field is recorded (journal and undo
+        history), and only ``noteChanged(note_id)`` is emitted, so views of
+        other notes are not refreshed.  Unchanged text is a no-op.
+        """
+        note = self._notes_by_id.get(note_id)
+        if note is None:
+            return
+        now = datetime.now().isoformat()
+        changed = self._note_editor.edit(note, "title", title, now)
+        changed = self._note_editor.edit(note, "content", content, now) or changed
+        if changed:
+            self._notify("noteChanged", note_id)
+
+    @Slot(str, result=bool)
+    def undoNote(self, note_id: str) -> bool:
+        """Undo the last saved edit of *note_id*; returns False if none."""
+        note = self._notes_by_id.get(note_id)
+        if note is None or not self._note_editor.undo(note, datetime.now().isoformat()):
+            return False
+        self._notify("noteChanged", note_id)
+        return True
+
+    @Slot(str, result=bool)
+    def redoNote(self, note_id: str) -> bool:
+        """Redo the last undone edit of *note_id*; returns False if none."""
+        note = self._notes_by_id.get(note_id)
+        if note is None or not self._note_editor.redo(note, datetime.now().isoformat()):
+            return False
+        self._notify("noteChanged", note_id)
+        return True
 
     @Slot(str)
     def deleteNote(self, note_id: str) -> None:
         """Delete the note with *note_id*."""
-        original_len = len(self._notes)
+        if self._notes_by_id.pop(note_id, None) is None:
+            return
         self._notes = [n for n in self._notes if n.get("id") != note_id]
-        if len(self._notes) != original_len:
-            self.notesChanged.emit()
+        self._note_editor.deleted(note_id)
+        self._notify("notesChanged")
+
+    def openNoteJournal(self, path: str) -> None:
+        """Persist notes in the journal at *path*, first recovering the
+        notes it already holds (including edits made right before a crash)."""
+        self._note_editor.open(path, self.addNotes)
+
+    def closeNoteJournal(self) -> None:
+        self._note_editor.close()
 
     # --- Study Sessions ---
 
@@ -190,14 +501,260 @@ class AppStore(QObject):
         duration:
             Duration in seconds.
         """
+        self.record_session(subject_id, duration)
+
+    def record_session(self, subject_id: str, duration: int) -> bool:
+        """Record a study session like :meth:`addSession`.
+
+        Returns False if the session log is open but the session could not
+        be written to it; the session is then only kept for this run.
+        """
         session: dict[str, Any] = {
             "id": str(uuid.uuid4()),
             "subjectId": subject_id,
             "startedAt": datetime.now().isoformat(),
             "duration": duration,
         }
+        persisted = self._session_log is None or self._session_log.append([session])
         self._sessions.append(session)
-        self.sessionsChanged.emit()
+        self._session_ids.add(session["id"])
+        self._notify("sessionsChanged")
+        return persisted
+
+    @Slot(list)
+    def addSessions(self, sessions: list) -> None:
+        """Add many study sessions in one pass with a single change signal.
+
+        Each item is a session dict with ``subjectId`` and ``duration`` (in
+        seconds).  ``id`` and ``startedAt`` are kept when present, and
+        sessions whose ``id`` already exists are skipped.
+        """
+        added = self._merge_sessions(sessions)
+        if added and self._session_log is not None:
+            self._session_log.append(added)
+
+    def _merge_sessions(self, sessions: list) -> list[dict[str, Any]]:
+        """Add the sessions that are new; returns them."""
+        existing = self._session_ids
+        now = datetime.now().isoformat()
+        added = []
+        for item in sessions:
+            session_id = item.get("id") or str(uuid.uuid4())
+            if session_id in existing:
+                continue
+            existing.add(session_id)
+            session = {
+                "id": session_id,
+                "subjectId": item.get("subjectId", ""),
+                "startedAt": item.get("startedAt") or now,
+                "duration": int(item.get("duration", 0)),
+            }
+            self._sessions.append(session)
+            added.append(session)
+        if added:
+            self._notify("sessionsChanged")
+        return added
+
+    def openSessionLog(self, path: str) -> None:
+        """Restore the sessions logged at *path*, then persist new ones there."""
+        log = SessionLog(path)
+        self._merge_sessions(log.replay())
+        self._session_log = log
+
+    # --- Quiz ---
+
+    @Slot("QVariantMap", result="QVariant")
+    def generateQuiz(self, options: dict) -> Any:
+        """Assemble a randomised quiz ("toets") from the loaded subjects.
+
+        *options* may contain ``count`` (default 10), ``subjectIds``,
+        ``topicIds`` and ``types`` (empty means all), ``seed`` (omit or
+        ``-1`` for a random one) and ``excludeRecent`` (default true).
+
+        Returns ``{"seed": int, "questions": [...]}``; passing the returned
+        seed again reproduces the quiz.
+        """
+        seed = options.get("seed", -1)
+        if seed is None or int(seed) < 0:
+            seed = random.randrange(2 ** 31)
+        exclude = self._recent_answers if options.get("excludeRecent", True) else ()
+        questions = assemble_quiz(
+            self._question_index,
+            int(options.get("count", 10)),
+            subject_ids=set(options.get("subjectIds") or ()),
+            topic_ids=set(options.get("topicIds") or ()),
+            types=set(options.get("types") or ()),
+            seed=int(seed),
+            exclude=exclude,
+        )
+        self.checkMemory()
+        return {"seed": int(seed), "questions": questions}
+
+    @Slot(str)
+    def markAnswered(self, key: str) -> None:
+        """Remember that the question with quiz *key* was just answered."""
+        self._recent_answers.pop(key, None)
+        self._recent_answers[key] = None
+        while len(self._recent_answers) > _RECENT_ANSWERS:
+            self._recent_answers.popitem(last=False)
+
+    # --- Progress ---
+
+    def _ensure_progress(self) -> ProgressTracker:
+        if self._progress_stale:
+            self._progress.set_topics(
+                [(t.id, s.id) for s in self._subjects for t in s.topics],
+                lambda topic_id: self._parser.question_mask(
+                    topic_id, self._topics_by_id[topic_id].content),
+            )
+            self._progress_stale = False
+        return self._progress
+
+    def openProgressLog(self, path: str) -> None:
+        """Restore progress from the attempt log at *path* and append to it.
+
+        Question ids of topics with progress are saved next to it, so they
+        stay attached to the same questions when the content changes.
+        """
+        self._progress_log_path = path
+        self._parser.load(path + ".ids")
+        self._progress.open(path)
+        self._progress_stale = True
+        self._progress_revision += 1
+        self._notify("progressChanged")
+
+    def closeProgressLog(self) -> None:
+        self._progress.close()
+        if self._progress_log_path:
+            self._parser.save(self._progress_log_path + ".ids",
+                              self._progress.recorded_topics())
+
+    @Slot(str, int, bool)
+    def recordAttempt(self, topic_id: str, question_id: int, correct: bool) -> None:
+        """Record an answer to question *question_id* of *topic_id*."""
+        self.markAnswered(question_key(topic_id, question_id))
+        if self._ensure_progress().record(topic_id, question_id, correct):
+            self._progress_revision += 1
+            self._notify("progressChanged")
+
+    @Slot(str, result="QVariant")
+    def topicProgress(self, topic_id: str) -> Any:
+        """Return ``{"answered", "correct", "total", "percent"}`` for a topic."""
+        return self._ensure_progress().topic(topic_id)
+
+    @Slot(str, result="QVariant")
+    def subjectProgress(self, subject_id: str) -> Any:
+        """Return ``{"answered", "correct", "total", "percent"}`` for a subject."""
+        return self._ensure_progress().subject(subject_id)
+
+    @Slot(str, int, result=int)
+    def questionState(self, topic_id: str, question_id: int) -> int:
+        """0 = not answered, 1 = last answer wrong, 2 = last answer correct."""
+        return self._ensure_progress().question_state(topic_id, question_id)
+
+    # --- Memory ---
+
+    def _register_memory(self) -> None:
+        # Registration order decides which subsystem is charged for shared
+        # objects: topic content belongs to "subjects", not to the caches.
+        # The caches report counters they keep themselves, as checkMemory()
+        # runs after every parse and prefetch step.
+        memory = self._memory
+        memory.register("subjects", lambda seen: estimate_size(
+            self._subjects, self._topics_by_id, seen=seen))
+        memory.register("curricula", lambda seen: estimate_size(
+            [e.subjects for e in self._curricula.entries], seen=seen))
+        memory.register("parseStates", lambda _seen: self._parser.nbytes,
+                        lambda _budget: self._parser.compact(
+                            self._progress.recorded_topics()),
+                        counter=True)
+        memory.register("subjectsVariant", lambda seen: estimate_size(
+            self._subjects_variant, seen=seen), self._evict_subjects_variant)
+        memory.register("topicCache", lambda _seen: self._topic_cache.nbytes,
+                        self._topic_cache.trim, counter=True)
+        memory.register("questionIndex", lambda _seen: self._question_index.nbytes,
+                        lambda _budget: self._question_index.drop(),
+                        counter=True)
+        memory.register("progress", lambda seen: estimate_size(
+            self._progress, seen=seen))
+        memory.register("recentAnswers", lambda seen: estimate_size(
+            self._recent_answers, seen=seen))
+        memory.register("notes", lambda seen: estimate_size(
+            self._notes, self._notes_by_id, self._note_editor, seen=seen))
+        memory.register("userData", lambda seen: estimate_size(
+            self._bookmarks, self._bookmark_topic_ids, self._sessions,
+            self._session_ids, seen=seen))
+        for name, budget in MEMORY_BUDGETS.items():
+            memory.set_budget(name, budget)
+
+    def _evict_subjects_variant(self, _budget: int) -> None:
+        # QML keeps its own copy; the property getter rebuilds ours
+        self._subjects_variant = None
+
+    @Slot(result="QVariant")
+    def memoryReport(self) -> Any:
+        """Return ``{"subsystems": {name: {"bytes", "budget", "evictable"}},
+        "totalBytes", "tracing"}`` with estimated sizes."""
+        return self._memory.report()
+
+    @Slot(str, int, result=bool)
+    def setMemoryBudget(self, name: str, budget: int) -> bool:
+        """Set the budget of subsystem *name* in bytes (0 = unlimited) and
+        enforce it right away.  Returns False for an unknown or
+        non-evictable subsystem."""
+        try:
+            self._memory.set_budget(name, budget)
+        except (KeyError, ValueError):
+            return False
+        self._memory_checked = 0.0
+        self.checkMemory()
+        return True
+
+    @Slot()
+    def checkMemory(self) -> None:
+        """Evict caches that exceed their budget (rate limited)."""
+        now = time.monotonic()
+        if now - self._memory_checked < _MEMORY_CHECK_INTERVAL:
+            return
+        self._memory_checked = now
+        self._memory.enforce()
+
+    @Slot(str)
+    def memorySnapshot(self, label: str) -> None:
+        """Take a tracemalloc snapshot named *label* (starts tracing)."""
+        self._memory.snapshot(label)
+
+    @Slot(str, str, result=list)
+    def memoryDiff(self, before: str, after: str) -> list:
+        """Return the top allocation growth between two snapshots, as
+        ``[{"location", "sizeDiff", "size", "countDiff"}]``."""
+        try:
+            return self._memory.diff(before, after)
+        except KeyError:
+            return []
+
+    # --- Rendering ---
+
+    @Slot(str)
+    def setPowerMode(self, mode: str) -> None:
+        """Set the power mode: ``"auto"``, ``"save"`` or ``"full"``."""
+        if mode in POWER_MODES and mode != self._power_mode:
+            self._power_mode = mode
+            self._notify("renderModeChanged")
+
+    @Slot(bool)
+    def setWindowIdle(self, idle: bool) -> None:
+        """Report whether the window is idle, unfocused or hidden."""
+        if idle != self._window_idle:
+            self._window_idle = idle
+            self._notify("renderModeChanged")
+
+    @Slot(bool)
+    def setSlowHardware(self, slow: bool) -> None:
+        """Report whether frames render too slowly for smooth animation."""
+        if slow != self._slow_hardware:
+            self._slow_hardware = slow
+            self._notify("renderModeChanged")
 
     # --- Navigation ---
 
@@ -206,7 +763,7 @@ class AppStore(QObject):
         """Navigate to a top-level page (e.g. ``"home"``, ``"bookmarks"``)."""
         if self._current_page != page:
             self._current_page = page
-            self.currentPageChanged.emit()
+            self._notify("currentPageChanged")
 
     @Slot(str)
     def navigateToSubject(self, subject_id: str) -> None:
@@ -215,13 +772,13 @@ class AppStore(QObject):
         if self._current_subject_id != subject_id:
             self._current_subject_id = subject_id
             changed = True
-            self.currentSubjectIdChanged.emit()
+            self._notify("currentSubjectIdChanged")
         if self._current_page != "subject":
             self._current_page = "subject"
-            self.currentPageChanged.emit()
+            self._notify("currentPageChanged")
         elif changed:
             # Same page name but different subject — still emit so QML refreshes
-            self.currentPageChanged.emit()
+            self._notify("currentPageChanged")
 
     @Slot(str)
     def navigateToTopic(self, topic_id: str) -> None:
@@ -230,12 +787,12 @@ class AppStore(QObject):
         if self._current_topic_id != topic_id:
             self._current_topic_id = topic_id
             changed = True
-            self.currentTopicIdChanged.emit()
+            self._notify("currentTopicIdChanged")
         if self._current_page != "topic":
             self._current_page = "topic"
-            self.currentPageChanged.emit()
+            self._notify("currentPageChanged")
         elif changed:
-            self.currentPageChanged.emit()
+            self._notify("currentPageChanged")
 
     # ------------------------------------------------------------------ #
     #  Helper methods (also exposed to QML)
@@ -258,26 +815,47 @@ class AppStore(QObject):
     def getSubjectById(self, subject_id: str) -> Any:
         """Return the subject dict for *subject_id*, or ``None``."""
         for subject in self._subjects:
-            if subject.get("id") == subject_id:
-                return subject
+            if subject.id == subject_id:
+                return subject.to_variant()
         return None
 
     @Slot(str, result="QVariant")
     def getTopicById(self, topic_id: str) -> Any:
-        """Return the topic dict for *topic_id*, or ``None``.
+        """Return the topic dict for *topic_id*, or ``None``."""
+        topic = self._topics_by_id.get(topic_id)
+        return topic.to_variant() if topic is not None else None
+
+    @Slot(str, result="QVariant")
+    def getParsedTopic(self, topic_id: str) -> Any:
+        """Return ``{"markdown", "questions"}`` for *topic_id*, or ``None``.
 
-        Searches across all subjects.
+        Served from the prefetch cache when the topic was warmed ahead of
+        time; parsed on the spot otherwise.
         """
-        for subject in self._subjects:
-            for topic in subject.get("topics", []):
-                if topic.get("id") == topic_id:
-                    return topic
-        return None
+        topic = self._topics_by_id.get(topic_id)
+        if topic is None:
+            return None
+        parsed = self._topic_cache.get(topic_id, topic.content)
+        self.checkMemory()
+        return parsed
+
+    @Slot(result="QVariant")
+    def prefetchStats(self) -> Any:
+        """Return topic-open hit/miss counts and the prefetch hit rate."""
+        stats = self._topic_cache.stats()
+        stats["queued"] = self._prefetcher.pending
+        stats.update(self._parser.stats())
+        return stats
 
     @Slot(str, result=bool)
     def isBookmarked(self, topic_id: str) -> bool:
         """Check whether *topic_id* is currently bookmarked."""
-        return any(bm.get("topicId") == topic_id for bm in self._bookmarks)
+        return topic_id in self._bookmark_topic_ids
+
+    @Slot(str, result="QVariant")
+    def getNote(self, note_id: str) -> Any:
+        """Return the current note dict for *note_id*, or ``None``."""
+        return self._notes_by_id.get(note_id)
 
     @Slot(str, result=list)
     def getNotesForTopic(self, topic_id: str) -> list:
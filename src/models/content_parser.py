@@ -14,26 +14,74 @@ Supported block types:
 
 Each block is replaced with an HTML comment placeholder <!-- question-N -->
 in the returned markdown, and the parsed question objects are returned
-separately.
+separately as compact, dict-compatible records (see records.py).
 """
 
 from __future__ import annotations
 
 import re
-from typing import Any
+from bisect import bisect_right
+from typing import Any, Iterator, NamedTuple
+
+from src.models.records import (
+    InvullenQuestion,
+    KoppelenQuestion,
+    MeerkeuzeQuestion,
+    OpenQuestion,
+    Pair,
+    Question,
+    WaarOfNietQuestion,
+)
 
 
+# The block grammar.  Matching it with re.sub costs O(n^2) on a document
+# with n unclosed openers (each one scans to the end of the text), so blocks
+# are found with _scan_blocks, which yields exactly the same matches in
+# linear time; parser_conformance.py checks the two against each other.
 _BLOCK_RE = re.compile(
     r"^:::(meerkeuze|invullen|waar-of-niet|koppelen|open)\s*\n"
     r"(.*?)"
     r"^:::\s*$",
     re.MULTILINE | re.DOTALL,
 )
+_BLOCK_HEAD_RE = re.compile(
+    r"^:::(meerkeuze|invullen|waar-of-niet|koppelen|open)\s*\n", re.MULTILINE)
+_BLOCK_CLOSE_RE = re.compile(r"^:::\s*$", re.MULTILINE)
+
+
+class Block(NamedTuple):
+    """One question block: ``text[start:end]`` is the whole block and
+    ``text[body_start:body_start + len(body)]`` its body."""
 
+    start: int
+    end: int
+    type: str
+    body_start: int
+    body: str
 
-def _parse_meerkeuze(body: str, qid: int) -> dict[str, Any]:
+
+def _scan_blocks(text: str, pos: int = 0) -> Iterator[Block]:
+    """Yield the non-overlapping matches of ``_BLOCK_RE`` in *text*,
+    starting the search at *pos*.
+
+    A block runs from an opener to the first closer line after it.  If an
+    opener has no closer after it, no later opener can have one either, so
+    scanning stops instead of retrying every remaining opener.
+    """
+    while True:
+        head = _BLOCK_HEAD_RE.search(text, pos)
+        if head is None:
+            return
+        close = _BLOCK_CLOSE_RE.search(text, head.end())
+        if close is None:
+            return
+        yield Block(head.start(), close.end(), head.group(1), head.end(),
+                    text[head.end():close.start()])
+        pos = close.end()
+
+
+def _parse_meerkeuze(body: str, qid: int) -> MeerkeuzeQuestion:
     """Parse a multiple-choice question block."""
-    question: dict[str, Any] = {"type": "meerkeuze", "id": qid}
     vraag = ""
     opties: list[str] = []
     correct = 0
@@ -57,16 +105,11 @@ def _parse_meerkeuze(body: str, qid: int) -> dict[str, Any]:
         elif lower.startswith("uitleg:"):
             uitleg = line.split(":", 1)[1].strip()
 
-    question["vraag"] = vraag
-    question["opties"] = opties
-    question["correct"] = correct
-    question["uitleg"] = uitleg
-    return question
+    return MeerkeuzeQuestion(qid, vraag, opties, correct, uitleg)
 
 
-def _parse_invullen(body: str, qid: int) -> dict[str, Any]:
+def _parse_invullen(body: str, qid: int) -> InvullenQuestion:
     """Parse a fill-in-the-blank question block."""
-    question: dict[str, Any] = {"type": "invullen", "id": qid}
     vraag = ""
     antwoord = ""
     hint = ""
@@ -81,15 +124,11 @@ def _parse_invullen(body: str, qid: int) -> dict[str, Any]:
         elif lower.startswith("hint:"):
             hint = line.split(":", 1)[1].strip()
 
-    question["vraag"] = vraag
-    question["antwoord"] = antwoord
-    question["hint"] = hint
-    return question
+    return InvullenQuestion(qid, vraag, antwoord, hint)
 
 
-def _parse_waar_of_niet(body: str, qid: int) -> dict[str, Any]:
+def _parse_waar_of_niet(body: str, qid: int) -> WaarOfNietQuestion:
     """Parse a true-or-false question block."""
-    question: dict[str, Any] = {"type": "waar-of-niet", "id": qid}
     vraag = ""
     antwoord = ""
     uitleg = ""
@@ -104,17 +143,13 @@ def _parse_waar_of_niet(body: str, qid: int) -> dict[str, Any]:
         elif lower.startswith("uitleg:"):
             uitleg = line.split(":", 1)[1].strip()
 
-    question["vraag"] = vraag
-    question["antwoord"] = antwoord
-    question["uitleg"] = uitleg
-    return question
+    return WaarOfNietQuestion(qid, vraag, antwoord, uitleg)
 
 
-def _parse_koppelen(body: str, qid: int) -> dict[str, Any]:
+def _parse_koppelen(body: str, qid: int) -> KoppelenQuestion:
     """Parse a matching question block."""
-    question: dict[str, Any] = {"type": "koppelen", "id": qid}
     vraag = ""
-    paren: list[dict[str, str]] = []
+    paren: list[Pair] = []
 
     for line in body.strip().splitlines():
         line = line.strip()
@@ -126,19 +161,13 @@ def _parse_koppelen(body: str, qid: int) -> dict[str, Any]:
             for pair in pairs_str.split(","):
                 if "=" in pair:
                     term, definition = pair.split("=", 1)
-                    paren.append({
-                        "term": term.strip(),
-                        "definitie": definition.strip(),
-                    })
+                    paren.append(Pair(term.strip(), definition.strip()))
 
-    question["vraag"] = vraag
-    question["paren"] = paren
-    return question
+    return KoppelenQuestion(qid, vraag, paren)
 
 
-def _parse_open(body: str, qid: int) -> dict[str, Any]:
+def _parse_open(body: str, qid: int) -> OpenQuestion:
     """Parse an open-ended question block."""
-    question: dict[str, Any] = {"type": "open", "id": qid}
     vraag = ""
     kernwoorden: list[str] = []
 
@@ -151,9 +180,7 @@ def _parse_open(body: str, qid: int) -> dict[str, Any]:
             kw_str = line.split(":", 1)[1].strip()
             kernwoorden = [w.strip() for w in kw_str.split(",") if w.strip()]
 
-    question["vraag"] = vraag
-    question["kernwoorden"] = kernwoorden
-    return question
+    return OpenQuestion(qid, vraag, kernwoorden)
 
 
 _PARSERS = {
@@ -171,28 +198,188 @@ def parse_content(markdown_str: str) -> dict[str, Any]:
     Returns a dict with two keys:
       - ``markdown``: the markdown string with question blocks replaced by
         ``<!-- question-N -->`` placeholder comments.
-      - ``questions``: a list of parsed question dicts, each containing at
-        minimum ``type`` and ``id`` fields plus type-specific data.
+      - ``questions``: a list of parsed question records, each a read-only
+        mapping with at minimum ``type`` and ``id`` keys plus type-specific
+        data.  Use ``to_variant()`` to get a plain dict for QML.
     """
-    questions: list[dict[str, Any]] = []
-    question_index = 0
-
-    def _replace(match: re.Match) -> str:
-        nonlocal question_index
-        block_type = match.group(1)
-        body = match.group(2)
-        parser = _PARSERS.get(block_type)
-        if parser:
-            question = parser(body, question_index)
-            questions.append(question)
-            placeholder = f"<!-- question-{question_index} -->"
-            question_index += 1
-            return placeholder
-        return match.group(0)
-
-    cleaned_markdown = _BLOCK_RE.sub(_replace, markdown_str)
+    questions: list[Question] = []
+    pieces: list[str] = []
+    pos = 0
+
+    for block in _scan_blocks(markdown_str):
+        question_index = len(questions)
+        questions.append(_PARSERS[block.type](block.body, question_index))
+        pieces.append(markdown_str[pos:block.start])
+        pieces.append(f"<!-- question-{question_index} -->")
+        pos = block.end
+    pieces.append(markdown_str[pos:])
 
     return {
-        "markdown": cleaned_markdown.strip(),
+        "markdown": "".join(pieces).strip(),
         "questions": questions,
     }
+
+
+def count_questions(markdown_str: str) -> int:
+    """Return the number of questions :func:`parse_content` would extract,
+    without parsing their fields."""
+    return sum(1 for _block in _scan_blocks(markdown_str))
+
+
+# ---------------------------------------------------------------------- #
+#  Validation
+# ---------------------------------------------------------------------- #
+
+_OPENER_RE = re.compile(r"^:::([A-Za-z][\w-]*)[ \t]*$", re.MULTILINE)
+_OPTION_MARKER_RE = re.compile(r"[A-Z]\)")
+
+_FIELDS = {
+    "meerkeuze": ("vraag", "opties", "correct", "uitleg"),
+    "invullen": ("vraag", "antwoord", "hint"),
+    "waar-of-niet": ("vraag", "antwoord", "uitleg"),
+    "koppelen": ("vraag", "paren"),
+    "open": ("vraag", "kernwoorden"),
+}
+
+_WAAR_OF_NIET_ANSWERS = {"waar", "niet", "niet waar", "true", "false", "ja", "nee"}
+
+
+def _check_fields(
+    block_type: str, fields: dict[str, tuple[int, str]], start_line: int
+) -> list[tuple[int, str, str]]:
+    """Return type-specific diagnostics for the collected *fields*.
+
+    *fields* maps a field name to ``(line, value)`` of its last occurrence,
+    mirroring how the parsers above let later lines win.
+    """
+    diags: list[tuple[int, str, str]] = []
+
+    def missing(name: str, severity: str = "error") -> None:
+        diags.append((start_line, severity,
+                      f"{block_type}: missing '{name}:' field"))
+
+    if not fields.get("vraag", (0, ""))[1]:
+        missing("vraag")
+
+    if block_type == "meerkeuze":
+        option_count = 0
+        if "opties" not in fields:
+            missing("opties")
+        else:
+            line, value = fields["opties"]
+            if not _OPTION_MARKER_RE.search(value):
+                diags.append((line, "error",
+                              "meerkeuze: 'opties' has no A) B) ... markers"))
+            else:
+                parts = re.split(r"[A-Z]\)\s*", value)
+                option_count = len([p for p in parts if p.strip()])
+                if option_count < 2:
+                    diags.append((line, "warning",
+                                  "meerkeuze: fewer than two options"))
+        if "correct" not in fields:
+            missing("correct", "warning")
+        else:
+            line, value = fields["correct"]
+            try:
+                correct = int(value)
+            except ValueError:
+                diags.append((line, "error",
+                              f"meerkeuze: 'correct' is not an integer: {value!r}"))
+            else:
+                if option_count and not 0 <= correct < option_count:
+                    diags.append((line, "error",
+                                  f"meerkeuze: 'correct' index {correct} is out "
+                                  f"of range for {option_count} options"))
+    elif block_type in ("invullen", "waar-of-niet"):
+        if not fields.get("antwoord", (0, ""))[1]:
+            missing("antwoord")
+        elif block_type == "waar-of-niet":
+            line, value = fields["antwoord"]
+            if value.lower() not in _WAAR_OF_NIET_ANSWERS:
+                diags.append((line, "warning",
+                              f"waar-of-niet: unrecognised answer {value!r}"))
+    elif block_type == "koppelen":
+        if "paren" not in fields:
+            missing("paren")
+        else:
+            line, value = fields["paren"]
+            pairs = [p for p in value.split(",") if p.strip()]
+            for pair in pairs:
+                if "=" not in pair:
+                    diags.append((line, "error",
+                                  f"koppelen: pair without '=': {pair.strip()!r}"))
+            if len([p for p in pairs if "=" in p]) < 2:
+                diags.append((line, "warning",
+                              "koppelen: fewer than two pairs"))
+    elif block_type == "open":
+        if not fields.get("kernwoorden", (0, ""))[1]:
+            missing("kernwoorden", "warning")
+
+    return diags
+
+
+def validate_content(markdown_str: str) -> list[tuple[int, str, str]]:
+    """Check *markdown_str* for malformed question blocks.
+
+    Returns a list of ``(line, severity, message)`` tuples sorted by line,
+    where *line* is 1-based and *severity* is ``"error"`` or ``"warning"``.
+    Errors mark input that :func:`parse_content` silently drops or coerces
+    (a non-integer ``correct:``, ``opties`` without markers, ``paren``
+    without ``=``, unclosed blocks); warnings mark suspicious but usable input.
+    """
+    newlines = [m.start() for m in re.finditer("\n", markdown_str)]
+
+    def line_of(pos: int) -> int:
+        return bisect_right(newlines, pos - 1) + 1
+
+    diags: list[tuple[int, str, str]] = []
+    spans: list[tuple[int, int, str]] = []
+
+    for block in _scan_blocks(markdown_str):
+        block_type = block.type
+        start_line = line_of(block.start)
+        spans.append((block.start, block.end, block_type))
+
+        allowed = _FIELDS[block_type]
+        fields: dict[str, tuple[int, str]] = {}
+        body_line = line_of(block.body_start)
+        for offset, raw in enumerate(block.body.splitlines()):
+            line = raw.strip()
+            if not line:
+                continue
+            key, sep, value = line.partition(":")
+            key = key.strip().lower()
+            if sep and key in allowed:
+                fields[key] = (body_line + offset, value.strip())
+            elif not line.startswith(":::"):
+                diags.append((body_line + offset, "warning",
+                              f"{block_type}: ignored line {line[:40]!r}"))
+
+        diags.extend(_check_fields(block_type, fields, start_line))
+
+    # Openers that the block regex did not consume are either unclosed,
+    # nested inside another block, or of an unknown type.
+    span_starts = {start for start, _end, _type in spans}
+    span_index = 0
+    for match in _OPENER_RE.finditer(markdown_str):
+        pos = match.start()
+        if pos in span_starts:
+            continue
+        name = match.group(1)
+        line = line_of(pos)
+        while span_index < len(spans) and spans[span_index][1] <= pos:
+            span_index += 1
+        if span_index < len(spans) and spans[span_index][0] < pos:
+            outer_start, _end, outer_type = spans[span_index]
+            diags.append((line, "error",
+                          f"':::{name}' nested inside ':::{outer_type}' block "
+                          f"opened on line {line_of(outer_start)}"))
+        elif name in _PARSERS:
+            diags.append((line, "error",
+                          f"':::{name}' block is never closed"))
+        else:
+            diags.append((line, "warning",
+                          f"unknown block type ':::{name}'"))
+
+    diags.sort(key=lambda d: d[0])
+    return diags
@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+content_sources.py - Read a curriculum from a directory or a content pack.
+
+A content source is a directory, or a ``.zip`` content pack with the same
+layout inside (the one ``main.py validate`` assumes)::
+
+    curriculum.json            {"id", "naam", "volgorde"}       (optional)
+    <subject>/subject.json     {"naam", "icon", "volgorde"}     (optional)
+    <subject>/<topic>.md
+
+Ids are namespaced by the source so several curricula can be mounted at
+once: subject ``"<source>/<subject dir>"`` and topic
+``"<source>/<subject dir>/<file stem>"``.  A topic's title is its first
+``# `` heading, or the file stem.
+
+This module has no Qt dependency; :func:`load_source` runs in worker
+processes (see ``curricula.py``).
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Any, Iterator, Optional
+
+CURRICULUM_FILE = "curriculum.json"
+SUBJECT_FILE = "subject.json"
+PACK_SUFFIX = ".zip"
+
+# Lines searched for a topic's "# " title when its body is not loaded
+_TITLE_LINES = 40
+
+
+def is_source(path: str) -> bool:
+    """True for a directory or a ``.zip`` content pack."""
+    return os.path.isdir(path) or (path.endswith(PACK_SUFFIX) and os.path.isfile(path))
+
+
+def find_sources(root: str) -> list[str]:
+    """Return the content sources directly inside *root*, sorted by name."""
+    try:
+        names = sorted(os.listdir(root))
+    except OSError:
+        return []
+    return [p for p in (os.path.join(root, n) for n in names) if is_source(p)]
+
+
+class _Tree:
+    """Read access to a directory or a zip file by relative POSIX path."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._prefix = ""
+        if not os.path.isdir(path):
+            self._zip = zipfile.ZipFile(path)
+            names = [n for n in self._zip.namelist() if not n.endswith("/")]
+            # Packs zipped with their top-level folder: look inside it
+            tops = {n.split("/", 1)[0] for n in names}
+            if len(tops) == 1 and all("/" in n for n in names):
+                self._prefix = tops.pop() + "/"
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+
+    def files(self) -> Iterator[str]:
+        """Yield relative paths of all files."""
+        if self._zip is not None:
+            for name in self._zip.namelist():
+                if name.startswith(self._prefix) and not name.endswith("/"):
+                    yield name[len(self._prefix):]
+            return
+        for dirpath, dirnames, filenames in os.walk(self.path):
+            dirnames.sort()
+            rel = PurePosixPath(*Path(dirpath).relative_to(self.path).parts)
+            for name in filenames:
+                yield str(rel / name)
+
+    def read_text(self, rel: str, max_lines: int = 0) -> str:
+        """Read file *rel*; with *max_lines*, only its first lines."""
+        if self._zip is not None:
+            f = self._zip.open(self._prefix + rel)
+            stream: Any = io.TextIOWrapper(f, encoding="utf-8")
+        else:
+            stream = open(os.path.join(self.path, rel), encoding="utf-8")
+        with stream:
+            if not max_lines:
+                return stream.read()
+            lines = []
+            for line in stream:
+                lines.append(line)
+                if len(lines) >= max_lines:
+                    break
+            return "".join(lines)
+
+    def read_json(self, rel: str) -> dict[str, Any]:
+        try:
+            data = json.loads(self.read_text(rel))
+        except (KeyError, OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+
+def _title(text: str, fallback: str) -> str:
+    for line in text.splitlines():
+        if line.startswith("# "):
+            return line[2:].strip()
+    return fallback
+
+
+def _source_id(meta: dict[str, Any], path: str) -> str:
+    return str(meta.get("id") or Path(path).stem)
+
+
+def read_source_id(path: str) -> str:
+    """The id :func:`load_source` gives the curriculum at *path*; only
+    ``curriculum.json`` is read."""
+    try:
+        tree = _Tree(path)
+    except (OSError, zipfile.BadZipFile):
+        return _source_id({}, path)
+    try:
+        return _source_id(tree.read_json(CURRICULUM_FILE), path)
+    finally:
+        tree.close()
+
+
+def load_source(path: str, with_content: bool = True) -> dict[str, Any]:
+    """Read the curriculum at *path* into plain subject dicts.
+
+    Returns ``{"id", "naam", "volgorde", "path", "subjects"}``.  Without
+    *with_content* every topic's ``content`` is ``""`` (only titles are
+    read), which is enough to list an inactive curriculum.
+    """
+    tree = _Tree(path)
+    try:
+        meta = tree.read_json(CURRICULUM_FILE)
+        source_id = _source_id(meta, path)
+        topics: dict[str, list[str]] = {}
+        for rel in tree.files():
+            parts = rel.split("/")
+            if len(parts) == 2 and parts[1].endswith(".md"):
+                topics.setdefault(parts[0], []).append(parts[1])
+
+        subjects = []
+        for position, subject_dir in enumerate(sorted(topics)):
+            info = tree.read_json(f"{subject_dir}/{SUBJECT_FILE}")
+            subject_id = f"{source_id}/{subject_dir}"
+            subject_topics = []
+            for name in sorted(topics[subject_dir]):
+                stem = name[:-3]
+                text = tree.read_text(f"{subject_dir}/{name}",
+                                      0 if with_content else _TITLE_LINES)
+                subject_topics.append({
+                    "id": f"{subject_id}/{stem}",
+                    "subjectId": subject_id,
+                    "titel": _title(text, stem),
+                    "content": text if with_content else "",
+                    "slug": stem,
+                })
+            subjects.append({
+                "id": subject_id,
+                "naam": str(info.get("naam") or subject_dir),
+                "icon": str(info.get("icon") or ""),
+                "volgorde": int(info.get("volgorde", position) or 0),
+                "topics": subject_topics,
+            })
+    finally:
+        tree.close()
+
+    return {
+        "id": source_id,
+        "naam": str(meta.get("naam") or source_id),
+        "volgorde": int(meta.get("volgorde", 0) or 0),
+        "path": path,
+        "subjects": subjects,
+    }
@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+content_validator.py - Headless validation of a markdown content tree.
+
+Usage::
+
+    python main.py validate <dir-or-file> [...] [--jobs N] [--quiet]
+
+Every ``*.md`` file is parsed with content_parser in a process pool.
+Diagnostics are streamed as ``path:line: severity: message`` while the pool
+works, followed by corpus statistics (questions per type and per subject).
+The exit code is 1 when any error was found and 0 otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from src.models.content_parser import parse_content, validate_content
+
+# Below this many files the process pool costs more than it saves.
+_SERIAL_THRESHOLD = 64
+
+
+def _validate_file(path: str) -> tuple[str, list[tuple[int, str, str]], dict[str, int]]:
+    """Validate one file; runs inside a worker process.
+
+    Returns ``(path, diagnostics, questions_per_type)``.  Unreadable files are
+    reported as a single line-0 error instead of raising, so one bad file
+    never takes down the pool.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError) as exc:
+        return path, [(0, "error", f"cannot read file: {exc}")], {}
+
+    diagnostics = validate_content(text)
+    per_type = Counter(q["type"] for q in parse_content(text)["questions"])
+    return path, diagnostics, dict(per_type)
+
+
+def _collect_files(roots: Iterable[str]) -> list[tuple[str, str]]:
+    """Return ``(path, subject)`` pairs for every markdown file under *roots*.
+
+    The subject is the first directory below the root, or the root's own
+    name for files placed directly in it.
+    """
+    files: list[tuple[str, str]] = []
+    for root in roots:
+        root_path = Path(root)
+        if root_path.is_file():
+            files.append((str(root_path), root_path.parent.name))
+            continue
+        for dirpath, dirnames, filenames in os.walk(root_path):
+            dirnames.sort()
+            rel = Path(dirpath).relative_to(root_path).parts
+            subject = rel[0] if rel else root_path.resolve().name
+            for name in sorted(filenames):
+                if name.endswith(".md"):
+                    files.append((os.path.join(dirpath, name), subject))
+    return files
+
+
+def _run(paths: list[str], jobs: int) -> Iterator[tuple[str, list[tuple[int, str, str]], dict[str, int]]]:
+    """Yield per-file results in input order, in parallel when worthwhile."""
+    if jobs <= 1 or len(paths) < _SERIAL_THRESHOLD:
+        for path in paths:
+            yield _validate_file(path)
+        return
+
+    # Large chunks keep IPC overhead negligible; several chunks per worker
+    # keep the cores balanced when file sizes vary.
+    chunksize = max(1, min(256, len(paths) // (jobs * 8)))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(_validate_file, paths, chunksize=chunksize)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Entry point for ``main.py validate``; returns the process exit code."""
+    parser = argparse.ArgumentParser(
+        prog="main.py validate",
+        description="Validate StudyToday markdown content.",
+    )
+    parser.add_argument("paths", nargs="+", help="content directories or files")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: all cores)")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="only report errors, not warnings")
+    args = parser.parse_args(argv)
+
+    files = _collect_files(args.paths)
+    subject_of = dict(files)
+    out = sys.stdout
+
+    errors = 0
+    warnings = 0
+    per_type: Counter[str] = Counter()
+    per_subject: Counter[str] = Counter()
+
+    for path, diagnostics, counts in _run([p for p, _s in files], args.jobs):
+        for line, severity, message in diagnostics:
+            if severity == "error":
+                errors += 1
+            else:
+                warnings += 1
+                if args.quiet:
+                    continue
+            out.write(f"{path}:{line}: {severity}: {message}\n")
+        if diagnostics:
+            out.flush()
+        per_type.update(counts)
+        per_subject[subject_of[path]] += sum(counts.values())
+
+    out.write(
+        f"\nChecked {len(files)} files, {sum(per_type.values())} questions: "
+        f"{errors} errors, {warnings} warnings\n"
+    )
+    if per_type:
+        out.write("\nQuestions per type:\n")
+        for name, count in per_type.most_common():
+            out.write(f"  {name:<20} {count:>8}\n")
+        out.write("\nQuestions per subject:\n")
+        for name, count in sorted(per_subject.items()):
+            out.write(f"  {name:<20} {count:>8}\n")
+    out.flush()
+
+    return 1 if errors else 0
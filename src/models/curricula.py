@@ -0,0 +1,268 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+curricula.py - Mounting several curricula and switching between them.
+
+:class:`CurriculumLibrary` mounts content sources (see
+``content_sources.py``) and publishes the subjects of the *active* ones to
+the store, merged by ``volgorde``.  Sources are read in worker processes,
+one per source, from a background thread; results are delivered to the GUI
+thread through a queued signal.
+
+Only active curricula keep their topic bodies: an inactive one is held as
+an outline (subjects and topic titles), so memory follows the active set
+rather than everything installed.  Activating a curriculum reads its
+bodies again; the previous subjects stay visible until they have arrived.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from src.models.content_sources import load_source, read_source_id
+from src.models.records import Subject, Topic
+
+if TYPE_CHECKING:
+    from src.models.app_store import AppStore
+
+
+class _Curriculum:
+    __slots__ = ("path", "order", "id", "naam", "volgorde", "subjects",
+                 "resident", "pending", "error")
+
+    def __init__(self, path: str, order: int) -> None:
+        self.path = path
+        self.order = order
+        self.id = ""
+        self.naam = os.path.basename(path)
+        self.volgorde = 0
+        self.subjects: list[Subject] = []
+        self.resident = False  # topic bodies loaded
+        self.pending = 0       # load jobs in flight
+        self.error = ""
+
+
+def _outline(subjects: list[Subject]) -> list[Subject]:
+    """Copies of *subjects* without topic bodies."""
+    return [
+        Subject(s.id, s.naam, s.icon, s.volgorde,
+                [Topic(t.id, t.subjectId, t.titel, "", t.slug) for t in s.topics])
+        for s in subjects
+    ]
+
+
+class CurriculumLibrary(QObject):
+    """Mounted curricula; the active ones make up the store's subjects."""
+
+    # Emitted from the loader thread: path, load_source() result or None,
+    # whether bodies were read, error message
+    _loaded = Signal(str, object, bool, str)
+
+    def __init__(self, store: "AppStore", parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._store = store
+        self._mounted: dict[str, _Curriculum] = {}
+        self._active: list[str] = []  # paths, in activation order
+        self._next_order = 0
+        self._loaded.connect(self._on_loaded)
+
+    # --- Loading ---
+
+    def _load(self, entries: list[_Curriculum], with_content: dict[str, bool]) -> None:
+        for entry in entries:
+            entry.pending += 1
+        jobs = [(e.path, with_content[e.path]) for e in entries]
+        threading.Thread(target=self._load_worker, args=(jobs,), daemon=True).start()
+
+    def _load_worker(self, jobs: list[tuple[str, bool]]) -> None:
+        remaining = dict.fromkeys(jobs)
+        if len(jobs) > 1:
+            try:
+                self._load_in_processes(jobs, remaining)
+            except (OSError, RuntimeError, BrokenProcessPool):
+                # No worker processes available (sandboxed, or started
+                # from an unguarded main module): read the rest here
+                pass
+        # One source: a worker process would only add startup cost
+        for path, content in list(remaining):
+            try:
+                self._loaded.emit(path, load_source(path, content), content, "")
+            except Exception as exc:
+                self._loaded.emit(path, None, content, str(exc) or type(exc).__name__)
+
+    def _load_in_processes(self, jobs: list[tuple[str, bool]],
+                           remaining: dict[tuple[str, bool], None]) -> None:
+        # Spawned, not forked: forking a process that runs Qt threads is unsafe
+        context = multiprocessing.get_context("spawn")
+        workers = min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = {pool.submit(load_source, *job): job for job in jobs}
+            for future in as_completed(futures):
+                path, content = job = futures[future]
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as exc:
+                    self._loaded.emit(path, None, content, str(exc) or type(exc).__name__)
+                else:
+                    self._loaded.emit(path, result, content, "")
+                del remaining[job]
+
+    @Slot(str, object, bool, str)
+    def _on_loaded(self, path: str, result: Any, with_content: bool, error: str) -> None:
+        entry = self._mounted.get(path)
+        if entry is None:
+            return  # unmounted meanwhile
+        entry.pending -= 1
+        entry.error = error
+        if result is not None:
+            entry.naam = result["naam"]
+            entry.volgorde = result["volgorde"]
+            subjects = [Subject.from_mapping(self._namespaced(s, result["id"], entry.id))
+                        for s in result["subjects"]]
+            if with_content and path in self._active:
+                entry.subjects = subjects
+                entry.resident = True
+            elif not entry.resident:
+                entry.subjects = _outline(subjects) if with_content else subjects
+        self._publish()
+
+    def _unique_id(self, wanted: str, entry: _Curriculum) -> str:
+        # Called at mount time, in mount order, so which of two curricula
+        # with the same id gets renamed does not depend on load timing
+        taken = {e.id for e in self._mounted.values() if e is not entry}
+        candidate, n = wanted, 2
+        while candidate in taken:
+            candidate = f"{wanted}-{n}"
+            n += 1
+        return candidate
+
+    @staticmethod
+    def _namespaced(subject: dict[str, Any], old: str, new: str) -> dict[str, Any]:
+        """Rewrite ids of a renamed (duplicate) curriculum."""
+        if old == new:
+            return subject
+        prefix = len(old)
+        subject = dict(subject, id=new + subject["id"][prefix:])
+        subject["topics"] = [
+            dict(t, id=new + t["id"][prefix:], subjectId=subject["id"])
+            for t in subject["topics"]
+        ]
+        return subject
+
+    # --- Publishing ---
+
+    def _publish(self) -> None:
+        """Hand the active subjects to the store once all have arrived."""
+        store = self._store
+        active = [self._mounted[p] for p in self._active]
+        if any(e.pending and not e.resident for e in active):
+            store.setSyncStatus("syncing")
+            store.notifyCurriculaChanged()
+            return
+
+        ready = [e for e in active if e.resident]
+        subjects = [
+            subject
+            for _key, subject in sorted(
+                ((s.volgorde, e.volgorde, e.order, i), s)
+                for e in ready for i, s in enumerate(e.subjects)
+            )
+        ]
+        # Release the bodies of everything that is no longer active
+        for entry in self._mounted.values():
+            if entry.resident and entry.path not in self._active:
+                entry.subjects = _outline(entry.subjects)
+                entry.resident = False
+
+        with store.batch():
+            store.setSubjects(subjects)
+            store.setSyncStatus("error" if any(e.error for e in active) else "done")
+            store.notifyCurriculaChanged()
+
+    # --- Mounting and switching ---
+
+    def mount(self, paths: Iterable[str], active: Optional[Iterable[str]] = None) -> None:
+        """Mount the sources at *paths* and load them in parallel.
+
+        *active* lists the paths to activate; by default the first newly
+        mounted source is activated when nothing is active yet.  Ids are
+        assigned here, in mount order: a source whose id is taken gets a
+        ``-2``, ``-3``, ... suffix.
+        """
+        new = []
+        for path in paths:
+            path = os.path.abspath(path)
+            if path not in self._mounted:
+                entry = self._mounted[path] = _Curriculum(path, self._next_order)
+                entry.id = self._unique_id(read_source_id(path), entry)
+                self._next_order += 1
+                new.append(entry)
+        if active is not None:
+            self._active = [os.path.abspath(p) for p in active
+                            if os.path.abspath(p) in self._mounted]
+        elif not self._active and new:
+            self._active = [new[0].path]
+        if new:
+            self._load(new, {e.path: e.path in self._active for e in new})
+        self._activate_missing(exclude=new)
+
+    def unmount(self, curriculum_id: str) -> None:
+        entry = self._by_id(curriculum_id)
+        if entry is None:
+            return
+        del self._mounted[entry.path]
+        if entry.path in self._active:
+            self._active.remove(entry.path)
+            if not self._active and self._mounted:
+                self._active = [self.entries[0].path]
+        self._activate_missing()
+
+    def set_active(self, curriculum_ids: Iterable[str]) -> None:
+        """Make exactly *curriculum_ids* active (unknown ids are ignored)."""
+        entries = [self._by_id(i) for i in curriculum_ids]
+        self._active = [e.path for e in entries if e is not None]
+        self._activate_missing()
+
+    def _activate_missing(self, exclude: Iterable[_Curriculum] = ()) -> None:
+        skip = {id(e) for e in exclude}
+        missing = [self._mounted[p] for p in self._active
+                   if not self._mounted[p].resident and id(self._mounted[p]) not in skip]
+        if missing:
+            self._load(missing, {e.path: True for e in missing})
+        self._publish()
+
+    def _by_id(self, curriculum_id: str) -> Optional[_Curriculum]:
+        return next((e for e in self._mounted.values() if e.id == curriculum_id), None)
+
+    # --- Introspection ---
+
+    @property
+    def entries(self) -> list[_Curriculum]:
+        return sorted(self._mounted.values(), key=lambda e: e.order)
+
+    def variant(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": e.id,
+                "naam": e.naam,
+                "path": e.path,
+                "active": e.path in self._active,
+                "resident": e.resident,
+                "loading": e.pending > 0,
+                "error": e.error,
+                "subjectCount": len(e.subjects),
+                "topicCount": sum(len(s.topics) for s in e.subjects),
+            }
+            for e in self.entries
+        ]
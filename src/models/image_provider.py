@@ -0,0 +1,457 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+image_provider.py - Asynchronous topic images with a disk thumbnail cache.
+
+Images referenced from topic markdown are split out of the text (see
+:func:`split_images`), pointed at ``image://topic/<url-encoded source>``
+and served by :class:`TopicImageProvider`, a ``QQuickAsyncImageProvider``:
+
+- Sources are fetched lazily on a small worker pool: relative paths and
+  ``file:`` URLs from the content directory, ``http(s)`` URLs through the
+  shared :class:`~src.models.network.HttpClient`.  Sources larger than
+  :data:`MAX_SOURCE_BYTES` fail instead of being read into memory.
+- Images are decoded straight to thumbnail size with ``QImageReader``, off
+  the GUI thread, so a full-resolution bitmap is never held in memory.
+- Thumbnails are stored in :class:`ThumbnailCache`, a size-bounded disk
+  cache keyed by the SHA-1 of the source bytes plus the thumbnail bounds.
+  A small index maps sources to content hashes, so a cached image is
+  served without reading (or downloading) its source again.  Local sources
+  are keyed by path, mtime and size.  Remote ones are trusted for
+  :data:`REMOTE_TTL_S`, then revalidated with their ETag or Last-Modified
+  header; a changed image is downloaded again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import NamedTuple, Optional
+from urllib.parse import quote, unquote, urlsplit
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QRunnable, QSize, Qt, QThreadPool
+from PySide6.QtGui import QImage, QImageReader
+from PySide6.QtQuick import (
+    QQuickAsyncImageProvider,
+    QQuickImageResponse,
+    QQuickTextureFactory,
+)
+
+from src.models.network import HttpClient, NetworkError
+
+PROVIDER_ID = "topic"
+
+# Bounds used when QML does not request a size (e.g. images in markdown)
+DEFAULT_MAX_SIZE = QSize(1024, 1024)
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+# Largest image source that is read (and held in memory) for decoding
+MAX_SOURCE_BYTES = 16 * 1024 * 1024
+
+# Seconds a remote image is served from the cache before revalidating it
+REMOTE_TTL_S = 24 * 60 * 60
+
+# Index changes written together; the rest are written by flush()
+_INDEX_SAVE_EVERY = 64
+
+_KEEP_ASPECT = Qt.AspectRatioMode.KeepAspectRatio
+
+_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\(\s*([^)\s]+)([^)]*)\)")
+
+
+def image_source(source: str) -> str:
+    """Return the provider URL for a markdown image *source*."""
+    if source.startswith("image:") or source.startswith("data:"):
+        return source
+    return f"image://{PROVIDER_ID}/{quote(source, safe='')}"
+
+
+def split_images(markdown: str) -> list[dict[str, str]]:
+    """Split *markdown* into text and image blocks.
+
+    ``Text.MarkdownText`` loads embedded images synchronously on the GUI
+    thread, so images are pulled out into ``{"kind": "image", "source",
+    "alt"}`` blocks for an asynchronous ``Image``; the markdown between
+    them becomes ``{"kind": "text", "markdown"}`` blocks.
+    """
+    blocks: list[dict[str, str]] = []
+    pos = 0
+    for match in _IMAGE_RE.finditer(markdown):
+        text = markdown[pos:match.start()].strip()
+        if text:
+            blocks.append({"kind": "text", "markdown": text})
+        blocks.append({"kind": "image", "source": image_source(match.group(2)),
+                       "alt": match.group(1)})
+        pos = match.end()
+    text = markdown[pos:].strip()
+    if text:
+        blocks.append({"kind": "text", "markdown": text})
+    return blocks
+
+
+def _fit(size: QSize, bounds: QSize) -> QSize:
+    """Scale *size* down (never up) to fit inside *bounds*."""
+    if not size.isValid() or (size.width() <= bounds.width()
+                              and size.height() <= bounds.height()):
+        return size
+    return size.scaled(bounds, _KEEP_ASPECT)
+
+
+class SourceEntry(NamedTuple):
+    """Index entry of a source: content hash, the request headers that
+    revalidate it (remote sources only) and when it was last validated."""
+
+    digest: str
+    validators: dict[str, str]
+    checked: float
+
+
+class ThumbnailCache:
+    """Size-bounded directory of PNG thumbnails, evicting least recently
+    used files first.  Safe to use from several worker threads.
+
+    Index changes are written in batches; call :meth:`flush` before exit.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index_path = os.path.join(directory, "index.json")
+        os.makedirs(directory, exist_ok=True)
+        self._sources: dict[str, SourceEntry] = self._load_index()
+        self._unsaved = 0
+        self._total = sum(size for _path, size, _mtime in self._entries())
+        if self._total > self.max_bytes:
+            with self._lock:
+                self._evict()
+
+    # --- Source index ---
+
+    def _load_index(self) -> dict[str, SourceEntry]:
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                data = json.load(f)
+            return {key: SourceEntry(str(digest), dict(validators), float(checked))
+                    for key, (digest, validators, checked) in data.items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+    def entry(self, source_key: str) -> Optional[SourceEntry]:
+        with self._lock:
+            return self._sources.get(source_key)
+
+    def content_hash(self, source_key: str) -> Optional[str]:
+        entry = self.entry(source_key)
+        return entry.digest if entry is not None else None
+
+    def remember(self, source_key: str, digest: str,
+                 validators: Optional[dict[str, str]] = None,
+                 checked: float = 0.0) -> None:
+        entry = SourceEntry(digest, validators or {}, checked)
+        with self._lock:
+            if self._sources.get(source_key) == entry:
+                return
+            self._sources[source_key] = entry
+            self._unsaved += 1
+            if self._unsaved >= _INDEX_SAVE_EVERY:
+                self._save_index()
+
+    def flush(self) -> None:
+        """Write index changes that are not saved yet."""
+        with self._lock:
+            if self._unsaved:
+                self._save_index()
+
+    def _save_index(self) -> None:
+        # Called with the lock held
+        tmp_path = self._index_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({key: list(entry) for key, entry in self._sources.items()}, f)
+            os.replace(tmp_path, self._index_path)
+            self._unsaved = 0
+        except OSError:
+            pass
+
+    # --- Thumbnails ---
+
+    def _path(self, digest: str, bounds: QSize) -> str:
+        return os.path.join(self.directory, f"{digest}-{bounds.width()}x{bounds.height()}.png")
+
+    def _entries(self) -> list[tuple[str, int, float]]:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".png"):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.path, st.st_size, st.st_mtime))
+        return entries
+
+    def get(self, digest: str, bounds: QSize) -> Optional[QImage]:
+        path = self._path(digest, bounds)
+        image = QImage(path)
+        if image.isNull():
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return image
+
+    def put(self, digest: str, bounds: QSize, image: QImage) -> None:
+        path = self._path(digest, bounds)
+        tmp_path = path + ".tmp"
+        if not image.save(tmp_path, "PNG"):
+            return
+        with self._lock:
+            try:
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+            try:
+                os.replace(tmp_path, path)
+                size = os.path.getsize(path)
+            except OSError:
+                return
+            self._total += size - replaced
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete the oldest thumbnails until the cache is 80% full, and
+        drop index entries whose thumbnails are all gone."""
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _path, size, _mtime in entries)
+        target = self.max_bytes * 0.8
+        kept: set[str] = set()
+        for path, size, _mtime in entries:
+            if total > target:
+                try:
+                    os.remove(path)
+                    total -= size
+                    continue
+                except OSError:
+                    pass
+            kept.add(os.path.basename(path).split("-", 1)[0])
+        self._total = total
+        sources = {key: entry for key, entry in self._sources.items()
+                   if entry.digest in kept}
+        if len(sources) != len(self._sources):
+            self._sources = sources
+            self._save_index()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+
+class _ImageResponse(QQuickImageResponse):
+    """Response for one request; loaded by a :class:`_LoadJob`."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.image = QImage()
+        self.error = ""
+        self.cancelled = False
+
+    def textureFactory(self) -> QQuickTextureFactory:
+        return QQuickTextureFactory.textureFactoryForImage(self.image)
+
+    def errorString(self) -> str:
+        return self.error
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class _LoadJob(QRunnable):
+    def __init__(self, provider: "TopicImageProvider", response: _ImageResponse,
+                 source: str, bounds: QSize) -> None:
+        super().__init__()
+        self._provider = provider
+        self._response = response
+        self._source = source
+        self._bounds = bounds
+
+    def run(self) -> None:
+        response = self._response
+        try:
+            if not response.cancelled:
+                response.image = self._provider.load(self._source, self._bounds)
+        except Exception as exc:
+            response.error = f"{self._source}: {exc}"
+        if response.image.isNull() and not response.error:
+            response.error = f"{self._source}: could not load image"
+        response.finished.emit()
+
+
+class TopicImageProvider(QQuickAsyncImageProvider):
+    """Serves ``image://topic/<source>`` from the thumbnail cache.
+
+    *content_dir* is the base for relative and ``file:`` sources; *http*
+    fetches remote ones (remote images are skipped without it).  Sources
+    over *max_source_bytes* fail to load.
+    """
+
+    def __init__(self, cache: ThumbnailCache, content_dir: str,
+                 http: Optional[HttpClient] = None, max_workers: int = 2,
+                 max_source_bytes: int = MAX_SOURCE_BYTES) -> None:
+        super().__init__()
+        self.cache = cache
+        self._content_dir = os.path.abspath(content_dir)
+        self._http = http
+        self._max_source_bytes = max_source_bytes
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max_workers)
+
+    def requestImageResponse(self, image_id: str, requested_size: QSize) -> QQuickImageResponse:
+        bounds = QSize(DEFAULT_MAX_SIZE)
+        if requested_size.width() > 0:
+            bounds.setWidth(requested_size.width())
+        if requested_size.height() > 0:
+            bounds.setHeight(requested_size.height())
+        response = _ImageResponse()
+        self._pool.start(_LoadJob(self, response, unquote(image_id), bounds))
+        return response
+
+    def shutdown(self, wait_ms: int = 3000) -> None:
+        self._pool.clear()
+        self._pool.waitForDone(wait_ms)
+        self.cache.flush()
+
+    # --- Loading (worker threads) ---
+
+    def _local_path(self, source: str) -> Optional[str]:
+        parts = urlsplit(source)
+        if parts.scheme in ("http", "https"):
+            return None
+        path = unquote(parts.path) if parts.scheme == "file" else source
+        path = os.path.abspath(os.path.join(self._content_dir, path))
+        # Relative sources and file: URLs must stay inside the content
+        # directory
+        if os.path.commonpath([path, self._content_dir]) != self._content_dir:
+            raise ValueError("path outside the content directory")
+        return path
+
+    def load(self, source: str, bounds: QSize) -> QImage:
+        path = self._local_path(source)
+        if path is None:
+            return self._load_remote(source, bounds)
+
+        st = os.stat(path)
+        source_key = f"{path}|{st.st_mtime_ns}|{st.st_size}"
+        digest = self.cache.content_hash(source_key)
+        if digest is not None:
+            image = self.cache.get(digest, bounds)
+            if image is not None:
+                return image
+
+        self._check_size(st.st_size)
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = hashlib.sha1(data).hexdigest()
+        self.cache.remember(source_key, digest)
+        return self._thumbnail(digest, data, bounds)
+
+    def _load_remote(self, source: str, bounds: QSize) -> QImage:
+        if self._http is None:
+            return QImage()
+        now = time.time()
+        entry = self.cache.entry(source)
+        cached = self.cache.get(entry.digest, bounds) if entry is not None else None
+        if cached is not None and now - entry.checked < REMOTE_TTL_S:
+            return cached
+
+        # Revalidate only when there is a cached thumbnail to fall back on
+        validators = entry.validators if cached is not None else {}
+        try:
+            data, validators = self._download(source, validators)
+        except NetworkError:
+            if cached is not None:
+                return cached  # stale, but better than nothing offline
+            raise
+        if data is None:
+            # 304 Not Modified
+            self.cache.remember(source, entry.digest, validators, now)
+            return cached
+
+        digest = hashlib.sha1(data).hexdigest()
+        self.cache.remember(source, digest, validators, now)
+        return self._thumbnail(digest, data, bounds)
+
+    def _thumbnail(self, digest: str, data: bytes, bounds: QSize) -> QImage:
+        """Return the cached thumbnail of *data*, decoding it if needed."""
+        image = self.cache.get(digest, bounds)
+        if image is not None:
+            return image
+
+        image = self._decode(data, bounds)
+        if not image.isNull():
+            self.cache.put(digest, bounds, image)
+        return image
+
+    def _check_size(self, size: int) -> None:
+        if size > self._max_source_bytes:
+            raise ValueError(
+                f"image larger than {self._max_source_bytes // (1024 * 1024)} MB")
+
+    def _download(self, source: str, validators: dict[str, str]
+                  ) -> tuple[Optional[bytes], dict[str, str]]:
+        """Fetch *source* conditionally on *validators*, failing as soon as
+        it exceeds the size cap.
+
+        Returns the body (None when not modified) and the validators to
+        send next time.
+        """
+        chunks = []
+        received = 0
+        with self._http.get(source, headers=validators) as response:
+            if response.status == 304:
+                response.read()
+                return None, validators
+            etag = response.headers.get("ETag")
+            modified = response.headers.get("Last-Modified")
+            # Content-Length may be missing or wrong, so count as well
+            self._check_size(response.length)
+            for chunk in response.iter_chunks():
+                received += len(chunk)
+                self._check_size(received)
+                chunks.append(chunk)
+        if etag:
+            validators = {"If-None-Match": etag}
+        elif modified:
+            validators = {"If-Modified-Since": modified}
+        else:
+            validators = {}
+        return b"".join(chunks), validators
+
+    @staticmethod
+    def _decode(data: bytes, bounds: QSize) -> QImage:
+        """Decode *data* directly at thumbnail size."""
+        buffer = QBuffer()
+        buffer.setData(QByteArray(data))
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        reader = QImageReader(buffer)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(_fit(size, bounds))
+        image = reader.read()
+        if image.isNull():
+            return image
+        if not size.isValid():
+            fitted = _fit(image.size(), bounds)
+            if fitted != image.size():
+                image = image.scaled(fitted, _KEEP_ASPECT,
+                                     Qt.TransformationMode.SmoothTransformation)
+        return image
@@ -0,0 +1,438 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+incremental_parser.py - Incremental re-parsing with stable question ids.
+
+:func:`content_parser.parse_content` numbers questions 0, 1, 2, ... in
+document order, so a question inserted near the top renumbers every
+question after it, and progress (stored per question id, see
+``progress.py``) moves to the wrong questions.
+
+A :class:`ParseState` remembers one version of a topic: where its question
+blocks are, an *anchor* (hash of the block type and its normalised body)
+for each block and the id each block was given.  :func:`parse_incremental`
+parses a new version against it:
+
+- the common prefix and suffix of the two texts are found with chunked
+  string comparisons; blocks inside them are kept (those in the suffix
+  shifted), and only the changed region is scanned, up to the first block
+  the scanner finds at the same place in the unchanged suffix;
+- a block in that region keeps the id of an old block with the same
+  anchor, else the id of the old block it replaced, so an edited question
+  keeps its id; other blocks get fresh ids, and ids of deleted questions
+  are never reused;
+- question fields are parsed lazily, and only for blocks without a parsed
+  record from the previous version.
+
+The first parse of a topic numbers its questions like ``parse_content``,
+so progress recorded before ids were stable stays valid.
+:class:`IncrementalParser` keeps one state per topic and saves the ids
+(anchors only, no text) of topics with progress, so they survive restarts
+and content updates between sessions.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from bisect import bisect_left
+from collections import deque
+from difflib import SequenceMatcher
+from typing import Any, Collection, NamedTuple, Optional
+
+from src.models.content_parser import _PARSERS, Block, _scan_blocks, count_questions
+from src.models.records import Question
+
+# Characters compared per step when looking for the changed region
+_CHUNK = 4096
+
+# Estimated bytes per block of a state: its Span with four ints (~190),
+# the anchor string (~65), the id (~28) and three list slots (24)
+_BLOCK_BYTES = 310
+
+
+class Span(NamedTuple):
+    """Position of one question block; its body is
+    ``text[body_start:body_end]``."""
+
+    start: int
+    end: int
+    type: str
+    body_start: int
+    body_end: int
+
+    def shifted(self, delta: int) -> "Span":
+        return Span(self.start + delta, self.end + delta, self.type,
+                    self.body_start + delta, self.body_end + delta)
+
+
+def block_anchor(block_type: str, body: str) -> str:
+    """Hash of a block, insensitive to the whitespace the parsers ignore."""
+    lines = "\n".join(line.strip() for line in body.strip().splitlines())
+    digest = hashlib.blake2b(f"{block_type}\n{lines}".encode("utf-8"),
+                             digest_size=8)
+    return digest.hexdigest()
+
+
+def _span(block: Block) -> Span:
+    return Span(block.start, block.end, block.type, block.body_start,
+                block.body_start + len(block.body))
+
+
+class ParseState:
+    """One parsed version of a topic.
+
+    A state restored from a saved table has ``text`` None and no spans;
+    it only serves as the previous version for the next parse.
+    """
+
+    __slots__ = ("text", "spans", "ids", "next_id", "scanned", "_anchors",
+                 "_questions")
+
+    def __init__(self, text: Optional[str], spans: list[Span],
+                 anchors: list[Optional[str]], ids: list[int], next_id: int,
+                 questions: Optional[list[Optional[Question]]] = None,
+                 scanned: int = 0) -> None:
+        self.text = text
+        self.spans = spans
+        # Hashed on demand: a first parse only needs them once re-parsed
+        self._anchors = anchors
+        self.ids = ids
+        self.next_id = next_id
+        # Blocks scanned and hashed to produce this state
+        self.scanned = scanned
+        self._questions = questions if questions is not None else [None] * len(ids)
+
+    def anchor(self, index: int) -> str:
+        anchor = self._anchors[index]
+        if anchor is None:
+            span = self.spans[index]
+            anchor = self._anchors[index] = block_anchor(
+                span.type, self.text[span.body_start:span.body_end])
+        return anchor
+
+    @property
+    def anchors(self) -> list[str]:
+        return [self.anchor(i) for i in range(len(self.ids))]
+
+    @property
+    def fresh(self) -> bool:
+        """True if a first parse of the same text gives the same ids."""
+        return self.next_id == len(self.ids) and all(
+            i == question_id for i, question_id in enumerate(self.ids))
+
+    def question(self, index: int) -> Question:
+        question = self._questions[index]
+        if question is None:
+            span = self.spans[index]
+            question = self._questions[index] = _PARSERS[span.type](
+                self.text[span.body_start:span.body_end], self.ids[index])
+        return question
+
+    @property
+    def questions(self) -> list[Question]:
+        return [self.question(i) for i in range(len(self.ids))]
+
+    @property
+    def mask(self) -> int:
+        """Bitset of the question ids in this version."""
+        mask = 0
+        for question_id in self.ids:
+            mask |= 1 << question_id
+        return mask
+
+    def result(self) -> dict[str, Any]:
+        """The :func:`parse_content` result for this version, with
+        ``<!-- question-N -->`` placeholders naming the stable ids."""
+        text = self.text
+        pieces: list[str] = []
+        pos = 0
+        for span, question_id in zip(self.spans, self.ids):
+            pieces.append(text[pos:span.start])
+            pieces.append(f"<!-- question-{question_id} -->")
+            pos = span.end
+        pieces.append(text[pos:])
+        return {"markdown": "".join(pieces).strip(), "questions": self.questions}
+
+    # --- Persistence ---
+
+    def table(self) -> dict[str, Any]:
+        return {"anchors": self.anchors, "ids": self.ids, "next": self.next_id}
+
+    @classmethod
+    def from_table(cls, table: dict[str, Any]) -> "ParseState":
+        anchors = [str(a) for a in table["anchors"]]
+        ids = [int(i) for i in table["ids"]]
+        if len(anchors) != len(ids) or len(set(ids)) != len(ids):
+            raise ValueError("inconsistent id table")
+        next_id = max(int(table["next"]), max(ids, default=-1) + 1)
+        return cls(None, [], anchors, ids, next_id)
+
+    def compact(self) -> "ParseState":
+        """This state without text and parsed questions."""
+        return ParseState(None, [], self.anchors, self.ids, self.next_id)
+
+
+# ---------------------------------------------------------------------- #
+#  Parsing
+# ---------------------------------------------------------------------- #
+
+def _common_prefix(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n:
+        j = min(i + _CHUNK, n)
+        if a[i:j] != b[i:j]:
+            while a[i] == b[i]:
+                i += 1
+            return i
+        i = j
+    return n
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix of *a* and *b*, at most *limit*."""
+    la, lb = len(a), len(b)
+    k = 0
+    while k < limit:
+        m = min(k + _CHUNK, limit)
+        if a[la - m:la - k] != b[lb - m:lb - k]:
+            while a[la - k - 1] == b[lb - k - 1]:
+                k += 1
+            return k
+        k = m
+    return limit
+
+
+def _assign(old: ParseState, lo: int, hi: int, anchors: list[str],
+            next_id: int) -> tuple[list[int], list[Optional[Question]], int]:
+    """Ids (and reusable parsed questions) for new blocks *anchors* that
+    replace old blocks ``lo:hi``; returns them with the next free id."""
+    old_anchors = [old.anchor(i) for i in range(lo, hi)]
+    ids: list[Optional[int]] = [None] * len(anchors)
+    questions: list[Optional[Question]] = [None] * len(anchors)
+    spare: dict[str, deque[int]] = {}
+    replaced: list[tuple[range, range]] = []
+
+    def take(j: int, i: int, reuse: bool) -> None:
+        ids[j] = old.ids[lo + i]
+        if reuse:
+            questions[j] = old._questions[lo + i]
+
+    matcher = SequenceMatcher(None, old_anchors, anchors, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            for k in range(i2 - i1):
+                take(j1 + k, i1 + k, True)
+            continue
+        for i in range(i1, i2):
+            spare.setdefault(old_anchors[i], deque()).append(i)
+        if tag == "replace":
+            replaced.append((range(i1, i2), range(j1, j2)))
+
+    used: set[int] = set()
+    # Moved blocks keep their id
+    for j, anchor in enumerate(anchors):
+        if ids[j] is None and spare.get(anchor):
+            i = spare[anchor].popleft()
+            used.add(i)
+            take(j, i, True)
+    # Edited blocks keep the id of the block they replaced
+    for olds, news in replaced:
+        free = deque(i for i in olds if i not in used)
+        for j in news:
+            if ids[j] is None and free:
+                i = free.popleft()
+                used.add(i)
+                take(j, i, False)
+    for j in range(len(anchors)):
+        if ids[j] is None:
+            ids[j] = next_id
+            next_id += 1
+    return ids, questions, next_id  # type: ignore[return-value]
+
+
+def parse_incremental(text: str, previous: Optional[ParseState] = None) -> ParseState:
+    """Parse *text*, reusing *previous* (the state of an earlier version).
+
+    Without *previous* the ids are ``0..n-1``, as from ``parse_content``.
+    With a *previous* restored from a table (no text) every block is
+    scanned, but ids are still carried over by anchor and position.
+    """
+    if previous is None:
+        spans = [_span(b) for b in _scan_blocks(text)]
+        return ParseState(text, spans, [None] * len(spans), list(range(len(spans))),
+                          len(spans), scanned=len(spans))
+    if previous.text is None:
+        blocks = list(_scan_blocks(text))
+        spans = [_span(b) for b in blocks]
+        anchors: list[Optional[str]] = [block_anchor(b.type, b.body) for b in blocks]
+        ids, questions, next_id = _assign(previous, 0, len(previous.ids),
+                                          anchors, previous.next_id)
+        return ParseState(text, spans, anchors, ids, next_id, questions,
+                          scanned=len(spans))
+
+    old = previous.text
+    if text is old or text == old:
+        return previous
+    old_spans = previous.spans
+    prefix = _common_prefix(old, text)
+    suffix = _common_suffix(old, text, min(len(old), len(text)) - prefix)
+
+    # A block is settled by the prefix if a non-blank character follows it
+    # there: the closer's trailing "\s*$" cannot reach past that character
+    settled = prefix
+    while settled and old[settled - 1].isspace():
+        settled -= 1
+    first = bisect_left(old_spans, settled, key=lambda s: s.end)
+    resume = old_spans[first - 1].end if first else 0
+
+    # Scan the changed region until a block starts where an old one did,
+    # inside the suffix (including the newline before it); the rest of the
+    # document scans exactly as before, shifted by delta
+    delta = len(text) - len(old)
+    suffix_start = len(old) - suffix
+    last = len(old_spans)
+    spans = []
+    anchors = []
+    for block in _scan_blocks(text, resume):
+        old_start = block.start - delta
+        if old_start > suffix_start:
+            j = bisect_left(old_spans, old_start, lo=first, key=lambda s: s.start)
+            if j < len(old_spans) and old_spans[j].start == old_start:
+                last = j
+                break
+        spans.append(_span(block))
+        anchors.append(block_anchor(block.type, block.body))
+
+    ids, questions, next_id = _assign(previous, first, last, anchors,
+                                      previous.next_id)
+    tail = old_spans[last:]
+    return ParseState(
+        text,
+        old_spans[:first] + spans + ([s.shifted(delta) for s in tail] if delta else tail),
+        previous._anchors[:first] + anchors + previous._anchors[last:],
+        previous.ids[:first] + ids + previous.ids[last:],
+        next_id,
+        previous._questions[:first] + questions + previous._questions[last:],
+        scanned=len(spans),
+    )
+
+
+# ---------------------------------------------------------------------- #
+#  Per-topic states
+# ---------------------------------------------------------------------- #
+
+class IncrementalParser:
+    """Parse states by topic id; each topic is parsed against its previous
+    version."""
+
+    def __init__(self) -> None:
+        self._states: dict[str, ParseState] = {}
+        self._sizes: dict[str, int] = {}
+        # Estimated bytes of all states, kept up to date as they change so
+        # it can be checked against a memory budget after every parse.
+        # Topic texts (owned by the subjects) and parsed questions (charged
+        # to the caches that hold them) are not included.
+        self.nbytes = 0
+        self.parses = 0
+        self.blocks_scanned = 0
+
+    def _set(self, topic_id: str, state: ParseState) -> None:
+        self._states[topic_id] = state
+        size = sys.getsizeof(state) + len(state.ids) * _BLOCK_BYTES
+        self.nbytes += size - self._sizes.get(topic_id, 0)
+        self._sizes[topic_id] = size
+
+    def _drop(self, topic_id: str) -> None:
+        del self._states[topic_id]
+        self.nbytes -= self._sizes.pop(topic_id)
+
+    def state(self, topic_id: str, content: str) -> ParseState:
+        """The state of *topic_id* for *content*, parsed if it changed."""
+        previous = self._states.get(topic_id)
+        if previous is not None and previous.text is content:
+            return previous
+        state = parse_incremental(content, previous)
+        if state is not previous:
+            self._set(topic_id, state)
+            self.parses += 1
+            self.blocks_scanned += state.scanned
+        return state
+
+    def question_mask(self, topic_id: str, content: str) -> int:
+        """Bitset of the question ids of *topic_id* for *content*."""
+        if topic_id not in self._states:
+            # Never parsed and no saved ids: a first parse numbers 0..n-1
+            return (1 << count_questions(content)) - 1
+        return self.state(topic_id, content).mask
+
+    def retain(self, topic_ids: Collection[str],
+               referenced: Collection[str] = ()) -> None:
+        """Release the states of topics not in *topic_ids*, so unloaded
+        content is not kept alive.
+
+        A state is dropped when a first parse gives the same ids and no
+        topic in *referenced* (e.g. topics with progress) needs them;
+        otherwise it is compacted to its ids.
+        """
+        referenced = set(referenced)
+        for topic_id, state in list(self._states.items()):
+            if state.text is None or topic_id in topic_ids:
+                continue
+            if state.fresh and topic_id not in referenced:
+                self._drop(topic_id)
+            else:
+                self._set(topic_id, state.compact())
+
+    def compact(self, referenced: Collection[str] = ()) -> None:
+        """Release all texts and parsed questions (see :meth:`retain`)."""
+        self.retain((), referenced)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "topics": len(self._states),
+            "parses": self.parses,
+            "blocksScanned": self.blocks_scanned,
+        }
+
+    # --- Persistence ---
+
+    def load(self, path: str) -> None:
+        """Restore id tables saved by :meth:`save` (topics already parsed
+        in this session keep their state)."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            tables = data["topics"].items()
+        except (OSError, ValueError, KeyError, AttributeError):
+            return
+        for topic_id, table in tables:
+            if topic_id in self._states:
+                continue
+            try:
+                self._set(topic_id, ParseState.from_table(table))
+            except (ValueError, KeyError, TypeError):
+                continue
+
+    def save(self, path: str, topic_ids: Collection[str]) -> None:
+        """Write the id tables of *topic_ids* (the topics whose ids are
+        referenced elsewhere, e.g. by recorded progress)."""
+        data = {
+            "topics": {
+                topic_id: self._states[topic_id].table()
+                for topic_id in topic_ids if topic_id in self._states
+            },
+        }
+        tmp_path = path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
@@ -0,0 +1,232 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+memory.py - Per-subsystem memory accounting, budgets and tracemalloc diffs.
+
+Subsystems (the store's lists, parse caches, QML-converted variants, ...)
+register a function returning their estimated size in bytes and, when they
+can release memory, an eviction function.  :meth:`MemoryAccountant.report`
+lists the estimates; :meth:`MemoryAccountant.enforce` evicts every
+subsystem that exceeds its budget.
+
+Sizes are estimated with :func:`estimate_size`, a deep ``sys.getsizeof``.
+Reports and budget checks measure the same way: one ``seen`` set is passed
+to every size function in registration order, so an object shared between
+subsystems (e.g. a topic's content string) is counted once, for the first
+subsystem registered.  Subsystems on hot paths register a *counter*
+instead, a cached byte count they keep up to date themselves; counters
+ignore the set, so a budget check that only involves counters never walks
+any objects.
+
+:class:`MemoryAccountant` can also take named :mod:`tracemalloc` snapshots
+and report the allocation growth between two of them, grouped by source
+line.  Tracing slows Python allocations down noticeably, so it is only
+started on request.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import tracemalloc
+from types import FunctionType, MethodType, ModuleType
+from typing import Any, Callable, Iterator, Optional
+
+# Objects that are shared program state rather than data
+_SKIP_TYPES = (type, ModuleType, FunctionType, MethodType)
+
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmg]?)i?b?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30}
+
+
+def parse_size(text: str) -> int:
+    """Parse a byte count such as ``"512"``, ``"64K"``, ``"32MiB"`` or
+    ``"1.5G"`` (binary units)."""
+    match = _SIZE_RE.match(text)
+    if match is None:
+        raise ValueError(f"invalid size: {text!r}")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).lower()])
+
+
+def _slot_names(cls: type) -> list[str]:
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return names
+
+
+def estimate_size(*objects: Any, seen: Optional[set[int]] = None) -> int:
+    """Return the deep size of *objects* in bytes.
+
+    Containers, ``__slots__`` and ``__dict__`` attributes are followed;
+    classes, modules and functions are not.  Object ids already in *seen*
+    are skipped, so passing the same set to several calls never counts an
+    object twice.
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = list(objects)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SKIP_TYPES):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            for name in _slot_names(type(obj)):
+                value = getattr(obj, name, None)
+                if value is not None:
+                    stack.append(value)
+            attrs = getattr(obj, "__dict__", None)
+            if attrs is not None:
+                stack.append(attrs)
+    return total
+
+
+class _Subsystem:
+    __slots__ = ("name", "size", "evict", "budget", "counter")
+
+    def __init__(self, name: str, size: Callable[[set[int]], int],
+                 evict: Optional[Callable[[int], None]], budget: int,
+                 counter: bool) -> None:
+        self.name = name
+        self.size = size
+        self.evict = evict
+        self.budget = budget
+        self.counter = counter
+
+
+class MemoryAccountant:
+    """Registry of subsystem size estimators, budgets and evictors."""
+
+    def __init__(self) -> None:
+        self._subsystems: dict[str, _Subsystem] = {}
+        self._snapshots: dict[str, tracemalloc.Snapshot] = {}
+
+    # --- Subsystems ---
+
+    def register(self, name: str, size: Callable[[set[int]], int],
+                 evict: Optional[Callable[[int], None]] = None,
+                 budget: int = 0, counter: bool = False) -> None:
+        """Register subsystem *name*.
+
+        *size* returns the estimated bytes, skipping (and adding to) the
+        object ids in the set it is given; with *counter*, it returns a
+        cached count instead and ignores the set.  *evict*, if given, is
+        called with the budget when the estimate exceeds it and should
+        release memory down to (below) that many bytes.  A budget of 0
+        means unlimited.
+        """
+        self._subsystems[name] = _Subsystem(name, size, evict, budget, counter)
+
+    def set_budget(self, name: str, budget: int) -> None:
+        """Set the budget of *name* in bytes (0 = unlimited)."""
+        subsystem = self._subsystems.get(name)
+        if subsystem is None:
+            raise KeyError(f"unknown subsystem: {name}")
+        if budget and subsystem.evict is None:
+            raise ValueError(f"subsystem {name} cannot evict, so it cannot "
+                             "have a budget")
+        subsystem.budget = max(0, budget)
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._subsystems)
+
+    def _measure(self, until: Optional[_Subsystem] = None
+                 ) -> Iterator[tuple[_Subsystem, int]]:
+        """Yield ``(subsystem, bytes)`` in registration order, sharing one
+        ``seen`` set, and stop after *until*."""
+        seen: set[int] = set()
+        for subsystem in self._subsystems.values():
+            yield subsystem, subsystem.size(seen)
+            if subsystem is until:
+                return
+
+    def report(self) -> dict[str, Any]:
+        """Return estimated bytes and budget per subsystem, plus the total."""
+        subsystems = {}
+        total = 0
+        for subsystem, nbytes in self._measure():
+            total += nbytes
+            subsystems[subsystem.name] = {
+                "bytes": nbytes,
+                "budget": subsystem.budget,
+                "evictable": subsystem.evict is not None,
+            }
+        return {"subsystems": subsystems, "totalBytes": total,
+                "tracing": tracemalloc.is_tracing()}
+
+    def enforce(self) -> list[str]:
+        """Evict every subsystem over its budget; returns their names.
+
+        Sizes are the ones :meth:`report` would give.  Subsystems are only
+        walked up to the last budgeted one that is not a counter, so with
+        counters alone nothing is walked.
+        """
+        budgeted = [s for s in self._subsystems.values()
+                    if s.budget and s.evict is not None]
+        walked = [s for s in budgeted if not s.counter]
+        sizes = dict(self._measure(until=walked[-1])) if walked else {}
+        evicted = []
+        for subsystem in budgeted:
+            nbytes = sizes[subsystem] if subsystem in sizes else subsystem.size(set())
+            if nbytes > subsystem.budget:
+                subsystem.evict(subsystem.budget)
+                evicted.append(subsystem.name)
+        return evicted
+
+    # --- tracemalloc ---
+
+    def snapshot(self, label: str, frames: int = 1) -> None:
+        """Store a tracemalloc snapshot as *label*, starting tracing first
+        if needed (allocations made before that are not seen)."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        self._snapshots[label] = tracemalloc.take_snapshot()
+
+    def diff(self, before: str, after: str, limit: int = 20) -> list[dict[str, Any]]:
+        """Return the *limit* source lines whose allocations grew the most
+        between snapshots *before* and *after*."""
+        old = self._snapshots[before]
+        new = self._snapshots[after]
+        stats = sorted(new.compare_to(old, "lineno"),
+                       key=lambda stat: stat.size_diff, reverse=True)
+        return [
+            {
+                "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "sizeDiff": stat.size_diff,
+                "size": stat.size,
+                "countDiff": stat.count_diff,
+            }
+            for stat in stats[:limit]
+        ]
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render :meth:`MemoryAccountant.report` output as a text table."""
+    lines = [f"{'subsystem':<20} {'bytes':>12} {'budget':>12}"]
+    for name, entry in report["subsystems"].items():
+        budget = str(entry["budget"]) if entry["budget"] else "-"
+        lines.append(f"{name:<20} {entry['bytes']:>12} {budget:>12}")
+    lines.append(f"{'total':<20} {report['totalBytes']:>12}")
+    return "\n".join(lines)
+
+
+def format_diff(diff: list[dict[str, Any]]) -> str:
+    """Render :meth:`MemoryAccountant.diff` output, one line per location."""
+    return "\n".join(
+        f"{d['sizeDiff']:>+12} B {d['countDiff']:>+8} blocks  {d['location']}"
+        for d in diff
+    )
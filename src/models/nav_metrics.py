@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+nav_metrics.py - Page navigation latency measurement.
+
+``main.qml`` calls :meth:`NavigationMetrics.begin` when it starts showing a
+page, saying whether the page came from its page cache ("warm") or had to
+be created ("cold").  The navigation ends with the next frame the window
+presents, so the measured time includes creating the page, evaluating its
+bindings and rendering it.
+
+``frameSwapped`` may be emitted from the render thread; the connection is
+queued to this object's (GUI) thread, so timing state is only touched
+there.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Any, Optional
+
+from PySide6.QtCore import QObject, Qt, Slot
+from PySide6.QtGui import QWindow
+
+# Samples kept per (page, warm/cold)
+_MAX_SAMPLES = 200
+
+
+def _summary(samples: list[float]) -> dict[str, Any]:
+    ordered = sorted(samples)
+    n = len(ordered)
+    return {
+        "count": n,
+        "meanMs": sum(ordered) / n,
+        "p50Ms": ordered[n // 2],
+        "p95Ms": ordered[min(n - 1, int(n * 0.95))],
+        "maxMs": ordered[-1],
+    }
+
+
+class NavigationMetrics(QObject):
+    """Collects navigation latencies; exposed to QML as ``navMetrics``."""
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._samples: dict[tuple[str, str], deque[float]] = {}
+        self._pending: Optional[tuple[str, str, float]] = None
+
+    def attach(self, window: QWindow) -> None:
+        """Measure navigations up to *window*'s next presented frame."""
+        window.frameSwapped.connect(self._on_frame_swapped,
+                                    Qt.ConnectionType.QueuedConnection)
+
+    @Slot(str, bool)
+    def begin(self, page: str, cached: bool) -> None:
+        """Start timing a navigation to *page*."""
+        self._pending = (page, "warm" if cached else "cold", time.perf_counter())
+
+    @Slot()
+    def _on_frame_swapped(self) -> None:
+        if self._pending is None:
+            return
+        page, kind, started = self._pending
+        self._pending = None
+        samples = self._samples.setdefault((page, kind), deque(maxlen=_MAX_SAMPLES))
+        samples.append((time.perf_counter() - started) * 1000.0)
+
+    @Slot(result="QVariant")
+    def stats(self) -> Any:
+        """Return latency summaries per page and overall, split into
+        ``cold`` (page created) and ``warm`` (page reused)."""
+        pages: dict[str, dict[str, Any]] = {}
+        overall: dict[str, list[float]] = {"cold": [], "warm": []}
+        for (page, kind), samples in self._samples.items():
+            pages.setdefault(page, {})[kind] = _summary(list(samples))
+            overall[kind].extend(samples)
+        return {
+            "pages": pages,
+            "overall": {kind: _summary(s) for kind, s in overall.items() if s},
+        }
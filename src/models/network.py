@@ -0,0 +1,369 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+network.py - Shared HTTP client and background task executor.
+
+All network work (update checks, downloads, content sync) goes through one
+:class:`NetworkManager`:
+
+- :class:`HttpClient` keeps idle keep-alive connections per host and reuses
+  them, transparently reconnecting when a pooled connection went stale.
+- Jobs run on a bounded ``QThreadPool``.  Each job receives its
+  :class:`NetworkTask`, which carries cancellation and progress reporting.
+- A task's signals are emitted from the worker thread but the task object
+  lives in the GUI thread, so Qt delivers them as queued calls and
+  receivers always run on the GUI thread.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import ssl
+import threading
+from typing import Any, Callable, Iterator, Optional
+from urllib.parse import urljoin, urlsplit
+
+from PySide6.QtCore import QObject, QThreadPool, Signal, Slot
+
+DEFAULT_USER_AGENT = "StudyToday"
+DEFAULT_TIMEOUT = 10.0
+
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+_MAX_REDIRECTS = 5
+
+# Errors that mean a reused keep-alive connection was closed by the server
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+class NetworkError(Exception):
+    """Raised for failed requests and non-success HTTP statuses."""
+
+
+class TaskCancelled(NetworkError):
+    """Raised inside a job once its task has been cancelled."""
+
+
+# ---------------------------------------------------------------------- #
+#  HTTP client
+# ---------------------------------------------------------------------- #
+
+_PoolKey = tuple[str, str, int]
+
+
+class HttpResponse:
+    """A response whose connection returns to the pool once fully read."""
+
+    def __init__(
+        self,
+        client: "HttpClient",
+        key: _PoolKey,
+        conn: http.client.HTTPConnection,
+        resp: http.client.HTTPResponse,
+        url: str,
+    ) -> None:
+        self._client = client
+        self._key = key
+        self._conn: Optional[http.client.HTTPConnection] = conn
+        self._resp = resp
+        self.url = url
+        self.status: int = resp.status
+        self.headers = resp.headers
+
+    @property
+    def length(self) -> int:
+        """Content-Length, or 0 when unknown."""
+        try:
+            return int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            return 0
+
+    def iter_chunks(self, size: int = 65536) -> Iterator[bytes]:
+        """Yield the body in chunks of at most *size* bytes."""
+        try:
+            while True:
+                chunk = self._resp.read(size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            self.close()
+
+    def read(self) -> bytes:
+        """Return the whole body."""
+        return b"".join(self.iter_chunks())
+
+    def json(self) -> Any:
+        return json.loads(self.read().decode("utf-8"))
+
+    def close(self) -> None:
+        """Release the connection: back to the pool when the body was fully
+        consumed and the server allows keep-alive, otherwise closed."""
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        if self._resp.isclosed() and not self._resp.will_close:
+            self._client._release(self._key, conn)
+        else:
+            self._resp.close()
+            conn.close()
+
+    def __enter__(self) -> "HttpResponse":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class HttpClient:
+    """Thread-safe HTTP/1.1 client with per-host keep-alive pooling."""
+
+    def __init__(
+        self,
+        user_agent: str = DEFAULT_USER_AGENT,
+        max_idle_per_host: int = 4,
+    ) -> None:
+        self._user_agent = user_agent
+        self._max_idle = max_idle_per_host
+        self._idle: dict[_PoolKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context()
+
+    # --- Pool ---
+
+    def _acquire(self, key: _PoolKey, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        """Return ``(connection, reused)`` for *key*."""
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        return self._connect(key, timeout), False
+
+    def _connect(self, key: _PoolKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(
+                host, port, timeout=timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _release(self, key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
+
+    # --- Requests ---
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        body: Optional[bytes] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> HttpResponse:
+        """Send a request, following redirects, and return the response.
+
+        Raises :class:`NetworkError` for connection failures and for
+        statuses of 400 and above.  The caller must read or close the
+        returned response.
+        """
+        all_headers = {"User-Agent": self._user_agent}
+        all_headers.update(headers or {})
+
+        for _ in range(_MAX_REDIRECTS + 1):
+            resp = self._send(method, url, all_headers, body, timeout)
+            if resp.status in _REDIRECT_STATUSES:
+                location = resp.headers.get("Location")
+                resp.read()
+                if not location:
+                    raise NetworkError(f"HTTP {resp.status} without Location")
+                url = urljoin(url, location)
+                if resp.status == 303:
+                    method, body = "GET", None
+                continue
+            if resp.status >= 400:
+                resp.close()
+                raise NetworkError(f"HTTP {resp.status} for {url}")
+            return resp
+        raise NetworkError(f"Too many redirects for {url}")
+
+    def get(self, url: str, headers: Optional[dict[str, str]] = None,
+            timeout: float = DEFAULT_TIMEOUT) -> HttpResponse:
+        return self.request("GET", url, headers=headers, timeout=timeout)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: Optional[bytes],
+        timeout: float,
+    ) -> HttpResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise NetworkError(f"Unsupported URL: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        conn, reused = self._acquire(key, timeout)
+        try:
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                resp = conn.getresponse()
+            except _STALE_ERRORS:
+                if not reused:
+                    raise
+                # The server dropped the idle connection; retry once on a
+                # fresh one.
+                conn.close()
+                conn = self._connect(key, timeout)
+                conn.request(method, path, body=body, headers=headers)
+                resp = conn.getresponse()
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            raise NetworkError(str(exc) or type(exc).__name__) from exc
+        return HttpResponse(self, key, conn, resp, url)
+
+
+# ---------------------------------------------------------------------- #
+#  Tasks and executor
+# ---------------------------------------------------------------------- #
+
+class NetworkTask(QObject):
+    """Handle for one background job.
+
+    Signals are delivered on the GUI thread.  A job may finish before
+    :meth:`NetworkManager.submit` returns, so pass the receivers to
+    ``submit`` rather than connecting to the returned task afterwards.
+    """
+
+    progress = Signal(float)
+    succeeded = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()
+    done = Signal()
+
+    def __init__(self, http: HttpClient, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.http = http
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation; the job stops at its next check."""
+        self._cancel.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def check_cancelled(self) -> None:
+        """Raise :class:`TaskCancelled` if :meth:`cancel` was called."""
+        if self._cancel.is_set():
+            raise TaskCancelled()
+
+    def report_progress(self, fraction: float) -> None:
+        """Report progress in ``[0, 1]`` from inside the job."""
+        self.progress.emit(fraction)
+
+
+class NetworkManager(QObject):
+    """Owns the shared :class:`HttpClient` and a bounded worker pool."""
+
+    def __init__(self, max_workers: int = 4, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.http = HttpClient()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_workers)
+        # Keeps tasks alive until their job has finished
+        self._active: set[NetworkTask] = set()
+
+    def submit(
+        self,
+        job: Callable[[NetworkTask], Any],
+        *,
+        on_success: Optional[Callable[[Any], None]] = None,
+        on_failure: Optional[Callable[[str], None]] = None,
+        on_cancel: Optional[Callable[[], None]] = None,
+        on_progress: Optional[Callable[[float], None]] = None,
+    ) -> NetworkTask:
+        """Run ``job(task)`` on the pool and return the task.
+
+        The job's return value is delivered through ``succeeded``; a raised
+        :class:`TaskCancelled` through ``cancelled``; any other exception
+        through ``failed``.  ``done`` always follows.  The ``on_*``
+        receivers are connected before the job is queued, so even a job
+        that fails immediately reaches them.
+        """
+        task = NetworkTask(self.http)
+        for signal, receiver in ((task.succeeded, on_success),
+                                 (task.failed, on_failure),
+                                 (task.cancelled, on_cancel),
+                                 (task.progress, on_progress)):
+            if receiver is not None:
+                signal.connect(receiver)
+        self._active.add(task)
+        task.done.connect(self._on_task_done)
+        self._pool.start(lambda: self._run(task, job))
+        return task
+
+    @staticmethod
+    def _run(task: NetworkTask, job: Callable[[NetworkTask], Any]) -> None:
+        try:
+            task.check_cancelled()
+            result = job(task)
+            task.check_cancelled()
+        except TaskCancelled:
+            task.cancelled.emit()
+        except Exception as exc:
+            task.failed.emit(str(exc) or type(exc).__name__)
+        else:
+            task.succeeded.emit(result)
+        finally:
+            task.done.emit()
+
+    @Slot()
+    def _on_task_done(self) -> None:
+        task = self.sender()
+        self._active.discard(task)
+        if task is not None:
+            task.deleteLater()
+
+    @Slot()
+    def cancelAll(self) -> None:
+        """Cancel every running or queued task."""
+        for task in list(self._active):
+            task.cancel()
+
+    def shutdown(self, wait_ms: int = 3000) -> None:
+        """Cancel all tasks, wait for the workers and close connections."""
+        self.cancelAll()
+        self._pool.clear()
+        self._pool.waitForDone(wait_ms)
+        self.http.close()
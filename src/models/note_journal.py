@@ -0,0 +1,293 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+note_journal.py - Delta-based note editing with an append-only journal.
+
+Saving a note records only what changed: the common prefix and suffix of the
+old and new text are skipped and a single ``(pos, deleted, inserted)`` delta
+is kept.  Deltas feed two consumers:
+
+- :class:`NoteJournal`, an append-only NDJSON file replayed at startup for
+  crash recovery and compacted into one record per live note once at least
+  half of it is superseded, so bulk creation never triggers a rewrite.
+- Per-note undo/redo stacks in :class:`NoteEditor`, where undoing a step is
+  just applying its inverse delta.
+
+Journal records::
+
+    {"op": "put", "note": {...}}                      create or replace
+    {"op": "edit", "id": ..., "f": "content", "p": 12, "d": 3, "i": "abc",
+     "t": "<updatedAt>"}                              text delta
+    {"op": "del", "id": ...}                          delete
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Callable, Collection, Iterable, Optional
+
+# Compact once the journal holds this many records beyond one per live
+# note, and at least as many superseded records as live ones.  Scaling
+# with the live count keeps rewrites amortised O(1) per appended record.
+_COMPACT_AFTER = 2000
+
+# Undo steps kept per note
+_MAX_UNDO = 500
+
+# Block size for the coarse prefix/suffix scan in compute_delta()
+_SCAN_BLOCK = 4096
+
+
+def _common_prefix(a: str, b: str, limit: int) -> int:
+    """Length of the common prefix of *a* and *b*, at most *limit*."""
+    # Compare whole blocks first (each comparison is a C-level memcmp),
+    # then binary-search inside the first differing block.
+    pos = 0
+    while pos + _SCAN_BLOCK <= limit and a[pos:pos + _SCAN_BLOCK] == b[pos:pos + _SCAN_BLOCK]:
+        pos += _SCAN_BLOCK
+    lo, hi = pos, min(pos + _SCAN_BLOCK, limit)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[pos:mid] == b[pos:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix of *a* and *b*, at most *limit*."""
+    la, lb = len(a), len(b)
+    pos = 0
+    while (pos + _SCAN_BLOCK <= limit
+           and a[la - pos - _SCAN_BLOCK:la - pos] == b[lb - pos - _SCAN_BLOCK:lb - pos]):
+        pos += _SCAN_BLOCK
+    lo, hi = pos, min(pos + _SCAN_BLOCK, limit)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[la - mid:la - pos] == b[lb - mid:lb - pos]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def compute_delta(old: str, new: str) -> Optional[tuple[int, int, str]]:
+    """Return ``(pos, deleted, inserted)`` turning *old* into *new*.
+
+    ``old[pos:pos + deleted]`` is replaced by *inserted*.  Returns ``None``
+    when the texts are equal.  Runs in linear time with a small constant,
+    so it stays cheap for megabyte-sized notes.
+    """
+    if old == new:
+        return None
+    prefix = _common_prefix(old, new, min(len(old), len(new)))
+    suffix = _common_suffix(old, new, min(len(old), len(new)) - prefix)
+    return prefix, len(old) - prefix - suffix, new[prefix:len(new) - suffix]
+
+
+def apply_delta(text: str, pos: int, deleted: int, inserted: str) -> str:
+    """Apply a delta produced by :func:`compute_delta`."""
+    return text[:pos] + inserted + text[pos + deleted:]
+
+
+class NoteJournal:
+    """Append-only NDJSON journal of note changes."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file: Any = None
+        self._records = 0  # lines in the file
+
+    def replay(self) -> list[dict[str, Any]]:
+        """Rebuild the notes recorded in the journal, in creation order.
+
+        A torn last line (from a crash mid-write) and edits that no longer
+        apply are skipped.
+        """
+        notes: dict[str, dict[str, Any]] = {}
+        try:
+            f = open(self.path, encoding="utf-8")
+        except FileNotFoundError:
+            return []
+        with f:
+            for line in f:
+                self._records += 1
+                try:
+                    record = json.loads(line)
+                    op = record["op"]
+                    if op == "put":
+                        note = record["note"]
+                        notes[note["id"]] = note
+                    elif op == "edit":
+                        note = notes[record["id"]]
+                        field = record["f"]
+                        note[field] = apply_delta(
+                            note.get(field, ""), record["p"], record["d"], record["i"])
+                        note["updatedAt"] = record.get("t", note.get("updatedAt", ""))
+                    elif op == "del":
+                        notes.pop(record["id"], None)
+                except (ValueError, KeyError, TypeError):
+                    continue
+        return list(notes.values())
+
+    def _write(self, records: Iterable[dict[str, Any]]) -> None:
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        lines = [json.dumps(r, ensure_ascii=False) + "\n" for r in records]
+        self._file.write("".join(lines))
+        self._file.flush()
+        self._records += len(lines)
+
+    def put(self, notes: Iterable[dict[str, Any]]) -> None:
+        self._write({"op": "put", "note": n} for n in notes)
+
+    def edit(self, note_id: str, field: str, delta: tuple[int, int, str],
+             timestamp: str) -> None:
+        pos, deleted, inserted = delta
+        self._write([{"op": "edit", "id": note_id, "f": field, "p": pos,
+                      "d": deleted, "i": inserted, "t": timestamp}])
+
+    def delete(self, note_id: str) -> None:
+        self._write([{"op": "del", "id": note_id}])
+
+    def needs_compaction(self, live: int) -> bool:
+        """Whether compacting to *live* notes would drop enough records."""
+        return self._records - live >= max(_COMPACT_AFTER, live)
+
+    def compact(self, notes: Iterable[dict[str, Any]]) -> None:
+        """Atomically replace the journal with one ``put`` per live note."""
+        self.close()
+        tmp_path = self.path + ".tmp"
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        records = 0
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for note in notes:
+                f.write(json.dumps({"op": "put", "note": note}, ensure_ascii=False) + "\n")
+                records += 1
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._records = records
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class NoteEditor:
+    """Applies note edits as deltas, journals them and keeps undo history.
+
+    *live_notes* returns the current note dicts; it is used when the
+    journal is compacted.
+    """
+
+    def __init__(self, live_notes: Callable[[], Collection[dict[str, Any]]]) -> None:
+        self._live_notes = live_notes
+        self.journal: Optional[NoteJournal] = None
+        # note id -> [(field, pos, removed, inserted)]
+        self._undo: dict[str, list[tuple[str, int, str, str]]] = {}
+        self._redo: dict[str, list[tuple[str, int, str, str]]] = {}
+
+    def open(self, path: str,
+             restore: Callable[[list[dict[str, Any]]], None]) -> None:
+        """Recover the notes journaled at *path*, then journal to it.
+
+        *restore* receives the recovered notes before journaling starts,
+        so restoring them is not written back as new records.
+        """
+        journal = NoteJournal(path)
+        restore(journal.replay())
+        # Start from a compact file so replay cost stays proportional to
+        # the live notes rather than to the whole editing history.
+        journal.compact(self._live_notes())
+        self.journal = journal
+
+    def close(self) -> None:
+        if self.journal is not None:
+            self.journal.close()
+
+    # --- Journal hooks ---
+
+    def created(self, notes: list[dict[str, Any]]) -> None:
+        # New notes supersede nothing, so there is no compaction check
+        # here: a bulk import appends its chunks without rewriting the
+        # file, and the next edit or delete compacts if needed.
+        if self.journal is not None and notes:
+            self.journal.put(notes)
+
+    def deleted(self, note_id: str) -> None:
+        self._undo.pop(note_id, None)
+        self._redo.pop(note_id, None)
+        if self.journal is not None:
+            self.journal.delete(note_id)
+            self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        if self.journal is None:
+            return
+        live = self._live_notes()
+        if self.journal.needs_compaction(len(live)):
+            self.journal.compact(live)
+
+    # --- Editing ---
+
+    def _apply(self, note: dict[str, Any], field: str,
+               delta: tuple[int, int, str], timestamp: str) -> str:
+        """Apply *delta* to *note*; returns the removed text."""
+        pos, deleted, inserted = delta
+        text = note.get(field, "")
+        removed = text[pos:pos + deleted]
+        note[field] = apply_delta(text, pos, deleted, inserted)
+        note["updatedAt"] = timestamp
+        if self.journal is not None:
+            self.journal.edit(note["id"], field, delta, timestamp)
+        return removed
+
+    def edit(self, note: dict[str, Any], field: str, new_text: str,
+             timestamp: str) -> bool:
+        """Set *field* of *note* to *new_text*; returns False if unchanged."""
+        delta = compute_delta(note.get(field, ""), new_text)
+        if delta is None:
+            return False
+        removed = self._apply(note, field, delta, timestamp)
+        history = self._undo.setdefault(note["id"], [])
+        history.append((field, delta[0], removed, delta[2]))
+        if len(history) > _MAX_UNDO:
+            del history[0]
+        self._redo.pop(note["id"], None)
+        self._maybe_compact()
+        return True
+
+    def undo(self, note: dict[str, Any], timestamp: str) -> bool:
+        """Revert the last edit of *note*; returns False if there is none."""
+        history = self._undo.get(note["id"])
+        if not history:
+            return False
+        field, pos, removed, inserted = history.pop()
+        self._apply(note, field, (pos, len(inserted), removed), timestamp)
+        self._redo.setdefault(note["id"], []).append((field, pos, removed, inserted))
+        self._maybe_compact()
+        return True
+
+    def redo(self, note: dict[str, Any], timestamp: str) -> bool:
+        """Re-apply the last undone edit of *note*."""
+        history = self._redo.get(note["id"])
+        if not history:
+            return False
+        field, pos, removed, inserted = history.pop()
+        self._apply(note, field, (pos, len(removed), inserted), timestamp)
+        self._undo.setdefault(note["id"], []).append((field, pos, removed, inserted))
+        self._maybe_compact()
+        return True
+
+    def can_undo(self, note_id: str) -> bool:
+        return bool(self._undo.get(note_id))
+
+    def can_redo(self, note_id: str) -> bool:
+        return bool(self._redo.get(note_id))
@@ -0,0 +1,508 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+parser_conformance.py - Differential fuzzing of the question-block grammar.
+
+Random and adversarial ``:::`` documents (nested openers, missing or
+malformed closers, huge option lists, CRLF and unusual whitespace) are
+checked four ways:
+
+- :func:`content_parser._scan_blocks` against the reference ``_BLOCK_RE``
+  regex it replaces;
+- :func:`incremental_parser.parse_incremental` after a random edit against
+  a full parse of the edited document (same blocks and question fields;
+  unique ids, and ids of blocks outside the edit unchanged);
+- the flashcards ``FlashcardsPage.qml`` extracts with its own JavaScript
+  regexes (run in a headless ``QJSEngine``) against the same cards derived
+  from :func:`content_parser.parse_content`;
+- parse time, as throughput, worst case per document and the growth of
+  parse time on pathological inputs of doubling size.  Growth is only
+  reported, since wall-clock slopes are noisy; ``--max-slope`` turns it
+  into a guard that fails the run on a super-linear (backtracking)
+  blow-up.
+
+The waar-of-niet answer is lowercased by the Python parser but shown as
+written by the flashcards page; answers are compared case-insensitively
+there.  ``src/lib/content-parser.ts`` implements a different (list-based)
+grammar and is not compared.
+
+Run with ``python main.py conformance``; the exit code is 1 when outputs
+differ, a document exceeds ``--max-ms`` or, if given, ``--max-slope`` is
+exceeded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from src.models.content_parser import _BLOCK_RE, _scan_blocks, parse_content
+from src.models.incremental_parser import ParseState, parse_incremental
+
+FLASHCARDS_QML = Path(__file__).resolve().parent.parent / "qml" / "pages" / "FlashcardsPage.qml"
+
+_TYPES = ("meerkeuze", "invullen", "waar-of-niet", "koppelen", "open")
+_WORDS = ("cel", "kern", "energie", "Waar", "niet", "fotosynthese", "ATP",
+          "mitochondriën", "A)", "B)", "=", ",", ":", "vraag:", "antwoord:",
+          ":::", "é", "ß", "İ", "-", "*")
+# Whitespace that Python's str.strip()/splitlines() and JavaScript's
+# trim()/split("\n") do not all agree on
+_ODD_WHITESPACE = ("\t", "\u00a0", "\u2028", "\u3000", "\ufeff", "\x0b",
+                   "\x0c", "\x1c", "\x85", "\r")
+
+# Slope flagged (but not failed) in scaling reports without --max-slope
+_SLOPE_WARN = 1.5
+
+
+# ---------------------------------------------------------------------- #
+#  Document generation
+# ---------------------------------------------------------------------- #
+
+class DocumentGenerator:
+    """Builds random documents from a seeded RNG."""
+
+    def __init__(self, seed: int) -> None:
+        self.rng = random.Random(seed)
+
+    def _ws(self) -> str:
+        r = self.rng.random()
+        if r < 0.7:
+            return " "
+        if r < 0.85:
+            return ""
+        return self.rng.choice(_ODD_WHITESPACE)
+
+    def _text(self, words: int = 4) -> str:
+        return " ".join(self.rng.choice(_WORDS)
+                        for _ in range(self.rng.randint(1, words)))
+
+    def _field(self, key: str, value: str) -> str:
+        if self.rng.random() < 0.15:
+            key = key.upper() if self.rng.random() < 0.5 else key.capitalize()
+        indent = self._ws() if self.rng.random() < 0.2 else ""
+        return f"{indent}{key}:{self._ws()}{value}{self._ws() if self.rng.random() < 0.2 else ''}"
+
+    def _options(self) -> str:
+        count = self.rng.choice((2, 3, 4, 5)) if self.rng.random() < 0.97 \
+            else self.rng.randint(200, 3000)
+        return " ".join(f"{chr(65 + i % 26)}) {self._text(2)}" for i in range(count))
+
+    def _fields(self, block_type: str) -> list[str]:
+        rng = self.rng
+        fields = [self._field("vraag", self._text(8))]
+        if block_type == "meerkeuze":
+            fields.append(self._field("opties", self._options()))
+            fields.append(self._field(
+                "correct", str(rng.randint(-1, 5)) if rng.random() < 0.9 else self._text(1)))
+            fields.append(self._field("uitleg", self._text()))
+        elif block_type == "invullen":
+            fields.append(self._field("antwoord", self._text(2)))
+            if rng.random() < 0.5:
+                fields.append(self._field("hint", self._text()))
+        elif block_type == "waar-of-niet":
+            fields.append(self._field("antwoord", rng.choice(
+                ("Waar", "niet", "NIET WAAR", "true", "nee", ""))))
+            if rng.random() < 0.6:
+                fields.append(self._field("uitleg", self._text()))
+        elif block_type == "koppelen":
+            fields.append(self._field("paren", ", ".join(
+                f"{self._text(1)}={self._text(1)}" for _ in range(rng.randint(1, 6)))))
+        else:
+            fields.append(self._field("kernwoorden", ", ".join(
+                self._text(1) for _ in range(rng.randint(0, 5)))))
+        rng.shuffle(fields)
+        if rng.random() < 0.1:
+            fields.append(rng.choice(fields))  # duplicate field; last one wins
+        if rng.random() < 0.2:
+            fields.insert(rng.randrange(len(fields) + 1), "")
+        return fields
+
+    def _opener(self, block_type: str) -> str:
+        r = self.rng.random()
+        if r < 0.05:
+            block_type = block_type.upper()
+        elif r < 0.08:
+            block_type = "afbeelding"
+        suffix = ""
+        if self.rng.random() < 0.1:
+            suffix = self.rng.choice((" ", "\t", " extra", "\u00a0", "\r"))
+        return f":::{block_type}{suffix}"
+
+    def _closer(self) -> Optional[str]:
+        r = self.rng.random()
+        if r < 0.8:
+            return ":::"
+        if r < 0.9:
+            return self.rng.choice(("::: ", ":::\t", " :::", "::::", ":::x", ":::\u00a0"))
+        return None  # missing closer
+
+    def block(self) -> list[str]:
+        block_type = self.rng.choice(_TYPES)
+        lines = [self._opener(block_type)] + self._fields(block_type)
+        if self.rng.random() < 0.08:
+            # Nested opener (possibly with its own closer)
+            lines[self.rng.randrange(1, len(lines) + 1):0] = self.block()
+        closer = self._closer()
+        if closer is not None:
+            lines.append(closer)
+        return lines
+
+    def edit(self, doc: str) -> str:
+        """Return *doc* with a random span replaced (or a block inserted)."""
+        rng = self.rng
+        start = rng.randrange(len(doc) + 1)
+        end = min(len(doc), start + rng.choice((0, 0, 1, 5, 40)))
+        r = rng.random()
+        if r < 0.3:
+            insert = "\n".join(self.block()) + "\n"
+        elif r < 0.6:
+            insert = rng.choice((":::", ":::\n", "\n", ":::open\n", " ", "vraag: x"))
+        elif r < 0.8:
+            insert = self._text()
+        else:
+            insert = ""
+        return doc[:start] + insert + doc[end:]
+
+    def document(self) -> str:
+        rng = self.rng
+        lines: list[str] = []
+        for _ in range(rng.randint(1, 12)):
+            if rng.random() < 0.4:
+                lines.append(("# " if rng.random() < 0.2 else "") + self._text(10))
+            else:
+                lines.extend(self.block())
+            if rng.random() < 0.3:
+                lines.append("")
+        newline = "\r\n" if rng.random() < 0.05 else "\n"
+        doc = newline.join(lines)
+        if rng.random() < 0.5:
+            doc += newline
+        if rng.random() < 0.05:
+            doc = doc[:rng.randrange(len(doc) + 1)]
+        return doc
+
+
+# Inputs whose parse time must stay linear in n
+PATHOLOGICAL: dict[str, Callable[[int], str]] = {
+    "unclosed openers": lambda n: ":::invullen\nvraag: x\n" * n,
+    "nested openers": lambda n: ":::meerkeuze\n" * n + ":::\n",
+    "closer-like lines": lambda n: ":::open\n" + ":::x\n" * n,
+    "huge option list": lambda n: ":::meerkeuze\nvraag: x\nopties: "
+        + " ".join(f"{chr(65 + i % 26)}) optie" for i in range(n)) + "\n:::\n",
+    "whitespace runs": lambda n: (":::open" + " " * 50 + "\n") * n,
+    "long unclosed body": lambda n: ":::open\n" + "tekst regel\n" * (n * 10),
+}
+
+
+# ---------------------------------------------------------------------- #
+#  Implementations under test
+# ---------------------------------------------------------------------- #
+
+def reference_blocks(text: str) -> list[tuple[int, int, str, str]]:
+    return [(m.start(), m.end(), m.group(1), m.group(2))
+            for m in _BLOCK_RE.finditer(text)]
+
+
+def scanned_blocks(text: str) -> list[tuple[int, int, str, str]]:
+    return [(b.start, b.end, b.type, b.body) for b in _scan_blocks(text)]
+
+
+def incremental_mismatch(doc: str, edited: str) -> str:
+    """Compare re-parsing *edited* against the state of *doc* with a full
+    parse; returns a description of the first difference, or ""."""
+    before = parse_incremental(doc)
+    after = parse_incremental(edited, before)
+    full = list(_scan_blocks(edited))
+    if [(s.start, s.end, s.type) for s in after.spans] != \
+            [(b.start, b.end, b.type) for b in full]:
+        return "block spans differ"
+
+    def fields(q: Any) -> dict[str, Any]:
+        return {k: v for k, v in q.to_variant().items() if k != "id"}
+
+    if [fields(q) for q in after.questions] != \
+            [fields(q) for q in parse_content(edited)["questions"]]:
+        return "question fields differ"
+    if len(set(after.ids)) != len(after.ids) or \
+            any(q.id != i for q, i in zip(after.questions, after.ids)):
+        return "question ids are not unique"
+    # Blocks in front of the edit keep their ids, and restoring the ids
+    # from the saved table gives the same ids again
+    unchanged = len(os.path.commonprefix((doc, edited)))
+    for span, old_id, new_span, new_id in zip(before.spans, before.ids,
+                                              after.spans, after.ids):
+        if span.end >= unchanged or span != new_span:
+            break
+        if old_id != new_id:
+            return "id of a block in front of the edit changed"
+    reloaded = parse_incremental(edited, ParseState.from_table(after.table()))
+    if reloaded.ids != after.ids:
+        return "ids change when restored from the saved table"
+    return ""
+
+
+def python_flashcards(content: str) -> list[tuple[str, str, str, bool]]:
+    """The cards FlashcardsPage would show, derived from parse_content:
+    ``(vraag, antwoord, suffix, fold case)``."""
+    questions = parse_content(content)["questions"]
+    cards = [(q.vraag, q.antwoord, "", False) for q in questions
+             if q.type == "invullen" and q.vraag and q.antwoord]
+    cards += [(q.vraag, q.antwoord, f" - {q.uitleg}" if q.uitleg else "", True)
+              for q in questions if q.type == "waar-of-niet" and q.vraag]
+    return cards
+
+
+def cards_match(py: list[tuple[str, str, str, bool]],
+                js: list[dict[str, Any]]) -> bool:
+    if len(py) != len(js):
+        return False
+    for (vraag, antwoord, suffix, fold), card in zip(py, js):
+        shown = card.get("antwoord", "")
+        if card.get("vraag") != vraag or not shown.endswith(suffix):
+            return False
+        shown = shown[:len(shown) - len(suffix)]
+        if (shown.lower() if fold else shown) != antwoord:
+            return False
+    return True
+
+
+def _function_source(qml: str, name: str) -> str:
+    """Return the source of JavaScript function *name* in *qml*."""
+    start = qml.index(f"function {name}(")
+    depth = 0
+    i = qml.index("{", start)
+    quote = ""
+    while i < len(qml):
+        c = qml[i]
+        if quote:
+            if c == "\\":
+                i += 1
+            elif c == quote:
+                quote = ""
+        elif c in "\"'":
+            quote = c
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return qml[start:i + 1]
+        i += 1
+    raise ValueError(f"unterminated function {name}")
+
+
+# FlashcardsPage.qml functions making up its parser
+_QML_FUNCTIONS = ("pyStrip", "questionBlocks", "collectFlashcards")
+
+
+class QmlFlashcards:
+    """``collectFlashcards()`` from FlashcardsPage.qml in a QJSEngine."""
+
+    def __init__(self, qml_path: Path = FLASHCARDS_QML) -> None:
+        from PySide6.QtCore import QCoreApplication
+        from PySide6.QtQml import QJSEngine
+
+        self._app = QCoreApplication.instance() or QCoreApplication([])
+        self._engine = QJSEngine()
+        qml = qml_path.read_text(encoding="utf-8")
+        source = "\n".join(_function_source(qml, name) for name in _QML_FUNCTIONS)
+        self._fn = self._engine.evaluate(
+            "(function(json) {\n"
+            "    var appStore = { subjects: JSON.parse(json) }\n"
+            f"    {source}\n"
+            "    return JSON.stringify(collectFlashcards())\n"
+            "})")
+        if self._fn.isError() or not self._fn.isCallable():
+            raise RuntimeError(f"cannot load collectFlashcards: {self._fn.toString()}")
+
+    def __call__(self, content: str) -> list[dict[str, Any]]:
+        subjects = [{"naam": "", "topics": [{"content": content}]}]
+        result = self._fn.call([json.dumps(subjects)])
+        if result.isError():
+            raise RuntimeError(result.toString())
+        return json.loads(result.toString())
+
+
+# ---------------------------------------------------------------------- #
+#  Shrinking
+# ---------------------------------------------------------------------- #
+
+def shrink(doc: str, fails: Callable[[str], bool], max_tries: int = 2000) -> str:
+    """Remove line chunks from *doc* while *fails* still holds."""
+    lines = doc.splitlines(keepends=True)
+    chunk = max(1, len(lines) // 2)
+    tries = 0
+    while chunk >= 1 and tries < max_tries:
+        i = 0
+        removed = False
+        while i < len(lines) and tries < max_tries:
+            candidate = lines[:i] + lines[i + chunk:]
+            tries += 1
+            if fails("".join(candidate)):
+                lines = candidate
+                removed = True
+            else:
+                i += chunk
+        if not removed:
+            chunk //= 2
+    return "".join(lines)
+
+
+# ---------------------------------------------------------------------- #
+#  Running
+# ---------------------------------------------------------------------- #
+
+class _Throughput:
+    __slots__ = ("bytes", "seconds", "worst", "worst_doc")
+
+    def __init__(self) -> None:
+        self.bytes = 0
+        self.seconds = 0.0
+        self.worst = 0.0
+        self.worst_doc = -1
+
+    def add(self, doc_index: int, size: int, seconds: float) -> None:
+        self.bytes += size
+        self.seconds += seconds
+        if seconds > self.worst:
+            self.worst = seconds
+            self.worst_doc = doc_index
+
+    def line(self, label: str) -> str:
+        rate = self.bytes / self.seconds / 1e6 if self.seconds else 0.0
+        return (f"{label:<18} {rate:8.2f} MB/s, worst {self.worst * 1000:.2f} ms "
+                f"(document {self.worst_doc})")
+
+
+def _timed(fn: Callable[[str], Any], text: str) -> tuple[Any, float]:
+    started = time.perf_counter()
+    result = fn(text)
+    return result, time.perf_counter() - started
+
+
+def scaling(fn: Callable[[str], Any], build: Callable[[int], str],
+            sizes: tuple[int, ...]) -> tuple[list[float], float]:
+    """Best-of-3 times of *fn* on ``build(n)`` and the log-log slope from
+    the smallest to the largest size (1.0 = linear, 2.0 = quadratic)."""
+    times = []
+    for n in sizes:
+        text = build(n)
+        times.append(min(_timed(fn, text)[1] for _ in range(3)))
+    slope = math.log(max(times[-1], 1e-7) / max(times[0], 1e-7)) \
+        / math.log(sizes[-1] / sizes[0])
+    return times, slope
+
+
+def _snippet(value: Any, limit: int = 300) -> str:
+    text = repr(value)
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Entry point for ``main.py conformance``; returns the exit code."""
+    parser = argparse.ArgumentParser(
+        prog="main.py conformance",
+        description="Fuzz the question-block parsers against each other.",
+    )
+    parser.add_argument("-n", "--docs", type=int, default=2000,
+                        help="random documents to generate (default: 2000)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="generator seed (default: random, printed)")
+    parser.add_argument("--no-qml", action="store_true",
+                        help="skip the QML JavaScript parser")
+    parser.add_argument("--max-slope", type=float, default=None,
+                        help="fail when parse time grows faster than n^SLOPE "
+                             "on pathological input (default: report only, "
+                             f"flagging slopes above {_SLOPE_WARN:g})")
+    parser.add_argument("--max-ms", type=float, default=100.0,
+                        help="fail when one random document takes longer "
+                             "to parse (default: 100 ms)")
+    args = parser.parse_args(argv)
+    seed = args.seed if args.seed is not None else random.randrange(2 ** 31)
+    out = sys.stdout
+
+    qml = None if args.no_qml else QmlFlashcards()
+    generator = DocumentGenerator(seed)
+    py_rate, js_rate = _Throughput(), _Throughput()
+    scan_failures: list[str] = []
+    incremental_failures: list[tuple[str, str]] = []
+    qml_failures: list[str] = []
+
+    for index in range(args.docs):
+        doc = generator.document()
+        size = len(doc.encode("utf-8"))
+        _result, seconds = _timed(parse_content, doc)
+        py_rate.add(index, size, seconds)
+        if scanned_blocks(doc) != reference_blocks(doc):
+            scan_failures.append(doc)
+        edited = generator.edit(doc)
+        if incremental_mismatch(doc, edited):
+            incremental_failures.append((doc, edited))
+        if qml is not None:
+            cards, seconds = _timed(qml, doc)
+            js_rate.add(index, size, seconds)
+            if not cards_match(python_flashcards(doc), cards):
+                qml_failures.append(doc)
+
+    failed = False
+    out.write(f"Checked {args.docs} documents (seed {seed}), "
+              f"{py_rate.bytes / 1e6:.2f} MB\n\n")
+    out.write(py_rate.line("parse_content") + "\n")
+    if qml is not None:
+        out.write(js_rate.line("QML flashcards") + "\n")
+    if py_rate.worst * 1000 > args.max_ms:
+        out.write(f"  parse_content exceeded {args.max_ms:g} ms\n")
+        failed = True
+
+    out.write(f"\nScanner vs _BLOCK_RE: {len(scan_failures)} mismatching documents\n")
+    if scan_failures:
+        failed = True
+        doc = shrink(scan_failures[0],
+                     lambda d: scanned_blocks(d) != reference_blocks(d))
+        out.write(f"  shrunk: {_snippet(doc)}\n"
+                  f"  scanner:   {_snippet(scanned_blocks(doc))}\n"
+                  f"  reference: {_snippet(reference_blocks(doc))}\n")
+    out.write(f"Incremental vs full parse: {len(incremental_failures)} mismatching edits\n")
+    if incremental_failures:
+        failed = True
+        doc, edited = incremental_failures[0]
+        out.write(f"  {incremental_mismatch(doc, edited)}\n"
+                  f"  before: {_snippet(doc)}\n"
+                  f"  after:  {_snippet(edited)}\n")
+    if qml is not None:
+        out.write(f"Python vs QML flashcards: {len(qml_failures)} mismatching documents\n")
+        if qml_failures:
+            failed = True
+            doc = shrink(qml_failures[0],
+                         lambda d: not cards_match(python_flashcards(d), qml(d)))
+            out.write(f"  shrunk: {_snippet(doc)}\n"
+                      f"  python: {_snippet(python_flashcards(doc))}\n"
+                      f"  qml:    {_snippet(qml(doc))}\n")
+
+    out.write("\nScaling on pathological input (time slope, 1 = linear):\n")
+    sizes = (2000, 4000, 8000)
+    for name, build in PATHOLOGICAL.items():
+        times, slope = scaling(parse_content, build, sizes)
+        verdict = ""
+        if slope > (args.max_slope if args.max_slope is not None else _SLOPE_WARN):
+            verdict = "  <-- super-linear?"
+            if args.max_slope is not None:
+                verdict = "  <-- super-linear"
+                failed = True
+        out.write(f"  {name:<20} {times[-1] * 1000:9.2f} ms at n={sizes[-1]}, "
+                  f"slope {slope:5.2f}{verdict}\n")
+        if qml is not None:
+            times, slope = scaling(qml, build, sizes)
+            out.write(f"  {'  (QML)':<20} {times[-1] * 1000:9.2f} ms at n={sizes[-1]}, "
+                      f"slope {slope:5.2f}\n")
+    out.flush()
+    return 1 if failed else 0
@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+prefetch.py - Parsed-topic cache and idle-time prefetching of likely-next
+topics.
+
+TopicPage asks the store for a topic's parsed content (markdown with
+placeholders plus QML-ready question dicts).  :class:`ParsedTopicCache`
+keeps the most recently used results; :class:`PrefetchScheduler` fills it
+ahead of time from a priority queue, one topic per event-loop pass, so that
+opening a topic is usually a cache hit.
+
+Priorities, rebuilt once navigation settles (the several store signals a
+single navigation emits are coalesced):
+
+  0. topics of the currently open subject (or of the open topic's
+     subject), starting after the open topic
+  1. the first topic of the next subject in ``volgorde``
+  2. bookmarked topics
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Optional
+
+from PySide6.QtCore import QObject, QTimer, Slot
+
+from src.models.content_parser import parse_content
+from src.models.image_provider import split_images
+from src.models.incremental_parser import IncrementalParser
+from src.models.memory import estimate_size
+
+if TYPE_CHECKING:
+    from src.models.app_store import AppStore
+
+PRIORITY_SUBJECT = 0
+PRIORITY_NEXT = 1
+PRIORITY_BOOKMARK = 2
+
+# Delay before prefetching after a navigation, so the page being opened
+# gets the event loop first.
+_NAVIGATION_GRACE_MS = 150
+
+
+def parse_topic(content: str, parsed: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    """Parse topic *content* into the plain-dict form QML binds to.
+
+    ``blocks`` holds the markdown split around images, which are loaded
+    through the asynchronous image provider.  *parsed* is a ready
+    :func:`parse_content`-style result for *content* to convert instead.
+    """
+    if parsed is None:
+        parsed = parse_content(content)
+    return {
+        "markdown": parsed["markdown"],
+        "blocks": split_images(parsed["markdown"]),
+        "questions": [q.to_variant() for q in parsed["questions"]],
+    }
+
+
+class ParsedTopicCache:
+    """LRU cache of :func:`parse_topic` results keyed by topic id.
+
+    The estimated size of each entry is measured once when it is stored,
+    so :attr:`nbytes` is cheap enough to check against a memory budget
+    after every insertion.  With a *parser*, topics are parsed through it
+    (incrementally, with stable question ids).
+    """
+
+    def __init__(self, parser: Optional[IncrementalParser] = None,
+                 capacity: int = 64) -> None:
+        self.capacity = capacity
+        self._parser = parser
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self.evicted = 0
+
+    def __contains__(self, topic_id: str) -> bool:
+        return topic_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, topic_id: str, content: str) -> dict[str, Any]:
+        """Return the parsed topic, counting a hit or a (cold) miss."""
+        entry = self._entries.get(topic_id)
+        if entry is not None:
+            self._entries.move_to_end(topic_id)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return self._store(topic_id, self._parse(topic_id, content))
+
+    def warm(self, topic_id: str, content: str) -> bool:
+        """Parse *topic_id* ahead of use; returns False if already cached."""
+        if topic_id in self._entries:
+            return False
+        self._store(topic_id, self._parse(topic_id, content))
+        self.prefetched += 1
+        return True
+
+    def _parse(self, topic_id: str, content: str) -> dict[str, Any]:
+        if self._parser is None:
+            return parse_topic(content)
+        return parse_topic(content, self._parser.state(topic_id, content).result())
+
+    def _store(self, topic_id: str, entry: dict[str, Any]) -> dict[str, Any]:
+        self._entries[topic_id] = entry
+        size = estimate_size(entry)
+        self.nbytes += size - self._sizes.get(topic_id, 0)
+        self._sizes[topic_id] = size
+        while len(self._entries) > self.capacity:
+            self._pop_oldest()
+        return entry
+
+    def _pop_oldest(self) -> None:
+        topic_id, _entry = self._entries.popitem(last=False)
+        self.nbytes -= self._sizes.pop(topic_id)
+        self.evicted += 1
+
+    def trim(self, max_bytes: int) -> None:
+        """Evict least recently used entries until at most *max_bytes*
+        remain (estimated)."""
+        while self._entries and self.nbytes > max_bytes:
+            self._pop_oldest()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._sizes.clear()
+        self.nbytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        opens = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": self.hits / opens if opens else 0.0,
+            "prefetched": self.prefetched,
+            "evicted": self.evicted,
+            "cached": len(self._entries),
+            "bytes": self.nbytes,
+        }
+
+
+class PrefetchScheduler(QObject):
+    """Warms :class:`ParsedTopicCache` for likely-next topics while idle."""
+
+    def __init__(self, store: "AppStore", cache: ParsedTopicCache,
+                 parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._store = store
+        self._cache = cache
+        self._queue: list[tuple[int, int, str]] = []
+        self._stale = False  # queue to be rebuilt on the next step
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._step)
+
+        store.currentPageChanged.connect(self.reschedule)
+        store.currentSubjectIdChanged.connect(self.reschedule)
+        store.currentTopicIdChanged.connect(self.reschedule)
+        store.bookmarksChanged.connect(self.reschedule)
+        store.subjectsChanged.connect(self.reschedule)
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    @Slot()
+    def reschedule(self) -> None:
+        """Drop queued work; the queue is rebuilt for the current location
+        once no further change arrives within the navigation grace period,
+        so the signals of one navigation cause a single rebuild."""
+        self._queue = []
+        self._stale = True
+        self._timer.start(_NAVIGATION_GRACE_MS)
+
+    def _rebuild(self) -> None:
+        self._stale = False
+        store = self._store
+        seq = 0
+
+        def push(priority: int, topic_id: str) -> None:
+            nonlocal seq
+            if topic_id and topic_id not in self._cache:
+                self._queue.append((priority, seq, topic_id))
+                seq += 1
+
+        subjects = sorted(store.subject_records, key=lambda s: s.volgorde)
+        subject_id = store.currentSubjectId
+        topic_id = store.currentTopicId
+        topic = store.topic_record(topic_id)
+        if topic is not None and store.currentPage == "topic":
+            # A topic opened from search may belong to another subject
+            subject_id = topic.subjectId
+        position = next(
+            (i for i, s in enumerate(subjects) if s.id == subject_id), None)
+
+        if position is not None:
+            topics = subjects[position].topics
+            start = next(
+                (i + 1 for i, t in enumerate(topics) if t.id == topic_id), 0)
+            for topic in topics[start:] + topics[:start]:
+                if topic.id != topic_id:
+                    push(PRIORITY_SUBJECT, topic.id)
+            for subject in subjects[position + 1:]:
+                if subject.topics:
+                    push(PRIORITY_NEXT, subject.topics[0].id)
+                    break
+
+        for bookmark in store.bookmarks:
+            push(PRIORITY_BOOKMARK, bookmark.get("topicId", ""))
+
+        heapq.heapify(self._queue)
+
+    @Slot()
+    def _step(self) -> None:
+        """Warm one topic, then yield back to the event loop."""
+        if self._stale:
+            self._rebuild()
+        while self._queue:
+            _priority, _seq, topic_id = heapq.heappop(self._queue)
+            topic = self._store.topic_record(topic_id)
+            if topic is not None and self._cache.warm(topic_id, topic.content):
+                self._store.checkMemory()
+                break
+        if self._queue:
+            # A zero timer fires only once pending events are processed,
+            # so prefetching never delays input or painting.
+            self._timer.start(0)
@@ -0,0 +1,257 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+progress.py - Per-question progress stored as bitsets, with an attempt log.
+
+For every topic, :class:`TopicProgress` keeps two bitsets (Python ints):
+bit *i* of ``answered`` is set once question *i* (the stable question id
+from ``incremental_parser.py``) was attempted, and bit *i* of ``correct``
+mirrors whether its latest attempt was correct.  A topic with hundreds of
+questions costs a few dozen bytes.  Bits of questions that were deleted
+from a topic are kept but no longer counted.
+
+:class:`ProgressTracker` maintains the answered/correct counts per topic
+and per subject incrementally, so reading the progress of a subject is a
+dict lookup no matter how many attempts were made.
+
+Attempts are appended to an NDJSON log::
+
+    {"t": "<topic id>", "q": 3, "ok": true, "at": "<iso timestamp>"}
+
+A snapshot of the bitsets (hex encoded) records the log offset it covers,
+so startup replays only the attempts made after the last snapshot.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime
+from typing import Any, Callable
+
+# Rewrite the snapshot after this many logged attempts
+_SNAPSHOT_AFTER = 500
+
+
+class TopicProgress:
+    """Answered/correct bitsets of one topic."""
+
+    __slots__ = ("answered", "correct")
+
+    def __init__(self, answered: int = 0, correct: int = 0) -> None:
+        self.answered = answered
+        self.correct = correct
+
+    def masked(self, mask: int) -> "TopicProgress":
+        """Return the bits for the question ids in bitset *mask* only."""
+        return TopicProgress(self.answered & mask, self.correct & mask)
+
+
+class _Totals:
+    """Aggregated counts of a topic or subject."""
+
+    __slots__ = ("answered", "correct", "total")
+
+    def __init__(self) -> None:
+        self.answered = 0
+        self.correct = 0
+        self.total = 0
+
+    def to_variant(self) -> dict[str, Any]:
+        return {
+            "answered": self.answered,
+            "correct": self.correct,
+            "total": self.total,
+            # Mastery in percent, as ProgressRing expects
+            "percent": 100.0 * self.correct / self.total if self.total else 0.0,
+        }
+
+
+class ProgressTracker:
+    """Bitset progress with incrementally maintained aggregates."""
+
+    def __init__(self) -> None:
+        self._bits: dict[str, TopicProgress] = {}
+        self._topic_subject: dict[str, str] = {}
+        # Bitset of the current question ids, per topic
+        self._question_masks: dict[str, int] = {}
+        self._topic_totals: dict[str, _Totals] = {}
+        self._subject_totals: dict[str, _Totals] = {}
+        self._log: Any = None
+        self._log_path = ""
+        self._snapshot_path = ""
+        self._since_snapshot = 0
+
+    # --- Topic layout ---
+
+    def set_topics(self, topics: list[tuple[str, str]],
+                   question_mask: Callable[[str], int]) -> None:
+        """Load the ``(topic id, subject id)`` layout and rebuild aggregates.
+
+        *question_mask* returns the bitset of the question ids of a topic id.
+        Progress of topics that are not (or no longer) loaded is kept, so it
+        reappears when they are loaded again.
+        """
+        self._topic_subject = dict(topics)
+        self._question_masks = {
+            topic_id: question_mask(topic_id) for topic_id, _subject_id in topics
+        }
+        self._aggregate()
+
+    def _aggregate(self) -> None:
+        """Recompute all topic and subject totals from the bitsets."""
+        self._topic_totals = {}
+        self._subject_totals = {}
+        for topic_id, subject_id in self._topic_subject.items():
+            totals = _Totals()
+            mask = self._question_masks[topic_id]
+            totals.total = mask.bit_count()
+            bits = self._bits.get(topic_id)
+            if bits is not None:
+                # Ignore ids of questions the topic no longer has
+                bits = bits.masked(mask)
+                totals.answered = bits.answered.bit_count()
+                totals.correct = bits.correct.bit_count()
+            self._topic_totals[topic_id] = totals
+            subject = self._subject_totals.setdefault(subject_id, _Totals())
+            subject.answered += totals.answered
+            subject.correct += totals.correct
+            subject.total += totals.total
+
+    # --- Recording ---
+
+    def _apply(self, topic_id: str, question_id: int, correct: bool) -> bool:
+        """Update the bitsets and aggregates; returns True if they changed."""
+        bits = self._bits.get(topic_id)
+        if bits is None:
+            bits = self._bits[topic_id] = TopicProgress()
+        bit = 1 << question_id
+        was_answered = bool(bits.answered & bit)
+        was_correct = bool(bits.correct & bit)
+        bits.answered |= bit
+        if correct:
+            bits.correct |= bit
+        else:
+            bits.correct &= ~bit
+        if was_answered and was_correct == correct:
+            return False
+
+        totals = self._topic_totals.get(topic_id)
+        if totals is None or not self._question_masks[topic_id] & bit:
+            return True
+        d_answered = 0 if was_answered else 1
+        d_correct = int(correct) - int(was_correct)
+        totals.answered += d_answered
+        totals.correct += d_correct
+        subject = self._subject_totals.get(self._topic_subject.get(topic_id, ""))
+        if subject is not None:
+            subject.answered += d_answered
+            subject.correct += d_correct
+        return True
+
+    def record(self, topic_id: str, question_id: int, correct: bool) -> bool:
+        """Record an attempt; returns True if the aggregates changed."""
+        if question_id < 0:
+            return False
+        changed = self._apply(topic_id, question_id, correct)
+        if self._log is not None:
+            self._log.write(json.dumps({
+                "t": topic_id, "q": question_id, "ok": correct,
+                "at": datetime.now().isoformat(),
+            }, ensure_ascii=False) + "\n")
+            self._log.flush()
+            self._since_snapshot += 1
+            if self._since_snapshot >= _SNAPSHOT_AFTER:
+                self._write_snapshot()
+        return changed
+
+    # --- Queries ---
+
+    def recorded_topics(self) -> list[str]:
+        """Ids of the topics with at least one attempt."""
+        return [topic_id for topic_id, bits in self._bits.items() if bits.answered]
+
+    def topic(self, topic_id: str) -> dict[str, Any]:
+        return self._topic_totals.get(topic_id, _Totals()).to_variant()
+
+    def subject(self, subject_id: str) -> dict[str, Any]:
+        return self._subject_totals.get(subject_id, _Totals()).to_variant()
+
+    def question_state(self, topic_id: str, question_id: int) -> int:
+        """0 = not answered, 1 = answered wrong last time, 2 = correct."""
+        bits = self._bits.get(topic_id)
+        if bits is None or not bits.answered >> question_id & 1:
+            return 0
+        return 2 if bits.correct >> question_id & 1 else 1
+
+    # --- Persistence ---
+
+    def open(self, log_path: str) -> None:
+        """Restore progress from *log_path* (and its snapshot), then log to it."""
+        self._log_path = log_path
+        self._snapshot_path = log_path + ".snapshot"
+        offset = self._read_snapshot()
+        torn = False
+        try:
+            with open(log_path, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    torn = not line.endswith(b"\n")
+                    try:
+                        record = json.loads(line)
+                        self._apply(record["t"], int(record["q"]), bool(record["ok"]))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
+        os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+        self._log = open(log_path, "a", encoding="utf-8")
+        if torn:
+            # Terminate a line torn by a crash so new records stay parseable
+            self._log.write("\n")
+        self._write_snapshot()
+        self._aggregate()
+
+    def _read_snapshot(self) -> int:
+        try:
+            with open(self._snapshot_path, encoding="utf-8") as f:
+                data = json.load(f)
+            bits = {
+                topic_id: TopicProgress(int(a, 16), int(c, 16))
+                for topic_id, (a, c) in data["topics"].items()
+            }
+            offset = int(data["offset"])
+            if offset > os.path.getsize(self._log_path):
+                return 0  # log was replaced; replay it all
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0
+        self._bits.update(bits)
+        return offset
+
+    def _write_snapshot(self) -> None:
+        if self._log is None:
+            return
+        self._log.flush()
+        data = {
+            "offset": os.fstat(self._log.fileno()).st_size,
+            "topics": {
+                topic_id: [format(b.answered, "x"), format(b.correct, "x")]
+                for topic_id, b in self._bits.items() if b.answered
+            },
+        }
+        tmp_path = self._snapshot_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._snapshot_path)
+            self._since_snapshot = 0
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        if self._log is not None:
+            self._write_snapshot()
+            self._log.close()
+            self._log = None
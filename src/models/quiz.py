@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+quiz.py - Indexed assembly of randomised "toets" (quiz) question sets.
+
+:class:`QuestionIndex` parses every topic once and groups the resulting
+question records by ``(subject id, topic id, question type)``.  Assembling
+a quiz then only touches the matching groups ("strata"): questions are drawn
+round-robin over the strata in random order, so every selected subject,
+topic and type is represented, and each draw comes from a lazy Fisher-Yates
+shuffle.  A quiz of N questions costs O(N + strata) regardless of how much
+content is loaded, plus one step per skipped (recently answered) question.
+
+Questions are identified across topics by ``"<topic id>:<question id>"``.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Callable, Collection, Iterable, Optional
+
+from src.models.content_parser import parse_content
+from src.models.memory import estimate_size
+from src.models.records import Question, Subject, Topic
+
+StratumKey = tuple[str, str, str]
+
+
+def question_key(topic_id: str, question_id: int) -> str:
+    """Return the corpus-wide key of question *question_id* in *topic_id*."""
+    return f"{topic_id}:{question_id}"
+
+
+class QuestionIndex:
+    """Parsed questions grouped by ``(subject id, topic id, type)``.
+
+    The index is built lazily on first use and dropped by
+    :meth:`invalidate` when the subjects change.  *parse* returns the
+    questions of a topic (default: ``parse_content``).  :attr:`nbytes`,
+    the estimated size of the built strata, is measured once per build.
+    """
+
+    def __init__(self, parse: Optional[Callable[[Topic], list[Question]]] = None) -> None:
+        self._strata: Optional[dict[StratumKey, list[Question]]] = None
+        self._subjects: list[Subject] = []
+        self._parse = parse or (lambda topic: parse_content(topic.content)["questions"])
+        self.nbytes = 0
+
+    def invalidate(self, subjects: list[Subject]) -> None:
+        self._subjects = subjects
+        self.drop()
+
+    @property
+    def built(self) -> Optional[dict[StratumKey, list[Question]]]:
+        """The strata if they have been built, without building them."""
+        return self._strata
+
+    def drop(self) -> None:
+        """Release the strata; they are rebuilt on next use."""
+        self._strata = None
+        self.nbytes = 0
+
+    @property
+    def strata(self) -> dict[StratumKey, list[Question]]:
+        if self._strata is None:
+            self._strata = self._build(self._subjects)
+            self.nbytes = estimate_size(self._strata)
+        return self._strata
+
+    def _build(self, subjects: Iterable[Subject]) -> dict[StratumKey, list[Question]]:
+        strata: dict[StratumKey, list[Question]] = {}
+        for subject in subjects:
+            for topic in subject.topics:
+                for question in self._parse(topic):
+                    key = (subject.id, topic.id, question.type)
+                    strata.setdefault(key, []).append(question)
+        return strata
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self.strata.values())
+
+    def select(self, subject_ids: Collection[str] = (),
+               topic_ids: Collection[str] = (),
+               types: Collection[str] = ()) -> list[StratumKey]:
+        """Return the strata matching the filters; empty filters match all."""
+        return [
+            key for key in self.strata
+            if (not subject_ids or key[0] in subject_ids)
+            and (not topic_ids or key[1] in topic_ids)
+            and (not types or key[2] in types)
+        ]
+
+
+class _LazyShuffle:
+    """Draws items of *items* in random order without copying the list.
+
+    A Fisher-Yates shuffle where swapped positions are kept in a dict, so
+    drawing k items costs O(k) no matter how long *items* is.
+    """
+
+    __slots__ = ("_items", "_rng", "_swapped", "_next")
+
+    def __init__(self, items: list[Question], rng: random.Random) -> None:
+        self._items = items
+        self._rng = rng
+        self._swapped: dict[int, int] = {}
+        self._next = 0
+
+    def draw(self) -> Optional[Question]:
+        n = len(self._items)
+        if self._next >= n:
+            return None
+        i = self._next
+        j = self._rng.randrange(i, n)
+        picked = self._swapped.get(j, j)
+        self._swapped[j] = self._swapped.get(i, i)
+        self._next += 1
+        return self._items[picked]
+
+
+def assemble_quiz(index: QuestionIndex, count: int, *,
+                  subject_ids: Collection[str] = (),
+                  topic_ids: Collection[str] = (),
+                  types: Collection[str] = (),
+                  seed: Optional[int] = None,
+                  exclude: Collection[str] = ()) -> list[dict[str, Any]]:
+    """Assemble up to *count* questions as QML-ready dicts.
+
+    The same *seed* and index always give the same quiz.  Questions whose
+    key is in *exclude* are skipped.  Each dict is the question's variant
+    plus ``key``, ``subjectId`` and ``topicId``.
+    """
+    rng = random.Random(seed)
+    strata = index.strata
+    keys = index.select(subject_ids, topic_ids, types)
+    rng.shuffle(keys)
+    draws = [(key, _LazyShuffle(strata[key], rng)) for key in keys]
+
+    picked: list[tuple[StratumKey, Question]] = []
+    while draws and len(picked) < count:
+        remaining = []
+        for key, draw in draws:
+            if len(picked) >= count:
+                break
+            question = draw.draw()
+            while question is not None and question_key(key[1], question.id) in exclude:
+                question = draw.draw()
+            if question is not None:
+                picked.append((key, question))
+                remaining.append((key, draw))
+        draws = remaining
+
+    # Round-robin order would cycle through the strata; mix it up
+    rng.shuffle(picked)
+    quiz = []
+    for (subject_id, topic_id, _type), question in picked:
+        item = question.to_variant()
+        item["key"] = question_key(topic_id, question.id)
+        item["subjectId"] = subject_id
+        item["topicId"] = topic_id
+        quiz.append(item)
+    return quiz
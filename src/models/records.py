@@ -0,0 +1,193 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+records.py - Compact slotted records for questions, topics and subjects.
+
+A large corpus holds hundreds of thousands of parsed questions.  As plain
+dicts each one carries a hash table plus its own key references; these
+records store only their field values in ``__slots__``, and the question
+``type`` lives on the class, so it costs nothing per instance.
+
+Records are read-only :class:`~collections.abc.Mapping` objects, so existing
+code using ``q["vraag"]``, ``q.get("type")`` or ``dict(q)`` keeps working.
+QML cannot see into arbitrary Python objects, so records are converted to
+plain dicts with :meth:`Record.to_variant` only when they cross into QML.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+# Interned question type names.  Each question class refers to one of these
+# as a class attribute, so every instance shares the same string object.
+MEERKEUZE = sys.intern("meerkeuze")
+INVULLEN = sys.intern("invullen")
+WAAR_OF_NIET = sys.intern("waar-of-niet")
+KOPPELEN = sys.intern("koppelen")
+OPEN = sys.intern("open")
+
+QUESTION_TYPES = (MEERKEUZE, INVULLEN, WAAR_OF_NIET, KOPPELEN, OPEN)
+
+
+def _to_variant(value: Any) -> Any:
+    """Recursively convert records (and lists of them) to plain containers."""
+    if isinstance(value, Record):
+        return value.to_variant()
+    if isinstance(value, (list, tuple)):
+        return [_to_variant(v) for v in value]
+    return value
+
+
+class Record(Mapping):
+    """Base class: a fixed set of keys backed by ``__slots__`` attributes.
+
+    Subclasses declare ``_keys`` (the mapping keys, in order) and ``_init``
+    (the positional constructor fields, a subset of ``_keys`` stored in
+    slots).  Keys outside ``_init`` are class attributes.
+    """
+
+    __slots__ = ()
+    _keys: tuple[str, ...] = ()
+    _init: tuple[str, ...] = ()
+
+    def __init__(self, *values: Any) -> None:
+        for name, value in zip(self._init, values):
+            setattr(self, name, value)
+
+    # --- Mapping protocol ---
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._keys:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._init:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={getattr(self, k)!r}" for k in self._keys)
+        return f"{type(self).__name__}({fields})"
+
+    # --- Conversion ---
+
+    def to_variant(self) -> dict[str, Any]:
+        """Return a plain dict (with nested records converted) for QML."""
+        return {k: _to_variant(getattr(self, k)) for k in self._keys}
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "Record":
+        """Build a record from any mapping; missing keys become ``""``."""
+        if isinstance(data, cls):
+            return data
+        return cls(*(data.get(k, "") for k in cls._init))
+
+
+# ---------------------------------------------------------------------- #
+#  Questions
+# ---------------------------------------------------------------------- #
+
+class Pair(Record):
+    """One term/definition pair of a ``koppelen`` question."""
+
+    __slots__ = ("term", "definitie")
+    _keys = _init = ("term", "definitie")
+
+
+class Question(Record):
+    """Common base of all question records; ``type`` is per class."""
+
+    __slots__ = ("id",)
+    type: str = ""
+
+
+class MeerkeuzeQuestion(Question):
+    __slots__ = ("vraag", "opties", "correct", "uitleg")
+    type = MEERKEUZE
+    _init = ("id", "vraag", "opties", "correct", "uitleg")
+    _keys = ("type",) + _init
+
+
+class InvullenQuestion(Question):
+    __slots__ = ("vraag", "antwoord", "hint")
+    type = INVULLEN
+    _init = ("id", "vraag", "antwoord", "hint")
+    _keys = ("type",) + _init
+
+
+class WaarOfNietQuestion(Question):
+    __slots__ = ("vraag", "antwoord", "uitleg")
+    type = WAAR_OF_NIET
+    _init = ("id", "vraag", "antwoord", "uitleg")
+    _keys = ("type",) + _init
+
+
+class KoppelenQuestion(Question):
+    __slots__ = ("vraag", "paren")
+    type = KOPPELEN
+    _init = ("id", "vraag", "paren")
+    _keys = ("type",) + _init
+
+
+class OpenQuestion(Question):
+    __slots__ = ("vraag", "kernwoorden")
+    type = OPEN
+    _init = ("id", "vraag", "kernwoorden")
+    _keys = ("type",) + _init
+
+
+QUESTION_CLASSES: dict[str, type[Question]] = {
+    cls.type: cls
+    for cls in (MeerkeuzeQuestion, InvullenQuestion, WaarOfNietQuestion,
+                KoppelenQuestion, OpenQuestion)
+}
+
+
+# ---------------------------------------------------------------------- #
+#  Topics and subjects
+# ---------------------------------------------------------------------- #
+
+class Topic(Record):
+    __slots__ = ("id", "subjectId", "titel", "content", "slug")
+    _keys = _init = ("id", "subjectId", "titel", "content", "slug")
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "Topic":
+        if isinstance(data, cls):
+            return data
+        return cls(
+            str(data.get("id", "")),
+            # Shared by every topic of a subject; intern to store it once.
+            sys.intern(str(data.get("subjectId", ""))),
+            data.get("titel", ""),
+            data.get("content", ""),
+            data.get("slug", ""),
+        )
+
+
+class Subject(Record):
+    __slots__ = ("id", "naam", "icon", "volgorde", "topics")
+    _keys = _init = ("id", "naam", "icon", "volgorde", "topics")
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "Subject":
+        if isinstance(data, cls):
+            return data
+        return cls(
+            sys.intern(str(data.get("id", ""))),
+            data.get("naam", ""),
+            data.get("icon", ""),
+            int(data.get("volgorde", 0) or 0),
+            [Topic.from_mapping(t) for t in data.get("topics", [])],
+        )
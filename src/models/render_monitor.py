@@ -0,0 +1,233 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+render_monitor.py - Render-loop activity and the inputs of low-power mode.
+
+:class:`RenderMonitor` watches the main window and reports to the store:
+
+- the window is *idle* when it is unfocused, minimized or hidden, or when
+  no input arrived for :data:`IDLE_AFTER_S` seconds; ``AppStore`` then
+  pauses decorative looping animations (``animationsActive``), so a
+  static page renders no frames at all;
+- the hardware is *slow* when frames of continuous animation arrive at
+  less than :data:`SLOW_FPS` (or 80% of the screen's refresh rate, if
+  that is lower, so a 30 Hz display is not mistaken for slow hardware);
+  in the ``"auto"`` power mode ``AppStore`` then switches to
+  ``lowPower`` and transitions are skipped.  The verdict has hysteresis:
+  it is lifted once a fresh set of samples runs well above the threshold.
+  Low-power mode itself stops most of the animations that would provide
+  those samples, so the verdict also expires after
+  :data:`SLOW_RECHECK_S` seconds and is judged again on a trial with
+  animations on; each time the trial confirms it, the next expiry comes
+  twice as late (up to :data:`_SLOW_RECHECK_MAX_S`).  It is re-judged from
+  scratch when the window moves to another screen or
+  :meth:`RenderMonitor.resetSlowHardware` is called.
+
+Idle detection uses a single-shot timer that is only rearmed when it
+fires, so neither input nor idleness costs a periodic wakeup.  Frames are
+counted from ``frameSwapped`` over a queued connection (see
+``nav_metrics.py``).
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Optional
+
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer, Slot
+from PySide6.QtGui import QWindow
+
+if TYPE_CHECKING:
+    from src.models.app_store import AppStore
+
+# Seconds without input before the window counts as idle
+IDLE_AFTER_S = 30.0
+
+# Frames closer together than this belong to one continuous animation
+_BURST_GAP_S = 0.1
+# Burst frame intervals needed before judging the hardware, and kept
+_SLOW_MIN_SAMPLES = 120
+_SLOW_MAX_SAMPLES = 480
+SLOW_FPS = 30.0
+# Fraction of the screen refresh rate below which frames count as slow
+_SLOW_REFRESH_FRACTION = 0.8
+# Slow hardware is cleared again above this multiple of the threshold
+_RECOVER_FACTOR = 1.25
+# Seconds after which a slow verdict is put on trial again; doubled each
+# time the trial confirms it, up to the maximum
+SLOW_RECHECK_S = 120.0
+_SLOW_RECHECK_MAX_S = 1920.0
+
+# Window of frame timestamps used for the current frame rate
+_FPS_WINDOW_S = 5.0
+
+_INPUT_EVENTS = frozenset({
+    QEvent.Type.MouseMove, QEvent.Type.MouseButtonPress, QEvent.Type.Wheel,
+    QEvent.Type.KeyPress, QEvent.Type.TouchBegin, QEvent.Type.TabletPress,
+})
+
+
+class RenderMonitor(QObject):
+    """Tracks frames, input and focus of a window; exposed to QML as
+    ``renderMonitor``."""
+
+    def __init__(self, store: "AppStore", parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._store = store
+        self._window: Optional[QWindow] = None
+
+        self._frames = 0
+        self._frames_idle = 0
+        self._last_frame = 0.0
+        self._recent: deque[float] = deque()
+        self._intervals: deque[float] = deque(maxlen=_SLOW_MAX_SAMPLES)
+
+        self._last_input = time.monotonic()
+        self._inactive = False
+        self._input_idle = False
+        self._idle_since: Optional[float] = None
+        self._idle_total = 0.0
+
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.timeout.connect(self._check_input_idle)
+
+        self._recheck_s = SLOW_RECHECK_S
+        self._recheck_timer = QTimer(self)
+        self._recheck_timer.setSingleShot(True)
+        self._recheck_timer.timeout.connect(self._retry_hardware)
+
+    def attach(self, window: QWindow) -> None:
+        self._window = window
+        window.installEventFilter(self)
+        window.frameSwapped.connect(self._on_frame_swapped,
+                                    Qt.ConnectionType.QueuedConnection)
+        window.activeChanged.connect(self._update_window_state)
+        window.visibilityChanged.connect(self._update_window_state)
+        window.screenChanged.connect(self.resetSlowHardware)
+        self._update_window_state()
+        self._idle_timer.start(int(IDLE_AFTER_S * 1000))
+
+    # --- Idle detection ---
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() in _INPUT_EVENTS:
+            self._last_input = time.monotonic()
+            if self._input_idle:
+                self._input_idle = False
+                self._publish_idle()
+                self._idle_timer.start(int(IDLE_AFTER_S * 1000))
+        return False
+
+    @Slot()
+    def _check_input_idle(self) -> None:
+        remaining = self._last_input + IDLE_AFTER_S - time.monotonic()
+        if remaining > 0:
+            self._idle_timer.start(int(remaining * 1000) + 1)
+        else:
+            self._input_idle = True
+            self._publish_idle()
+
+    @Slot()
+    def _update_window_state(self) -> None:
+        window = self._window
+        self._inactive = window is None or not window.isActive() or window.visibility() in (
+            QWindow.Visibility.Hidden, QWindow.Visibility.Minimized)
+        self._publish_idle()
+
+    def _publish_idle(self) -> None:
+        idle = self._inactive or self._input_idle
+        now = time.monotonic()
+        if idle and self._idle_since is None:
+            self._idle_since = now
+        elif not idle and self._idle_since is not None:
+            self._idle_total += now - self._idle_since
+            self._idle_since = None
+        self._store.setWindowIdle(idle)
+
+    # --- Frames ---
+
+    @Slot()
+    def _on_frame_swapped(self) -> None:
+        now = time.monotonic()
+        self._frames += 1
+        if self._idle_since is not None:
+            self._frames_idle += 1
+        if self._last_frame and now - self._last_frame < _BURST_GAP_S:
+            self._intervals.append(now - self._last_frame)
+            if len(self._intervals) >= _SLOW_MIN_SAMPLES:
+                self._judge_hardware()
+        self._last_frame = now
+        self._recent.append(now)
+        while self._recent and self._recent[0] < now - _FPS_WINDOW_S:
+            self._recent.popleft()
+
+    def _slow_fps(self) -> float:
+        screen = self._window.screen() if self._window is not None else None
+        refresh = screen.refreshRate() if screen is not None else 0.0
+        if refresh > 0:
+            return min(SLOW_FPS, refresh * _SLOW_REFRESH_FRACTION)
+        return SLOW_FPS
+
+    def _judge_hardware(self) -> None:
+        fps = 1.0 / max(statistics.median(self._intervals), 1e-6)
+        threshold = self._slow_fps()
+        slow = self._store.slowHardware
+        if not slow and fps < threshold:
+            slow = True
+            self._recheck_timer.start(int(self._recheck_s * 1000))
+            self._recheck_s = min(self._recheck_s * 2, _SLOW_RECHECK_MAX_S)
+        elif slow and fps >= threshold * _RECOVER_FACTOR:
+            slow = False
+            self._recheck_timer.stop()
+            self._recheck_s = SLOW_RECHECK_S
+        else:
+            if not slow:
+                # Fast enough on a full set of samples: the trial passed
+                self._recheck_s = SLOW_RECHECK_S
+            return
+        # Judge the new state on fresh samples only
+        self._intervals.clear()
+        self._store.setSlowHardware(slow)
+
+    @Slot()
+    def _retry_hardware(self) -> None:
+        """Lift an expired slow verdict so animations run and are judged
+        again; it returns (with a longer expiry) if they are still slow."""
+        self._intervals.clear()
+        self._store.setSlowHardware(False)
+
+    @Slot()
+    def resetSlowHardware(self) -> None:
+        """Forget the frame samples and the slow-hardware verdict, e.g.
+        after the window moved to another screen."""
+        self._intervals.clear()
+        self._recheck_timer.stop()
+        self._recheck_s = SLOW_RECHECK_S
+        self._store.setSlowHardware(False)
+
+    @Slot(result="QVariant")
+    def stats(self) -> Any:
+        """Return render-loop activity: total frames, frames rendered while
+        idle, the recent frame rate, the median frame interval during
+        animations and the time spent idle."""
+        now = time.monotonic()
+        recent = [t for t in self._recent if t >= now - _FPS_WINDOW_S]
+        idle_total = self._idle_total
+        if self._idle_since is not None:
+            idle_total += now - self._idle_since
+        return {
+            "frames": self._frames,
+            "framesWhileIdle": self._frames_idle,
+            "recentFps": len(recent) / _FPS_WINDOW_S,
+            "animationFrameMs": (statistics.median(self._intervals) * 1000.0
+                                 if self._intervals else 0.0),
+            "idle": self._idle_since is not None,
+            "idleSeconds": idle_total,
+            "slowHardware": self._store.slowHardware,
+            "lowPower": self._store.lowPower,
+        }
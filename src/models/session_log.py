@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+session_log.py - Append-only log of recorded study sessions.
+
+Sessions are rare (one per focus period), so every append opens the file,
+writes one NDJSON line per session, syncs it to disk and closes it again.
+A session is therefore durable once :meth:`SessionLog.append` returns
+True, and there is no open file to close at shutdown: the study timer
+records the unfinished session from ``aboutToQuit``, possibly after other
+logs were closed.
+
+Records::
+
+    {"id": ..., "subjectId": ..., "startedAt": "<iso timestamp>",
+     "duration": <seconds>}
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Iterable
+
+
+class SessionLog:
+    """NDJSON file of study sessions, replayed at startup."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._torn = False
+
+    def replay(self) -> list[dict[str, Any]]:
+        """Return the logged sessions; a torn last line is skipped."""
+        sessions = []
+        try:
+            f = open(self.path, "rb")
+        except OSError:
+            return []
+        with f:
+            for line in f:
+                self._torn = not line.endswith(b"\n")
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and record.get("id"):
+                    sessions.append(record)
+        return sessions
+
+    def append(self, sessions: Iterable[dict[str, Any]]) -> bool:
+        """Write *sessions* durably; returns False if that failed."""
+        lines = "".join(json.dumps(s, ensure_ascii=False) + "\n" for s in sessions)
+        if not lines:
+            return True
+        if self._torn:
+            # Terminate a line torn by a crash so new records stay parseable
+            lines = "\n" + lines
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError:
+            return False
+        self._torn = False
+        return True
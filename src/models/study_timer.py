@@ -0,0 +1,282 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+study_timer.py - Pomodoro timer service backed by ``time.monotonic``.
+
+Elapsed time is derived from the monotonic clock instead of counting timer
+ticks, so it stays exact regardless of how often (or rarely) the service
+wakes up:
+
+- While a timer display is visible, it wakes once per displayed second to
+  update ``remainingSeconds``.
+- Otherwise it wakes only to checkpoint the running session and to finish
+  it, so a session running in the background costs almost no CPU.
+
+Running focus sessions are checkpointed to a small JSON file.  Focus time
+from a session interrupted by quitting or a crash is still recorded (up to
+the last checkpoint) through ``AppStore.record_session``, which takes a
+duration in seconds.  The checkpoint is only removed once the session was
+written to the session log, so a failed write is retried at the next start.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import time
+from typing import Optional
+
+from PySide6.QtCore import QObject, Property, QTimer, Signal, Slot
+
+from src.models.app_store import AppStore
+
+FOCUS_SECONDS = 25 * 60
+PAUZE_SECONDS = 5 * 60
+
+# How often a running focus session is checkpointed to disk
+_CHECKPOINT_INTERVAL_MS = 30_000
+
+
+class StudyTimer(QObject):
+    """Focus/pause countdown exposed to QML as ``studyTimer``."""
+
+    # Signals
+    modeChanged = Signal()
+    runningChanged = Signal()
+    remainingSecondsChanged = Signal()
+    sessionCompleted = Signal(str)
+
+    def __init__(self, store: AppStore, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._store = store
+        self._mode: str = "focus"
+        self._running: bool = False
+        self._accumulated: float = 0.0          # seconds before _started_at
+        self._started_at: float = 0.0           # time.monotonic() of last start
+        self._subject_id: str = ""
+        self._remaining: int = FOCUS_SECONDS
+        self._display_active: bool = False
+        self._checkpoint_path: str = ""
+
+        # Fires at the next displayed-second boundary or at the session end
+        self._wake = QTimer(self)
+        self._wake.setSingleShot(True)
+        self._wake.timeout.connect(self._on_wake)
+
+        self._checkpoint_timer = QTimer(self)
+        self._checkpoint_timer.setInterval(_CHECKPOINT_INTERVAL_MS)
+        self._checkpoint_timer.timeout.connect(self._write_checkpoint)
+
+    # ── Properties ────────────────────────────────────────────────────
+
+    @Property(str, notify=modeChanged)
+    def mode(self) -> str:
+        """``"focus"`` or ``"pauze"``."""
+        return self._mode
+
+    @Property(bool, notify=runningChanged)
+    def running(self) -> bool:
+        return self._running
+
+    @Property(int, notify=modeChanged)
+    def totalSeconds(self) -> int:
+        return FOCUS_SECONDS if self._mode == "focus" else PAUZE_SECONDS
+
+    @Property(int, notify=remainingSecondsChanged)
+    def remainingSeconds(self) -> int:
+        return self._remaining
+
+    # ── Clock ─────────────────────────────────────────────────────────
+
+    def elapsed(self) -> float:
+        """Exact seconds counted in the current session."""
+        if self._running:
+            return self._accumulated + (time.monotonic() - self._started_at)
+        return self._accumulated
+
+    def _update_remaining(self) -> float:
+        """Refresh ``remainingSeconds``; returns the exact remaining time."""
+        left = max(0.0, self.totalSeconds - self.elapsed())
+        remaining = math.ceil(left)
+        if remaining != self._remaining:
+            self._remaining = remaining
+            self.remainingSecondsChanged.emit()
+        return left
+
+    def _schedule(self) -> None:
+        """Arm the wake timer for the next moment anything must happen."""
+        self._wake.stop()
+        if not self._running:
+            return
+        left = self._update_remaining()
+        if self._display_active:
+            # Wake when the displayed (rounded-up) second changes
+            delay = left - math.floor(left - 1e-6) if left > 0 else 0.0
+        else:
+            delay = left
+        self._wake.start(max(0, math.ceil(delay * 1000)))
+
+    @Slot()
+    def _on_wake(self) -> None:
+        if not self._running:
+            return
+        if self.totalSeconds - self.elapsed() <= 0:
+            self._complete()
+        else:
+            self._schedule()
+
+    # ── Slots ─────────────────────────────────────────────────────────
+
+    @Slot()
+    def start(self) -> None:
+        if self._running:
+            return
+        if self._accumulated == 0.0:
+            self._subject_id = self._store.currentSubjectId
+        self._started_at = time.monotonic()
+        self._running = True
+        self.runningChanged.emit()
+        if self._mode == "focus":
+            self._checkpoint_timer.start()
+            self._write_checkpoint()
+        self._schedule()
+
+    @Slot()
+    def pause(self) -> None:
+        if not self._running:
+            return
+        self._accumulated = self.elapsed()
+        self._running = False
+        self.runningChanged.emit()
+        self._wake.stop()
+        self._checkpoint_timer.stop()
+        self._write_checkpoint()
+        self._update_remaining()
+
+    @Slot()
+    def toggle(self) -> None:
+        """Start when paused, pause when running."""
+        if self._running:
+            self.pause()
+        else:
+            self.start()
+
+    @Slot()
+    def reset(self) -> None:
+        """Discard the current session without recording it."""
+        was_running = self._running
+        self._running = False
+        self._accumulated = 0.0
+        self._wake.stop()
+        self._checkpoint_timer.stop()
+        self._clear_checkpoint()
+        if was_running:
+            self.runningChanged.emit()
+        self._update_remaining()
+
+    @Slot(str)
+    def switchMode(self, mode: str) -> None:
+        if mode == self._mode or mode not in ("focus", "pauze"):
+            return
+        self.reset()
+        self._mode = mode
+        self.modeChanged.emit()
+        self._update_remaining()
+
+    @Slot(bool)
+    def setDisplayActive(self, active: bool) -> None:
+        """Tell the service whether a timer display is currently visible."""
+        if active != self._display_active:
+            self._display_active = active
+            self._schedule()
+
+    # ── Completion ────────────────────────────────────────────────────
+
+    def _complete(self) -> None:
+        mode = self._mode
+        self._running = False
+        self._wake.stop()
+        self._checkpoint_timer.stop()
+        if mode == "focus":
+            self._record(self.totalSeconds, self._subject_id)
+        else:
+            self._clear_checkpoint()
+        self._accumulated = 0.0
+        self.runningChanged.emit()
+        self._remaining = self.totalSeconds
+        self.remainingSecondsChanged.emit()
+        self.sessionCompleted.emit(mode)
+
+    def shutdown(self) -> None:
+        """Record the focus time of an unfinished session before quitting."""
+        seconds = self.elapsed()
+        self._running = False
+        self._accumulated = 0.0
+        self._wake.stop()
+        self._checkpoint_timer.stop()
+        if self._mode == "focus":
+            self._record(seconds, self._subject_id)
+        else:
+            self._clear_checkpoint()
+
+    def _record(self, seconds: float, subject_id: str) -> None:
+        """Record *seconds* of focus time, then drop the checkpoint.
+
+        If the session could not be persisted, the checkpoint is rewritten
+        to hold exactly this session instead, so it is recorded next start.
+        """
+        duration = int(round(seconds))
+        if duration <= 0 or self._store.record_session(subject_id, duration):
+            self._clear_checkpoint()
+        else:
+            self._save_checkpoint(subject_id, seconds)
+
+    # ── Checkpoints ───────────────────────────────────────────────────
+
+    def openCheckpoint(self, path: str) -> None:
+        """Use *path* for checkpoints, recording any session left behind
+        by a crash (its focus time up to the last checkpoint)."""
+        self._checkpoint_path = path
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            seconds = float(data.get("elapsed", 0))
+            subject_id = str(data.get("subjectId", ""))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, AttributeError):
+            self._clear_checkpoint()  # unreadable; nothing to recover
+            return
+        self._record(seconds, subject_id)
+
+    @Slot()
+    def _write_checkpoint(self) -> None:
+        if self._mode == "focus":
+            self._save_checkpoint(self._subject_id, self.elapsed())
+
+    def _save_checkpoint(self, subject_id: str, seconds: float) -> None:
+        if not self._checkpoint_path:
+            return
+        data = {
+            "subjectId": subject_id,
+            "elapsed": seconds,
+            "savedAt": time.time(),
+        }
+        tmp_path = self._checkpoint_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self._checkpoint_path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._checkpoint_path)
+        except OSError:
+            pass
+
+    def _clear_checkpoint(self) -> None:
+        if self._checkpoint_path:
+            try:
+                os.remove(self._checkpoint_path)
+            except OSError:
+                pass
@@ -6,23 +6,24 @@
 updater.py - Auto-update checker for StudyToday.
 
 Checks GitHub Releases for new versions, downloads the appropriate binary,
-and replaces the running executable.
+and replaces the running executable.  Network work runs on the shared
+NetworkManager; results come back as queued signals, so all state changes
+happen on the GUI thread.
 """
 
 from __future__ import annotations
 
-import json
 import os
 import platform
 import stat
 import sys
 import tempfile
-import threading
-import urllib.request
-from typing import Optional
+from typing import Any, Optional
 
 from PySide6.QtCore import QObject, Property, Signal, Slot
 
+from src.models.network import NetworkManager, NetworkTask
+
 APP_VERSION = "1.0.0"
 
 GITHUB_REPO = "compiledkernel-idk/StudyToday"
@@ -49,8 +50,16 @@ class AppUpdater(QObject):
     downloadProgressChanged = Signal()
     updateStatusChanged = Signal()
 
-    def __init__(self, parent: Optional[QObject] = None) -> None:
+    def __init__(
+        self,
+        network: Optional[NetworkManager] = None,
+        parent: Optional[QObject] = None,
+        release_url: str = GITHUB_API_URL,
+    ) -> None:
         super().__init__(parent)
+        self._network = network if network is not None else NetworkManager(parent=self)
+        self._release_url = release_url
+        self._download_task: Optional[NetworkTask] = None
         self._update_available: bool = False
         self._latest_version: str = APP_VERSION
         self._download_progress: float = 0.0
@@ -87,6 +96,7 @@ class AppUpdater(QObject):
             self._update_status = status
             self.updateStatusChanged.emit()
 
+    @Slot(float)
     def _set_progress(self, progress: float) -> None:
         self._download_progress = progress
         self.downloadProgressChanged.emit()
@@ -95,20 +105,34 @@ class AppUpdater(QObject):
 
     @Slot()
     def checkForUpdates(self) -> None:
-        """Check GitHub releases in a background thread."""
+        """Check GitHub releases in the background."""
         self._set_status("checking")
-        thread = threading.Thread(target=self._check_worker, daemon=True)
-        thread.start()
+        self._network.submit(
+            self._check_job,
+            on_success=self._on_release_info,
+            on_failure=self._on_check_failed,
+        )
 
     @Slot()
     def downloadUpdate(self) -> None:
-        """Download the new binary in a background thread."""
-        if not self._download_url:
+        """Download the new binary in the background."""
+        if not self._download_url or self._download_task is not None:
             return
         self._set_status("downloading")
         self._set_progress(0.0)
-        thread = threading.Thread(target=self._download_worker, daemon=True)
-        thread.start()
+        self._download_task = self._network.submit(
+            self._download_job,
+            on_success=self._on_downloaded,
+            on_failure=self._on_download_failed,
+            on_cancel=self._on_download_cancelled,
+            on_progress=self._set_progress,
+        )
+
+    @Slot()
+    def cancelDownload(self) -> None:
+        """Abort a running download; the update stays available."""
+        if self._download_task is not None:
+            self._download_task.cancel()
 
     @Slot()
     def installAndRestart(self) -> None:
@@ -130,71 +154,91 @@ class AppUpdater(QObject):
         else:
             self._install_linux(current_exe)
 
-    # ── Background workers ────────────────────────────────────────────
-
-    def _check_worker(self) -> None:
-        try:
-            req = urllib.request.Request(
-                GITHUB_API_URL,
-                headers={"Accept": "application/vnd.github.v3+json",
-                         "User-Agent": "StudyToday-Updater"},
-            )
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                data = json.loads(resp.read().decode())
-
-            tag = data.get("tag_name", "")
-            remote_ver = _parse_version(tag)
-            local_ver = _parse_version(APP_VERSION)
-
-            if remote_ver > local_ver:
-                # Find the right asset
-                asset_name = self._get_asset_name()
-                download_url = ""
-                for asset in data.get("assets", []):
-                    if asset["name"] == asset_name:
-                        download_url = asset["browser_download_url"]
-                        break
-
-                self._latest_version = tag.lstrip("vV")
-                self.latestVersionChanged.emit()
-                self._download_url = download_url
-                self._update_available = True
-                self.updateAvailableChanged.emit()
-                self._set_status("available")
-            else:
-                self._set_status("idle")
+    # ── Background jobs (worker thread) ───────────────────────────────
 
-        except Exception:
-            self._set_status("idle")  # Fail silently
+    def _check_job(self, task: NetworkTask) -> Any:
+        with task.http.get(
+            self._release_url,
+            headers={"Accept": "application/vnd.github.v3+json",
+                     "User-Agent": "StudyToday-Updater"},
+            timeout=10,
+        ) as resp:
+            return resp.json()
 
-    def _download_worker(self) -> None:
+    def _download_job(self, task: NetworkTask) -> str:
+        suffix = ".exe" if platform.system() == "Windows" else ""
+        fd, tmp_path = tempfile.mkstemp(prefix="studytoday-update-", suffix=suffix)
         try:
-            req = urllib.request.Request(
+            # Own the descriptor at once, so it is closed even when the
+            # request below fails
+            with os.fdopen(fd, "wb") as f, task.http.get(
                 self._download_url,
                 headers={"User-Agent": "StudyToday-Updater"},
-            )
-            with urllib.request.urlopen(req, timeout=120) as resp:
-                total = int(resp.headers.get("Content-Length", 0))
-                suffix = ".exe" if platform.system() == "Windows" else ""
-                fd, tmp_path = tempfile.mkstemp(prefix="studytoday-update-", suffix=suffix)
-
+                timeout=120,
+            ) as resp:
+                total = resp.length
                 downloaded = 0
-                with os.fdopen(fd, "wb") as f:
-                    while True:
-                        chunk = resp.read(65536)
-                        if not chunk:
-                            break
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total > 0:
-                            self._set_progress(downloaded / total)
-
-            self._downloaded_path = tmp_path
-            self._set_progress(1.0)
-            self._set_status("ready")
+                reported = 0.0
+                for chunk in resp.iter_chunks():
+                    task.check_cancelled()
+                    f.write(chunk)
+                    downloaded += len(chunk)
+                    # Report whole percents only, to keep the GUI queue short
+                    if total > 0 and downloaded / total - reported >= 0.01:
+                        reported = downloaded / total
+                        task.report_progress(reported)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return tmp_path
+
+    # ── Job results (GUI thread) ──────────────────────────────────────
+
+    @Slot(object)
+    def _on_release_info(self, data: Any) -> None:
+        tag = data.get("tag_name", "") if isinstance(data, dict) else ""
+        remote_ver = _parse_version(tag)
+        local_ver = _parse_version(APP_VERSION)
+
+        if remote_ver > local_ver:
+            # Find the right asset
+            asset_name = self._get_asset_name()
+            download_url = ""
+            for asset in data.get("assets", []):
+                if asset["name"] == asset_name:
+                    download_url = asset["browser_download_url"]
+                    break
+
+            self._latest_version = tag.lstrip("vV")
+            self.latestVersionChanged.emit()
+            self._download_url = download_url
+            self._update_available = True
+            self.updateAvailableChanged.emit()
+            self._set_status("available")
+        else:
+            self._set_status("idle")
 
-        except Exception:
-            self._set_status("error")
+    @Slot(str)
+    def _on_check_failed(self, _message: str) -> None:
+        self._set_status("idle")  # Fail silently
+
+    @Slot(object)
+    def _on_downloaded(self, path: str) -> None:
+        self._download_task = None
+        self._downloaded_path = path
+        self._set_progress(1.0)
+        self._set_status("ready")
+
+    @Slot(str)
+    def _on_download_failed(self, _message: str) -> None:
+        self._download_task = None
+        self._set_status("error")
+
+    @Slot()
+    def _on_download_cancelled(self) -> None:
+        self._download_task = None
+        self._set_progress(0.0)
+        self._set_status("available")
 
     # ── Platform-specific install ─────────────────────────────────────
 
@@ -0,0 +1,272 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+user_data.py - Streaming export and import of notes, bookmarks and sessions.
+
+Data is written as newline-delimited JSON (one record per line, tagged with
+a ``kind``), gzip-compressed when the file name ends in ``.gz``.  Both
+directions run on a background thread and never hold more than a few
+chunks of records in memory, so multi-hundred-MB histories can be moved
+without freezing the UI.
+
+Imported records are handed to the GUI thread in chunks and applied through
+``AppStore``'s bulk slots, one batch per chunk, so QML sees one change
+signal per list per chunk while other store signals keep flowing between
+chunks.  Records whose id is already present (or repeated within the file)
+are skipped.  Files without a recognised header, or written by a newer
+format version, are rejected.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import os
+import threading
+from typing import Any, Optional
+
+from PySide6.QtCore import QObject, Property, Signal, Slot
+
+from src.models.app_store import AppStore
+
+FORMAT_NAME = "studytoday-userdata"
+FORMAT_VERSION = 1
+
+# Records per chunk handed to the GUI thread, and how many chunks may be
+# queued there before the reader waits.  Together they bound memory use.
+_CHUNK_SIZE = 2000
+_MAX_PENDING_CHUNKS = 4
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _check_header(line: str) -> None:
+    """Raise ValueError unless *line* is a header this version can read."""
+    try:
+        header = json.loads(line)
+    except ValueError:
+        header = None
+    if not isinstance(header, dict) or header.get("kind") != "header" \
+            or header.get("format") != FORMAT_NAME:
+        raise ValueError(f"not a {FORMAT_NAME} file")
+    version = header.get("version")
+    if not isinstance(version, int) or not 1 <= version <= FORMAT_VERSION:
+        raise ValueError(f"unsupported {FORMAT_NAME} version: {version!r}")
+
+
+class UserDataTransfer(QObject):
+    """Background NDJSON backup/restore of the user data in an AppStore."""
+
+    # Signals
+    statusChanged = Signal()
+    errorChanged = Signal()
+    progressChanged = Signal()
+    processedChanged = Signal()
+    finished = Signal(bool)
+
+    # Worker -> GUI thread (queued, since the receiver lives in the GUI thread)
+    _chunkRead = Signal(object, object, object)
+    _progressReported = Signal(float, int)
+    _workerDone = Signal(str, str)  # status, error message
+
+    def __init__(self, store: AppStore, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._store = store
+        self._status: str = "idle"
+        self._error: str = ""
+        self._progress: float = 0.0
+        self._processed: int = 0
+        self._cancel = threading.Event()
+        self._pending = threading.Semaphore(_MAX_PENDING_CHUNKS)
+
+        self._chunkRead.connect(self._apply_chunk)
+        self._progressReported.connect(self._on_progress)
+        self._workerDone.connect(self._on_worker_done)
+
+    # ── Properties ────────────────────────────────────────────────────
+
+    @Property(str, notify=statusChanged)
+    def status(self) -> str:
+        """One of idle, exporting, importing, done, cancelled or error."""
+        return self._status
+
+    @Property(str, notify=errorChanged)
+    def error(self) -> str:
+        """Message of the last failed transfer ("" unless status is error)."""
+        return self._error
+
+    @Property(float, notify=progressChanged)
+    def progress(self) -> float:
+        return self._progress
+
+    @Property(int, notify=processedChanged)
+    def processed(self) -> int:
+        """Number of records written or read so far."""
+        return self._processed
+
+    # ── Internal setters ──────────────────────────────────────────────
+
+    def _set_status(self, status: str) -> None:
+        if self._status != status:
+            self._status = status
+            self.statusChanged.emit()
+
+    def _is_busy(self) -> bool:
+        return self._status in ("exporting", "importing")
+
+    # ── Slots ─────────────────────────────────────────────────────────
+
+    @Slot(str)
+    def exportTo(self, path: str) -> None:
+        """Write all notes, bookmarks and sessions to *path*."""
+        if self._is_busy():
+            return
+        # Shallow copies: the worker must not see lists being mutated,
+        # but the record dicts themselves are shared, not duplicated.
+        snapshot = (
+            ("bookmark", list(self._store.bookmarks)),
+            ("note", list(self._store.notes)),
+            ("session", list(self._store.sessions)),
+        )
+        self._start("exporting", self._export_worker, path, snapshot)
+
+    @Slot(str)
+    def importFrom(self, path: str) -> None:
+        """Merge the records stored in *path* into the store."""
+        if self._is_busy():
+            return
+        self._start("importing", self._import_worker, path)
+
+    @Slot()
+    def cancel(self) -> None:
+        """Stop the running transfer; records already applied are kept."""
+        self._cancel.set()
+
+    def _start(self, status: str, target: Any, *args: Any) -> None:
+        self._cancel.clear()
+        if self._error:
+            self._error = ""
+            self.errorChanged.emit()
+        self._on_progress(0.0, 0)
+        self._set_status(status)
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        thread.start()
+
+    # ── GUI-thread handlers ───────────────────────────────────────────
+
+    @Slot(float, int)
+    def _on_progress(self, progress: float, processed: int) -> None:
+        self._progress = progress
+        self.progressChanged.emit()
+        if self._processed != processed:
+            self._processed = processed
+            self.processedChanged.emit()
+
+    @Slot(object, object, object)
+    def _apply_chunk(self, bookmarks: list, notes: list, sessions: list) -> None:
+        try:
+            # One batch per chunk: never held open across event-loop turns
+            with self._store.batch():
+                if bookmarks:
+                    self._store.addBookmarks(bookmarks)
+                if notes:
+                    self._store.addNotes(notes)
+                if sessions:
+                    self._store.addSessions(sessions)
+        finally:
+            self._pending.release()
+
+    @Slot(str, str)
+    def _on_worker_done(self, status: str, error: str) -> None:
+        if error != self._error:
+            self._error = error
+            self.errorChanged.emit()
+        if status == "done":
+            self._on_progress(1.0, self._processed)
+        self._set_status(status)
+        self.finished.emit(status == "done")
+
+    # ── Background workers ────────────────────────────────────────────
+
+    def _export_worker(self, path: str, snapshot: tuple) -> None:
+        total = sum(len(records) for _kind, records in snapshot) or 1
+        written = 0
+        try:
+            opener = gzip.open if path.endswith(".gz") else open
+            with opener(path, "wt", encoding="utf-8", newline="\n") as f:
+                f.write(json.dumps({"kind": "header", "format": FORMAT_NAME,
+                                    "version": FORMAT_VERSION}) + "\n")
+                for kind, records in snapshot:
+                    for record in records:
+                        if self._cancel.is_set():
+                            self._workerDone.emit("cancelled", "")
+                            return
+                        f.write(json.dumps({"kind": kind, **record},
+                                           ensure_ascii=False) + "\n")
+                        written += 1
+                        if written % _CHUNK_SIZE == 0:
+                            self._progressReported.emit(written / total, written)
+            self._progressReported.emit(1.0, written)
+            self._workerDone.emit("done", "")
+        except Exception as exc:
+            self._workerDone.emit("error", str(exc) or type(exc).__name__)
+
+    def _import_worker(self, path: str) -> None:
+        # De-duplication by id (both against the store and within the
+        # file) happens in the store's bulk slots, so nothing here grows
+        # with the size of the file.
+        kinds = ("bookmark", "note", "session")
+        chunk: dict[str, list[dict[str, Any]]] = {k: [] for k in kinds}
+        pending = 0
+        read = 0
+
+        def flush() -> bool:
+            nonlocal chunk, pending
+            # Back-pressure: wait until the GUI thread has room for more.
+            while not self._pending.acquire(timeout=0.1):
+                if self._cancel.is_set():
+                    return False
+            self._chunkRead.emit(chunk["bookmark"], chunk["note"], chunk["session"])
+            chunk = {k: [] for k in kinds}
+            pending = 0
+            return True
+
+        try:
+            size = os.path.getsize(path) or 1
+            with open(path, "rb") as raw:
+                compressed = raw.read(2) == _GZIP_MAGIC
+                raw.seek(0)
+                binary = gzip.GzipFile(fileobj=raw) if compressed else raw
+                text = io.TextIOWrapper(binary, encoding="utf-8")
+                _check_header(text.readline())
+                for line in text:
+                    if self._cancel.is_set():
+                        break
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if not isinstance(record, dict):
+                        continue
+                    kind = record.pop("kind", None)
+                    if kind not in chunk:
+                        continue
+                    chunk[kind].append(record)
+                    pending += 1
+                    read += 1
+                    if pending >= _CHUNK_SIZE:
+                        if not flush():
+                            break
+                        self._progressReported.emit(raw.tell() / size, read)
+                if not self._cancel.is_set() and pending:
+                    flush()
+            if self._cancel.is_set():
+                self._workerDone.emit("cancelled", "")
+            else:
+                self._progressReported.emit(1.0, read)
+                self._workerDone.emit("done", "")
+        except Exception as exc:
+            self._workerDone.emit("error", str(exc) or type(exc).__name__)
@@ -70,10 +70,20 @@ QtObject {
     readonly property int spacing3xl: 48
 
     // ── Animation Durations (ms) ───────────────────────────────────────
-    readonly property int animFast:    150
-    readonly property int animNormal:  200
-    readonly property int animMedium:  300
-    readonly property int animSlow:    400
+    // Bound to appStore.lowPower in main.qml; zero durations skip
+    // transitions so they cost a single frame.
+    property bool reducedMotion: false
+    readonly property int animFast:    reducedMotion ? 0 : 150
+    readonly property int animNormal:  reducedMotion ? 0 : 200
+    readonly property int animMedium:  reducedMotion ? 0 : 300
+    readonly property int animSlow:    reducedMotion ? 0 : 400
+    readonly property int animEntrance: reducedMotion ? 0 : 500
+    // One step of the wrong-answer shake
+    readonly property int animShake:   reducedMotion ? 0 : 50
+    // Half a cycle of a looping pulse.  Not zeroed: a zero-length infinite
+    // loop would spin, so loops stop through appStore.animationsActive.
+    readonly property int animPulse:   600
+    readonly property int animBreathe: 1200
 
     // ── Sidebar Dimensions ─────────────────────────────────────────────
     readonly property int sidebarCollapsed: 72
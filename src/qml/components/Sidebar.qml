@@ -148,12 +148,12 @@ Item {
                         }
                     }
 
-                    // Pulse animation for syncing
+                    // Pulse animation for syncing (paused while idle)
                     SequentialAnimation on opacity {
-                        running: root.syncStatus === "syncing"
+                        running: root.syncStatus === "syncing" && appStore.animationsActive
                         loops: Animation.Infinite
-                        NumberAnimation { to: 0.4; duration: 600; easing.type: Easing.InOutQuad }
-                        NumberAnimation { to: 1.0; duration: 600; easing.type: Easing.InOutQuad }
+                        NumberAnimation { to: 0.4; duration: Theme.animPulse; easing.type: Easing.InOutQuad }
+                        NumberAnimation { to: 1.0; duration: Theme.animPulse; easing.type: Easing.InOutQuad }
                     }
                 }
 
@@ -237,6 +237,15 @@ Item {
             onClicked: root.navigated("flashcards")
         }
 
+        SidebarNavItem {
+            pageName: "quiz"
+            iconText: "\u2705"
+            label: "Toets"
+            isActive: root.currentPage === "quiz"
+            isExpanded: root.expanded
+            onClicked: root.navigated("quiz")
+        }
+
         SidebarNavItem {
             pageName: "notes"
             iconText: "\uD83D\uDCDD"
@@ -26,11 +26,82 @@ ApplicationWindow {
         if (currentPage === pageName && contentStack.depth > 0) return
         currentPage = pageName
         appStore.navigate(pageName)
+        showPage(pageName)
+    }
+
+    // ── Page cache ─────────────────────────────────────────────────────
+    // Recently used pages stay alive (parented to pageCacheHost while
+    // hidden) so going back to them skips creating all their bindings and
+    // delegates.  Pages follow appStore.currentSubjectId/currentTopicId
+    // through their own bindings; they may define pageActivated() and
+    // pageDeactivated() to reset or save local state.
+    //
+    // Least recently used pages are destroyed once more than
+    // pageCacheMaxPages are cached or their estimated size (visual item
+    // count) exceeds pageCacheItemBudget.
+    property int pageCacheMaxPages: 5
+    property int pageCacheItemBudget: 8000
+    property var pageCache: ({})      // page name -> { item, cost }
+    property var pageCacheOrder: []   // page names, most recently used first
+
+    Item {
+        id: pageCacheHost
+        visible: false
+    }
+
+    function itemCount(item) {
+        var count = 1
+        var kids = item.children || []
+        for (var i = 0; i < kids.length; i++) count += itemCount(kids[i])
+        return count
+    }
 
+    function showPage(pageName) {
         var component = pageMap[pageName]
-        if (component) {
-            contentStack.replace(null, component)
+        if (!component) return
+
+        var entry = pageCache[pageName]
+        navMetrics.begin(pageName, entry !== undefined)
+
+        var previous = contentStack.currentItem
+        if (previous && typeof previous.pageDeactivated === "function")
+            previous.pageDeactivated()
+
+        if (!entry) {
+            entry = { item: component.createObject(pageCacheHost), cost: 0 }
+            pageCache[pageName] = entry
+        }
+        pageCacheOrder = [pageName].concat(pageCacheOrder.filter(function(n) { return n !== pageName }))
+
+        contentStack.replace(null, entry.item)
+        if (typeof entry.item.pageActivated === "function")
+            entry.item.pageActivated()
+
+        if (previous) {
+            for (var name in pageCache) {
+                if (pageCache[name].item === previous)
+                    pageCache[name].cost = itemCount(previous)
+            }
+        }
+        evictPages()
+    }
+
+    function evictPages() {
+        var total = 0
+        var keep = []
+        for (var i = 0; i < pageCacheOrder.length; i++) {
+            var name = pageCacheOrder[i]
+            var entry = pageCache[name]
+            total += entry.cost
+            // The current page and the one transitioning out are always kept
+            if (i < 2 || (keep.length < pageCacheMaxPages && total <= pageCacheItemBudget)) {
+                keep.push(name)
+            } else {
+                delete pageCache[name]
+                entry.item.destroy()
+            }
         }
+        pageCacheOrder = keep
     }
 
     // Map page names to component files
@@ -41,6 +112,7 @@ ApplicationWindow {
         "topic":      topicPageComp,
         "search":     zoekenPageComp,
         "flashcards": flashcardsPageComp,
+        "quiz":       toetsPageComp,
         "notes":      notitiesPageComp,
         "timer":      timerPageComp
     })
@@ -52,10 +124,7 @@ ApplicationWindow {
             var page = appStore.currentPage
             if (page !== root.currentPage) {
                 root.currentPage = page
-                var component = pageMap[page]
-                if (component) {
-                    contentStack.replace(null, component)
-                }
+                showPage(page)
             }
         }
     }
@@ -69,6 +138,13 @@ ApplicationWindow {
         isMaximized = !isMaximized
     }
 
+    // ── Rendering budget ───────────────────────────────────────────────
+    Binding {
+        target: Theme
+        property: "reducedMotion"
+        value: appStore.lowPower
+    }
+
     // ── Page Components ──────────────────────────────────────────────
     Component { id: huisPageComp; HuisPage {} }
     Component { id: vakkenPageComp; VakkenPage {} }
@@ -76,6 +152,7 @@ ApplicationWindow {
     Component { id: topicPageComp; TopicPage {} }
     Component { id: zoekenPageComp; ZoekenPage {} }
     Component { id: flashcardsPageComp; FlashcardsPage {} }
+    Component { id: toetsPageComp; ToetsPage {} }
     Component { id: notitiesPageComp; NotitiesPage {} }
     Component { id: timerPageComp; TimerPage {} }
 
@@ -242,7 +319,7 @@ ApplicationWindow {
                             color: Theme.accent
 
                             Behavior on width {
-                                NumberAnimation { duration: 200; easing.type: Easing.OutCubic }
+                                NumberAnimation { duration: Theme.animNormal; easing.type: Easing.OutCubic }
                             }
                         }
                     }
@@ -296,8 +373,6 @@ ApplicationWindow {
                 anchors.margins: Theme.spacingLg
                 clip: true
 
-                initialItem: huisPageComp
-
                 pushEnter: Transition {
                     ParallelAnimation {
                         PropertyAnimation { property: "opacity"; from: 0; to: 1; duration: Theme.animMedium; easing.type: Easing.OutCubic }
@@ -339,5 +414,6 @@ ApplicationWindow {
     // Load home page on start
     Component.onCompleted: {
         root.currentPage = "home"
+        showPage("home")
     }
 }
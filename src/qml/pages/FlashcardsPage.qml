@@ -16,6 +16,33 @@ Item {
     property int currentIndex: 0
     property bool flipped: false
 
+    // ── Question blocks ──────────────────────────────────────────────────
+    // The block grammar of content_parser.py, kept in step with it by
+    // parser_conformance.py: whitespace and line breaks are Python's, and a
+    // block runs from an opener to the first closer line after it.
+
+    function pyStrip(text) {
+        return text.replace(/^[\t\n\x0b\x0c\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+|[\t\n\x0b\x0c\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+$/g, "")
+    }
+
+    function questionBlocks(content) {
+        var blocks = []
+        var head = /(?:^|\n):::(meerkeuze|invullen|waar-of-niet|koppelen|open)[\t\n\x0b\x0c\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]*\n/g
+        var close = /\n:::[\t\n\x0b\x0c\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]*(?![^\n])/g
+        var opened
+        while ((opened = head.exec(content)) !== null) {
+            var bodyStart = head.lastIndex
+            close.lastIndex = bodyStart - 1
+            var closed = close.exec(content)
+            // Without a closer after this opener, later openers have none
+            // either; stopping keeps unclosed openers linear
+            if (closed === null) break
+            blocks.push({ type: opened[1], body: content.substring(bodyStart, closed.index + 1) })
+            head.lastIndex = close.lastIndex
+        }
+        return blocks
+    }
+
     function collectFlashcards() {
         var result = []
         var subs = appStore.subjects
@@ -24,42 +51,31 @@ Item {
         for (var i = 0; i < subs.length; i++) {
             var topics = subs[i].topics || []
             for (var j = 0; j < topics.length; j++) {
-                var content = topics[j].content || ""
-                // Extract invullen questions as flashcards
-                var regex = /^:::invullen\s*\n([\s\S]*?)^:::\s*$/gm
-                var match
-                while ((match = regex.exec(content)) !== null) {
-                    var body = match[1]
-                    var vraag = "", antwoord = ""
-                    var lines = body.trim().split("\n")
+                // Invullen cards come first, then waar-of-niet cards
+                var blocks = questionBlocks(topics[j].content || "")
+                var invullen = [], waarOfNiet = []
+                for (var b = 0; b < blocks.length; b++) {
+                    var type = blocks[b].type
+                    if (type !== "invullen" && type !== "waar-of-niet") continue
+                    var vraag = "", antwoord = "", uitleg = ""
+                    var lines = pyStrip(blocks[b].body).split(/\r\n|[\n\x0b\x0c\r\x1c\x1d\x1e\x85\u2028\u2029]/)
                     for (var k = 0; k < lines.length; k++) {
-                        var line = lines[k].trim()
+                        var line = pyStrip(lines[k])
                         var lower = line.toLowerCase()
-                        if (lower.indexOf("vraag:") === 0) vraag = line.substring(6).trim()
-                        else if (lower.indexOf("antwoord:") === 0) antwoord = line.substring(9).trim()
-                    }
-                    if (vraag && antwoord) {
-                        result.push({ vraag: vraag, antwoord: antwoord, vak: subs[i].naam })
-                    }
-                }
-                // Also extract waar-of-niet as flashcards
-                var regex2 = /^:::waar-of-niet\s*\n([\s\S]*?)^:::\s*$/gm
-                var match2
-                while ((match2 = regex2.exec(content)) !== null) {
-                    var body2 = match2[1]
-                    var vraag2 = "", antwoord2 = "", uitleg2 = ""
-                    var lines2 = body2.trim().split("\n")
-                    for (var k2 = 0; k2 < lines2.length; k2++) {
-                        var line2 = lines2[k2].trim()
-                        var lower2 = line2.toLowerCase()
-                        if (lower2.indexOf("vraag:") === 0) vraag2 = line2.substring(6).trim()
-                        else if (lower2.indexOf("antwoord:") === 0) antwoord2 = line2.substring(9).trim()
-                        else if (lower2.indexOf("uitleg:") === 0) uitleg2 = line2.substring(7).trim()
+                        if (lower.indexOf("vraag:") === 0) vraag = pyStrip(line.substring(6))
+                        else if (lower.indexOf("antwoord:") === 0) antwoord = pyStrip(line.substring(9))
+                        else if (lower.indexOf("uitleg:") === 0) uitleg = pyStrip(line.substring(7))
                     }
-                    if (vraag2) {
-                        result.push({ vraag: vraag2, antwoord: antwoord2 + (uitleg2 ? " - " + uitleg2 : ""), vak: subs[i].naam })
+                    if (type === "invullen") {
+                        // Extract invullen questions as flashcards
+                        if (vraag && antwoord)
+                            invullen.push({ vraag: vraag, antwoord: antwoord, vak: subs[i].naam })
+                    } else if (vraag) {
+                        // Also extract waar-of-niet as flashcards
+                        waarOfNiet.push({ vraag: vraag, antwoord: antwoord + (uitleg ? " - " + uitleg : ""), vak: subs[i].naam })
                     }
                 }
+                result = result.concat(invullen, waarOfNiet)
             }
         }
         return result
@@ -174,7 +190,7 @@ Item {
                         target: cardRotation
                         property: "angle"
                         to: 90
-                        duration: 200
+                        duration: Theme.animNormal
                         easing.type: Easing.InCubic
                     }
 
@@ -186,7 +202,7 @@ Item {
                         target: cardRotation
                         property: "angle"
                         to: 0
-                        duration: 200
+                        duration: Theme.animNormal
                         easing.type: Easing.OutCubic
                     }
                 }
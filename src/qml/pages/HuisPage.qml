@@ -88,7 +88,7 @@ Item {
                         id: heroAnim
                         target: parent
                         from: 0; to: 1
-                        duration: 500
+                        duration: Theme.animEntrance
                         easing.type: Easing.OutCubic
                     }
                 }
@@ -265,6 +265,14 @@ Item {
                                 }
                             }
 
+                            // Mastery of the subject's questions
+                            ProgressRing {
+                                size: 44
+                                strokeWidth: 4
+                                progress: appStore.progressRevision, appStore.subjectProgress(subjectCard.modelData.id).percent
+                                Layout.alignment: Qt.AlignVCenter
+                            }
+
                             // Arrow indicator
                             Text {
                                 text: "\u2192"
@@ -11,29 +11,82 @@ Item {
     id: notitiesPage
 
     // ── Data ─────────────────────────────────────────────────────────────
+    // `notes` only changes when notes are added or removed; edits to a
+    // single note arrive through appStore.noteChanged(id).
     property var notes: appStore.notes || []
     property int selectedIndex: -1
-    property var selectedNote: selectedIndex >= 0 && selectedIndex < notes.length ? notes[selectedIndex] : null
+    property var selectedNote: null
+    property bool loadingNote: false
+
+    function selectNote(index) {
+        saveNow()
+        selectedIndex = index
+        reloadEditor()
+    }
+
+    // Load the selected note's current text into the editor
+    function reloadEditor() {
+        var item = selectedIndex >= 0 && selectedIndex < notes.length ? notes[selectedIndex] : null
+        selectedNote = item ? appStore.getNote(item.id) : null
+        loadingNote = true
+        var cursor = contentArea.cursorPosition
+        titleInput.text = selectedNote ? (selectedNote.title || "") : ""
+        contentArea.text = selectedNote ? (selectedNote.content || "") : ""
+        contentArea.cursorPosition = Math.min(cursor, contentArea.length)
+        loadingNote = false
+    }
+
+    function saveNow() {
+        saveTimer.stop()
+        if (selectedNote)
+            appStore.updateNote(selectedNote.id, titleInput.text, contentArea.text)
+    }
+
+    function undo() {
+        saveNow()
+        if (selectedNote && appStore.undoNote(selectedNote.id)) reloadEditor()
+    }
+
+    function redo() {
+        saveNow()
+        if (selectedNote && appStore.redoNote(selectedNote.id)) reloadEditor()
+    }
+
+    // Called by main.qml when the (cached) page is hidden
+    function pageDeactivated() {
+        saveNow()
+    }
+
+    function textEdited() {
+        if (selectedNote && !loadingNote) saveTimer.restart()
+    }
+
+    onNotesChanged: {
+        // Keep the selection on the same note when others are added/removed
+        var id = selectedNote ? selectedNote.id : ""
+        var index = -1
+        for (var i = 0; i < notes.length; i++) {
+            if (notes[i].id === id) { index = i; break }
+        }
+        if (index !== selectedIndex) {
+            selectedIndex = index
+            if (index < 0) reloadEditor()
+        }
+    }
 
     // ── Debounce save timer ──────────────────────────────────────────────
+    // The store records only the changed span and notifies just this note.
     Timer {
         id: saveTimer
-        interval: 800
+        interval: 500
         repeat: false
-        onTriggered: {
-            if (notitiesPage.selectedNote && notitiesPage.selectedNote.topicId !== undefined) {
-                appStore.addNote(
-                    notitiesPage.selectedNote.topicId,
-                    titleInput.text,
-                    contentArea.text
-                )
-            }
-        }
+        onTriggered: notitiesPage.saveNow()
     }
 
     // ── Fade-in ──────────────────────────────────────────────────────────
     opacity: 0
     Component.onCompleted: fadeIn.start()
+    Component.onDestruction: saveNow()
 
     OpacityAnimator {
         id: fadeIn
@@ -77,11 +130,12 @@ Item {
                     GlassButton {
                         text: "+"
                         onClicked: {
-                            appStore.addNote(0, "Nieuwe notitie", "")
+                            notitiesPage.saveNow()
+                            appStore.addNote("", "Nieuwe notitie", "")
                             // Select the newly created note
                             Qt.callLater(function() {
                                 if (notitiesPage.notes.length > 0) {
-                                    notitiesPage.selectedIndex = notitiesPage.notes.length - 1
+                                    notitiesPage.selectNote(notitiesPage.notes.length - 1)
                                 }
                             })
                         }
@@ -134,6 +188,17 @@ Item {
                                 required property var modelData
                                 required property int index
 
+                                // Refreshed only when this note is edited
+                                property var note: modelData
+
+                                Connections {
+                                    target: appStore
+                                    function onNoteChanged(noteId) {
+                                        if (noteId === noteItem.modelData.id)
+                                            noteItem.note = appStore.getNote(noteId)
+                                    }
+                                }
+
                                 Column {
                                     anchors.verticalCenter: parent.verticalCenter
                                     anchors.left: parent.left
@@ -143,7 +208,7 @@ Item {
                                     spacing: 2
 
                                     Text {
-                                        text: noteItem.modelData.title || "Zonder titel"
+                                        text: noteItem.note.title || "Zonder titel"
                                         font.family: Theme.fontFamily
                                         font.pixelSize: Theme.fontSizeSm
                                         font.weight: Theme.fontWeightMedium
@@ -156,7 +221,7 @@ Item {
 
                                     Text {
                                         text: {
-                                            var c = noteItem.modelData.content || ""
+                                            var c = (noteItem.note.content || "").substring(0, 41)
                                             return c.length > 40 ? c.substring(0, 40) + "..." : (c || "Lege notitie")
                                         }
                                         font.family: Theme.fontFamily
@@ -172,7 +237,7 @@ Item {
                                     anchors.fill: parent
                                     cursorShape: Qt.PointingHandCursor
                                     hoverEnabled: true
-                                    onClicked: notitiesPage.selectedIndex = noteItem.index
+                                    onClicked: notitiesPage.selectNote(noteItem.index)
                                 }
 
                                 Behavior on color {
@@ -238,7 +303,6 @@ Item {
                     id: titleInput
                     visible: notitiesPage.selectedNote !== null
                     width: parent.width
-                    text: notitiesPage.selectedNote ? (notitiesPage.selectedNote.title || "") : ""
                     placeholderText: "Titel..."
                     font.family: Theme.fontFamily
                     font.pixelSize: Theme.fontSizeXl
@@ -252,10 +316,11 @@ Item {
                     padding: 0
                     bottomPadding: Theme.spacingSm
 
-                    onTextChanged: {
-                        if (notitiesPage.selectedNote) {
-                            saveTimer.restart()
-                        }
+                    onTextChanged: notitiesPage.textEdited()
+
+                    Keys.onPressed: function(event) {
+                        if (event.matches(StandardKey.Undo)) { notitiesPage.undo(); event.accepted = true }
+                        else if (event.matches(StandardKey.Redo)) { notitiesPage.redo(); event.accepted = true }
                     }
                 }
 
@@ -274,7 +339,6 @@ Item {
 
                     TextArea {
                         id: contentArea
-                        text: notitiesPage.selectedNote ? (notitiesPage.selectedNote.content || "") : ""
                         placeholderText: "Begin met schrijven..."
                         font.family: Theme.fontFamily
                         font.pixelSize: Theme.fontSizeMd
@@ -286,10 +350,11 @@ Item {
                         }
                         padding: 0
 
-                        onTextChanged: {
-                            if (notitiesPage.selectedNote) {
-                                saveTimer.restart()
-                            }
+                        onTextChanged: notitiesPage.textEdited()
+
+                        Keys.onPressed: function(event) {
+                            if (event.matches(StandardKey.Undo)) { notitiesPage.undo(); event.accepted = true }
+                            else if (event.matches(StandardKey.Redo)) { notitiesPage.redo(); event.accepted = true }
                         }
                     }
                 }
@@ -26,6 +26,16 @@ Item {
     property string subjectIcon: currentSubject ? (currentSubject.icon || "") : ""
     property var topics: currentSubject ? (currentSubject.topics || []) : []
 
+    // ── Page cache hooks ─────────────────────────────────────────────────
+    property string shownSubjectId: ""
+
+    function pageActivated() {
+        if (shownSubjectId !== appStore.currentSubjectId) {
+            shownSubjectId = appStore.currentSubjectId
+            scrollView.contentY = 0
+        }
+    }
+
     // ── Fade-in ──────────────────────────────────────────────────────────
     opacity: 0
     Component.onCompleted: fadeIn.start()
@@ -39,6 +49,7 @@ Item {
     }
 
     Flickable {
+        id: scrollView
         anchors.fill: parent
         contentHeight: contentColumn.height + Theme.spacing3xl
         clip: true
@@ -178,6 +189,17 @@ Item {
                                 elide: Text.ElideRight
                             }
 
+                            // Mastery of the topic's questions
+                            ProgressRing {
+                                property var stats: (appStore.progressRevision, appStore.topicProgress(topicItem.modelData.id))
+                                visible: stats.total > 0
+                                size: 28
+                                strokeWidth: 3
+                                showLabel: false
+                                progress: stats.percent
+                                Layout.alignment: Qt.AlignVCenter
+                            }
+
                             // Arrow
                             Text {
                                 text: "\u2192"
@@ -11,78 +11,52 @@ Item {
     id: timerPage
 
     // ── State ────────────────────────────────────────────────────────────
-    property string timerMode: "focus"  // "focus" or "pauze"
-    property int focusDuration: 25 * 60  // 25 minutes in seconds
-    property int pauzeDuration: 5 * 60   // 5 minutes in seconds
-    property int totalSeconds: timerMode === "focus" ? focusDuration : pauzeDuration
-    property int remainingSeconds: totalSeconds
-    property bool running: false
+    // The countdown lives in studyTimer (Python, monotonic clock), so it
+    // keeps running when this page is closed and is recorded in seconds.
+    property string timerMode: studyTimer.mode  // "focus" or "pauze"
+    property int totalSeconds: studyTimer.totalSeconds
+    property int remainingSeconds: studyTimer.remainingSeconds
+    property bool running: studyTimer.running
     property real progress: totalSeconds > 0 ? (1.0 - remainingSeconds / totalSeconds) : 0
 
-    // ── Timer ────────────────────────────────────────────────────────────
-    Timer {
-        id: countdownTimer
-        interval: 1000
-        repeat: true
-        running: timerPage.running
-
-        onTriggered: {
-            if (timerPage.remainingSeconds > 0) {
-                timerPage.remainingSeconds--
-                timerCanvas.requestPaint()
-            }
-            if (timerPage.remainingSeconds <= 0) {
-                timerPage.running = false
-                timerPage.onTimerComplete()
-            }
-        }
-    }
+    // Per-second updates are only pushed while the timer is on screen
+    property bool onScreen: visible
+                            && Window.visibility !== Window.Minimized
+                            && Window.visibility !== Window.Hidden
+    onOnScreenChanged: studyTimer.setDisplayActive(onScreen)
 
     // ── Glow pulse animation while running ───────────────────────────────
     SequentialAnimation {
         id: glowPulse
-        running: timerPage.running
+        running: timerPage.running && timerPage.onScreen && appStore.animationsActive
         loops: Animation.Infinite
 
         NumberAnimation {
             target: glowCircle
             property: "opacity"
             from: 0.15; to: 0.35
-            duration: 1200
+            duration: Theme.animBreathe
             easing.type: Easing.InOutSine
         }
         NumberAnimation {
             target: glowCircle
             property: "opacity"
             from: 0.35; to: 0.15
-            duration: 1200
+            duration: Theme.animBreathe
             easing.type: Easing.InOutSine
         }
     }
 
-    function onTimerComplete() {
-        if (timerMode === "focus") {
-            // Log study session
-            appStore.addSession(appStore.currentSubjectId || 0, focusDuration / 60)
-        }
-    }
-
     function startPause() {
-        running = !running
+        studyTimer.toggle()
     }
 
     function resetTimer() {
-        running = false
-        remainingSeconds = totalSeconds
-        timerCanvas.requestPaint()
+        studyTimer.reset()
     }
 
     function switchMode(newMode) {
-        if (timerMode === newMode) return
-        running = false
-        timerMode = newMode
-        remainingSeconds = totalSeconds
-        timerCanvas.requestPaint()
+        studyTimer.switchMode(newMode)
     }
 
     function formatTime(seconds) {
@@ -93,7 +67,11 @@ Item {
 
     // ── Fade-in ──────────────────────────────────────────────────────────
     opacity: 0
-    Component.onCompleted: fadeIn.start()
+    Component.onCompleted: {
+        studyTimer.setDisplayActive(onScreen)
+        fadeIn.start()
+    }
+    Component.onDestruction: studyTimer.setDisplayActive(false)
 
     OpacityAnimator {
         id: fadeIn
@@ -208,7 +186,7 @@ Item {
                 opacity: 0.15
 
                 Behavior on opacity {
-                    NumberAnimation { duration: 300 }
+                    NumberAnimation { duration: Theme.animMedium }
                 }
             }
 
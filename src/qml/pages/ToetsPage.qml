@@ -0,0 +1,224 @@
+// SPDX-FileCopyrightText: 2026 compiledkernel-idk
+//
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+import QtQuick
+import QtQuick.Controls
+import QtQuick.Layouts
+import ".."
+
+Item {
+    id: toetsPage
+
+    // ── Options ──────────────────────────────────────────────────────────
+    // Empty selections mean "everything"
+    property var selectedSubjects: []
+    property var selectedTypes: []
+    property int questionCount: 10
+
+    readonly property var typeOptions: [
+        { type: "meerkeuze",    label: "Meerkeuze" },
+        { type: "invullen",     label: "Invullen" },
+        { type: "waar-of-niet", label: "Waar of niet" },
+        { type: "koppelen",     label: "Koppelen" },
+        { type: "open",         label: "Open" }
+    ]
+
+    readonly property var cardSources: ({
+        "meerkeuze":    "../study/MeerkeuzeCard.qml",
+        "invullen":     "../study/InvullenCard.qml",
+        "waar-of-niet": "../study/WaarOfNietCard.qml",
+        "koppelen":     "../study/KoppelenCard.qml",
+        "open":         "../study/OpenCard.qml"
+    })
+
+    // ── Quiz ─────────────────────────────────────────────────────────────
+    // Assembled in Python from a pre-built question index (appStore.generateQuiz)
+    property var questions: []
+    property int seed: -1
+    property bool started: false
+
+    function toggle(list, value) {
+        var copy = list.slice()
+        var i = copy.indexOf(value)
+        if (i >= 0) copy.splice(i, 1)
+        else copy.push(value)
+        return copy
+    }
+
+    function generate(useSeed) {
+        var quiz = appStore.generateQuiz({
+            count: questionCount,
+            subjectIds: selectedSubjects,
+            types: selectedTypes,
+            seed: useSeed,
+            // Replaying a seed should give the same quiz
+            excludeRecent: useSeed < 0
+        })
+        seed = quiz.seed
+        questions = quiz.questions
+        started = true
+        scrollView.contentY = 0
+    }
+
+    // ── Fade-in ──────────────────────────────────────────────────────────
+    opacity: 0
+    Component.onCompleted: fadeIn.start()
+
+    OpacityAnimator {
+        id: fadeIn
+        target: toetsPage
+        from: 0; to: 1
+        duration: Theme.animSlow
+        easing.type: Easing.OutCubic
+    }
+
+    Flickable {
+        id: scrollView
+        anchors.fill: parent
+        contentHeight: contentColumn.height + Theme.spacing3xl
+        clip: true
+        boundsBehavior: Flickable.StopAtBounds
+
+        ScrollBar.vertical: ScrollBar {
+            policy: ScrollBar.AsNeeded
+            contentItem: Rectangle {
+                implicitWidth: 4
+                radius: 2
+                color: Theme.textTertiary
+                opacity: 0.5
+            }
+        }
+
+        Column {
+            id: contentColumn
+            anchors.left: parent.left
+            anchors.right: parent.right
+            anchors.margins: Theme.spacingXl
+            y: Theme.spacingXl
+            spacing: Theme.spacingXl
+
+            // ── Header ───────────────────────────────────────────────────
+            Column {
+                width: parent.width
+                spacing: Theme.spacingSm
+
+                Text {
+                    text: "Toets"
+                    font.family: Theme.fontFamily
+                    font.pixelSize: Theme.fontSize2xl
+                    font.weight: Theme.fontWeightBold
+                    color: Theme.textPrimary
+                }
+
+                Text {
+                    text: "Stel een willekeurige toets samen uit je vakken"
+                    font.family: Theme.fontFamily
+                    font.pixelSize: Theme.fontSizeMd
+                    color: Theme.textSecondary
+                }
+            }
+
+            // ── Subjects ─────────────────────────────────────────────────
+            Flow {
+                width: parent.width
+                spacing: Theme.spacingSm
+
+                Repeater {
+                    model: appStore.subjects
+
+                    GlassButton {
+                        required property var modelData
+                        iconName: modelData.icon || ""
+                        text: modelData.naam
+                        variant: toetsPage.selectedSubjects.indexOf(modelData.id) >= 0 ? "accent" : "default"
+                        onClicked: toetsPage.selectedSubjects = toetsPage.toggle(toetsPage.selectedSubjects, modelData.id)
+                    }
+                }
+            }
+
+            // ── Question types ───────────────────────────────────────────
+            Flow {
+                width: parent.width
+                spacing: Theme.spacingSm
+
+                Repeater {
+                    model: toetsPage.typeOptions
+
+                    GlassButton {
+                        required property var modelData
+                        text: modelData.label
+                        variant: toetsPage.selectedTypes.indexOf(modelData.type) >= 0 ? "accent" : "default"
+                        onClicked: toetsPage.selectedTypes = toetsPage.toggle(toetsPage.selectedTypes, modelData.type)
+                    }
+                }
+            }
+
+            // ── Count + actions ──────────────────────────────────────────
+            Row {
+                spacing: Theme.spacingSm
+
+                Repeater {
+                    model: [5, 10, 20]
+
+                    GlassButton {
+                        required property int modelData
+                        text: modelData + " vragen"
+                        variant: toetsPage.questionCount === modelData ? "accent" : "default"
+                        onClicked: toetsPage.questionCount = modelData
+                    }
+                }
+
+                Item { width: Theme.spacingLg; height: 1 }
+
+                GlassButton {
+                    text: "Nieuwe toets"
+                    variant: "accent"
+                    onClicked: toetsPage.generate(-1)
+                }
+
+                GlassButton {
+                    visible: toetsPage.started
+                    text: "Opnieuw"
+                    onClicked: toetsPage.generate(toetsPage.seed)
+                }
+            }
+
+            Text {
+                visible: toetsPage.started
+                text: toetsPage.questions.length === 0
+                    ? "Geen vragen gevonden voor deze selectie."
+                    : toetsPage.questions.length + (toetsPage.questions.length === 1 ? " vraag" : " vragen")
+                      + "  ·  toets #" + toetsPage.seed
+                font.family: Theme.fontFamily
+                font.pixelSize: Theme.fontSizeSm
+                color: Theme.textSecondary
+            }
+
+            // ── Questions ────────────────────────────────────────────────
+            Repeater {
+                model: toetsPage.questions
+
+                Loader {
+                    id: questionLoader
+                    width: contentColumn.width
+
+                    required property var modelData
+                    required property int index
+
+                    source: toetsPage.cardSources[modelData.type] || ""
+                    onLoaded: item.question = modelData
+
+                    // Records progress; answered questions are also left
+                    // out of the next quiz
+                    Connections {
+                        target: questionLoader.item
+                        function onAttempted(correct) {
+                            appStore.recordAttempt(questionLoader.modelData.topicId, questionLoader.modelData.id, correct)
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
@@ -28,14 +28,15 @@ Item {
     }
 
     property string topicTitle: currentTopic ? (currentTopic.titel || "") : ""
-    property string rawContent: currentTopic ? (currentTopic.content || "") : ""
 
     // ── Parsed content: markdown text and questions ───────────────────────
-    // The content_parser is called from Python; we parse in QML via a helper.
-    // We split the content by looking for question block markers.
-    property var parsedData: parseContent(rawContent)
-    property string markdownText: parsedData.markdown
-    property var questions: parsedData.questions
+    // Parsed by content_parser in Python; usually already warmed by the
+    // store's prefetcher before the topic is opened.
+    property var parsedData: currentTopic ? appStore.getParsedTopic(currentTopic.id) : null
+    // Markdown split around images; images load asynchronously from the
+    // "topic" image provider so decoding never blocks scrolling.
+    property var contentBlocks: parsedData ? parsedData.blocks : []
+    property var questions: parsedData ? parsedData.questions : []
 
     // ── Mode: "lezen" or "oefenen" ───────────────────────────────────────
     property string mode: "lezen"
@@ -52,94 +53,17 @@ Item {
         return false
     }
 
-    // ── Content parser (JavaScript) ──────────────────────────────────────
-    function parseContent(raw) {
-        if (!raw) return { markdown: "", questions: [] }
-
-        var blockRegex = /^:::(meerkeuze|invullen|waar-of-niet|koppelen|open)\s*\n([\s\S]*?)^:::\s*$/gm
-        var questions = []
-        var qIndex = 0
-        var markdown = raw.replace(blockRegex, function(match, type, body) {
-            var q = parseQuestionBlock(type, body, qIndex)
-            questions.push(q)
-            var placeholder = "<!-- question-" + qIndex + " -->"
-            qIndex++
-            return placeholder
-        })
-        return { markdown: markdown.trim(), questions: questions }
-    }
+    // ── Page cache hooks ─────────────────────────────────────────────────
+    // A cached page keeps its mode and scroll position for the same topic
+    // and starts fresh for a different one.
+    property string shownTopicId: ""
 
-    function parseQuestionBlock(type, body, qid) {
-        var q = { type: type, id: qid }
-        var lines = body.trim().split("\n")
-
-        if (type === "meerkeuze") {
-            q.vraag = ""; q.opties = []; q.correct = 0; q.uitleg = ""
-            for (var i = 0; i < lines.length; i++) {
-                var line = lines[i].trim()
-                var lower = line.toLowerCase()
-                if (lower.indexOf("vraag:") === 0) {
-                    q.vraag = line.substring(6).trim()
-                } else if (lower.indexOf("opties:") === 0) {
-                    var opts = line.substring(7).trim()
-                    var parts = opts.split(/[A-Z]\)\s*/)
-                    q.opties = parts.filter(function(p) { return p.trim() !== "" }).map(function(p) { return p.trim() })
-                } else if (lower.indexOf("correct:") === 0) {
-                    q.correct = parseInt(line.substring(8).trim()) || 0
-                } else if (lower.indexOf("uitleg:") === 0) {
-                    q.uitleg = line.substring(7).trim()
-                }
-            }
-        } else if (type === "invullen") {
-            q.vraag = ""; q.antwoord = ""; q.hint = ""
-            for (var i = 0; i < lines.length; i++) {
-                var line = lines[i].trim()
-                var lower = line.toLowerCase()
-                if (lower.indexOf("vraag:") === 0) q.vraag = line.substring(6).trim()
-                else if (lower.indexOf("antwoord:") === 0) q.antwoord = line.substring(9).trim()
-                else if (lower.indexOf("hint:") === 0) q.hint = line.substring(5).trim()
-            }
-        } else if (type === "waar-of-niet") {
-            q.vraag = ""; q.antwoord = ""; q.uitleg = ""
-            for (var i = 0; i < lines.length; i++) {
-                var line = lines[i].trim()
-                var lower = line.toLowerCase()
-                if (lower.indexOf("vraag:") === 0) q.vraag = line.substring(6).trim()
-                else if (lower.indexOf("antwoord:") === 0) q.antwoord = line.substring(9).trim().toLowerCase()
-                else if (lower.indexOf("uitleg:") === 0) q.uitleg = line.substring(7).trim()
-            }
-        } else if (type === "koppelen") {
-            q.vraag = ""; q.paren = []
-            for (var i = 0; i < lines.length; i++) {
-                var line = lines[i].trim()
-                var lower = line.toLowerCase()
-                if (lower.indexOf("vraag:") === 0) {
-                    q.vraag = line.substring(6).trim()
-                } else if (lower.indexOf("paren:") === 0) {
-                    var pairsStr = line.substring(6).trim()
-                    var pairs = pairsStr.split(",")
-                    for (var p = 0; p < pairs.length; p++) {
-                        if (pairs[p].indexOf("=") !== -1) {
-                            var parts = pairs[p].split("=")
-                            q.paren.push({ term: parts[0].trim(), definitie: parts[1].trim() })
-                        }
-                    }
-                }
-            }
-        } else if (type === "open") {
-            q.vraag = ""; q.kernwoorden = []
-            for (var i = 0; i < lines.length; i++) {
-                var line = lines[i].trim()
-                var lower = line.toLowerCase()
-                if (lower.indexOf("vraag:") === 0) q.vraag = line.substring(6).trim()
-                else if (lower.indexOf("kernwoorden:") === 0) {
-                    var kwStr = line.substring(12).trim()
-                    q.kernwoorden = kwStr.split(",").filter(function(w) { return w.trim() !== "" }).map(function(w) { return w.trim() })
-                }
-            }
+    function pageActivated() {
+        if (shownTopicId !== appStore.currentTopicId) {
+            shownTopicId = appStore.currentTopicId
+            mode = "lezen"
+            scrollView.contentY = 0
         }
-
-        return q
     }
 
     // ── Fade-in ──────────────────────────────────────────────────────────
@@ -299,19 +223,16 @@ Item {
                 spacing: Theme.spacingLg
                 visible: topicPage.mode === "lezen"
 
-                Text {
-                    width: parent.width
-                    text: topicPage.markdownText
-                    textFormat: Text.MarkdownText
-                    font.family: Theme.fontFamily
-                    font.pixelSize: Theme.fontSizeMd
-                    color: Theme.textPrimary
-                    wrapMode: Text.WordWrap
-                    lineHeight: 1.6
-                    linkColor: Theme.accent
+                Repeater {
+                    model: topicPage.contentBlocks
+
+                    Loader {
+                        width: lezenContent.width
 
-                    onLinkActivated: function(link) {
-                        Qt.openUrlExternally(link)
+                        required property var modelData
+
+                        sourceComponent: modelData.kind === "image" ? imageBlock : textBlock
+                        onLoaded: item.block = modelData
                     }
                 }
             }
@@ -362,6 +283,14 @@ Item {
                         onLoaded: {
                             item.question = modelData
                         }
+
+                        // The card itself is loaded by the wrapper Loader
+                        Connections {
+                            target: questionLoader.item ? questionLoader.item.item : null
+                            function onAttempted(correct) {
+                                appStore.recordAttempt(appStore.currentTopicId, questionLoader.modelData.id, correct)
+                            }
+                        }
                     }
                 }
             }
@@ -371,6 +300,56 @@ Item {
         }
     }
 
+    // ── Content Block Components ─────────────────────────────────────────
+    Component {
+        id: textBlock
+        Text {
+            property var block
+            text: block ? block.markdown : ""
+            textFormat: Text.MarkdownText
+            font.family: Theme.fontFamily
+            font.pixelSize: Theme.fontSizeMd
+            color: Theme.textPrimary
+            wrapMode: Text.WordWrap
+            lineHeight: 1.6
+            linkColor: Theme.accent
+
+            onLinkActivated: function(link) {
+                Qt.openUrlExternally(link)
+            }
+        }
+    }
+
+    Component {
+        id: imageBlock
+        Item {
+            property var block
+            // Keep a placeholder height while loading to limit layout jumps
+            height: image.status === Image.Ready
+                ? image.paintedHeight
+                : (image.status === Image.Error ? altText.implicitHeight : 200)
+
+            Image {
+                id: image
+                width: Math.min(parent.width, implicitWidth)
+                height: implicitWidth > 0 ? width * implicitHeight / implicitWidth : 0
+                source: parent.block ? parent.block.source : ""
+                asynchronous: true
+                fillMode: Image.PreserveAspectFit
+            }
+
+            Text {
+                id: altText
+                visible: image.status === Image.Error
+                text: parent.block ? parent.block.alt : ""
+                font.family: Theme.fontFamily
+                font.pixelSize: Theme.fontSizeSm
+                font.italic: true
+                color: Theme.textTertiary
+            }
+        }
+    }
+
     // ── Question Card Components (delegates to study/ cards) ─────────────
     Component {
         id: meerkeuzeComponent
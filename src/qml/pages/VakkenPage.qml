@@ -71,6 +71,24 @@ Item {
                 }
             }
 
+            // ── Curriculum Switcher ──────────────────────────────────────
+            Flow {
+                width: parent.width
+                spacing: Theme.spacingSm
+                visible: appStore.curricula.length > 1
+
+                Repeater {
+                    model: appStore.curricula
+
+                    GlassButton {
+                        required property var modelData
+                        text: modelData.loading ? modelData.naam + " \u2026" : modelData.naam
+                        variant: modelData.active ? "accent" : "default"
+                        onClicked: appStore.switchCurriculum(modelData.id)
+                    }
+                }
+            }
+
             // ── Subject Grid ─────────────────────────────────────────────
             GridLayout {
                 width: parent.width
@@ -122,7 +140,8 @@ Item {
                                 ProgressRing {
                                     size: 48
                                     strokeWidth: 4
-                                    progress: 0
+                                    // progressRevision makes the binding re-evaluate on new answers
+                                    progress: appStore.progressRevision, appStore.subjectProgress(vakCard.modelData.id).percent
                                     Layout.alignment: Qt.AlignVCenter
                                 }
                             }
@@ -12,6 +12,11 @@ Item {
 
     property string searchText: ""
 
+    // Called by main.qml when the (cached) page is shown again
+    function pageActivated() {
+        searchInput.forceActiveFocus()
+    }
+
     // ── Filtered results ─────────────────────────────────────────────────
     property var searchResults: {
         var results = []
@@ -24,12 +24,16 @@ GlassPanel {
     property bool isCorrect: false
     property string userAnswer: ""
 
+    // Emitted once per answer, for progress tracking
+    signal attempted(bool correct)
+
     function checkAnswer() {
         if (answered) return
         userAnswer = answerInput.text.trim()
         var correct = (question.antwoord || "").trim()
         isCorrect = userAnswer.toLowerCase() === correct.toLowerCase()
         answered = true
+        attempted(isCorrect)
 
         if (!isCorrect) {
             shakeAnim.start()
@@ -47,11 +51,11 @@ GlassPanel {
     SequentialAnimation {
         id: shakeAnim
 
-        NumberAnimation { target: inputContainer; property: "x"; to: 8; duration: 50 }
-        NumberAnimation { target: inputContainer; property: "x"; to: -8; duration: 50 }
-        NumberAnimation { target: inputContainer; property: "x"; to: 6; duration: 50 }
-        NumberAnimation { target: inputContainer; property: "x"; to: -6; duration: 50 }
-        NumberAnimation { target: inputContainer; property: "x"; to: 0; duration: 50 }
+        NumberAnimation { target: inputContainer; property: "x"; to: 8; duration: Theme.animShake }
+        NumberAnimation { target: inputContainer; property: "x"; to: -8; duration: Theme.animShake }
+        NumberAnimation { target: inputContainer; property: "x"; to: 6; duration: Theme.animShake }
+        NumberAnimation { target: inputContainer; property: "x"; to: -6; duration: Theme.animShake }
+        NumberAnimation { target: inputContainer; property: "x"; to: 0; duration: Theme.animShake }
     }
 
     Column {
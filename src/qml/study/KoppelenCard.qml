@@ -25,6 +25,12 @@ GlassPanel {
     property var shuffledRight: []     // shuffled definitions
     property var shuffledMap: []       // maps shuffled index -> original index
     property bool allMatched: matchedPairs.length === paren.length && paren.length > 0
+    property int mistakes: 0
+
+    // Emitted once per answer, for progress tracking
+    signal attempted(bool correct)
+
+    onAllMatchedChanged: if (allMatched) attempted(mistakes === 0)
 
     // Flash state for wrong matches
     property int flashLeftIndex: -1
@@ -74,6 +80,7 @@ GlassPanel {
             selectedLeftIndex = -1
         } else {
             // Wrong match - flash red
+            mistakes++
             flashLeftIndex = selectedLeftIndex
             flashRightIndex = shuffledIndex
             wrongFlashTimer.start()
@@ -105,6 +112,7 @@ GlassPanel {
     function reset() {
         selectedLeftIndex = -1
         matchedPairs = []
+        mistakes = 0
         flashLeftIndex = -1
         flashRightIndex = -1
         shuffleDefinitions()
@@ -25,11 +25,15 @@ GlassPanel {
     property int selectedOption: -1
     property bool isCorrect: false
 
+    // Emitted once per answer, for progress tracking
+    signal attempted(bool correct)
+
     function checkAnswer(index) {
         if (answered) return
         selectedOption = index
         isCorrect = (index === question.correct)
         answered = true
+        attempted(isCorrect)
 
         if (!isCorrect) {
             shakeAnimation.start()
@@ -136,31 +140,31 @@ GlassPanel {
                             target: optionRect
                             property: "x"
                             to: meerkeuzeCard.selectedOption === optionRect.index ? 8 : 0
-                            duration: 50
+                            duration: Theme.animShake
                         }
                         NumberAnimation {
                             target: optionRect
                             property: "x"
                             to: meerkeuzeCard.selectedOption === optionRect.index ? -8 : 0
-                            duration: 50
+                            duration: Theme.animShake
                         }
                         NumberAnimation {
                             target: optionRect
                             property: "x"
                             to: meerkeuzeCard.selectedOption === optionRect.index ? 6 : 0
-                            duration: 50
+                            duration: Theme.animShake
                         }
                         NumberAnimation {
                             target: optionRect
                             property: "x"
                             to: meerkeuzeCard.selectedOption === optionRect.index ? -6 : 0
-                            duration: 50
+                            duration: Theme.animShake
                         }
                         NumberAnimation {
                             target: optionRect
                             property: "x"
                             to: 0
-                            duration: 50
+                            duration: Theme.animShake
                         }
                     }
 
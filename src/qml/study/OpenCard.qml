@@ -24,6 +24,9 @@ GlassPanel {
     property var missingKeywords: []    // keywords that were not found
     property int selfRating: 0         // 0-5 stars
 
+    // Emitted once per answer, for progress tracking
+    signal attempted(bool correct)
+
     function checkAnswer() {
         if (answered) return
         var userText = answerArea.text.toLowerCase().trim()
@@ -43,6 +46,7 @@ GlassPanel {
         foundKeywords = found
         missingKeywords = missing
         answered = true
+        attempted(missing.length === 0)
     }
 
     function reset() {
@@ -24,6 +24,9 @@ GlassPanel {
     property string selectedAnswer: ""
     property bool isCorrect: false
 
+    // Emitted once per answer, for progress tracking
+    signal attempted(bool correct)
+
     function checkAnswer(answer) {
         if (answered) return
         selectedAnswer = answer
@@ -32,6 +35,7 @@ GlassPanel {
         var isTrue = (correct === "waar" || correct === "true" || correct === "ja")
         isCorrect = (answer === "waar" && isTrue) || (answer === "niet waar" && !isTrue)
         answered = true
+        attempted(isCorrect)
 
         if (!isCorrect) {
             shakeAnim.start()
@@ -48,11 +52,11 @@ GlassPanel {
     SequentialAnimation {
         id: shakeAnim
 
-        NumberAnimation { target: buttonsRow; property: "x"; to: 8; duration: 50 }
-        NumberAnimation { target: buttonsRow; property: "x"; to: -8; duration: 50 }
-        NumberAnimation { target: buttonsRow; property: "x"; to: 6; duration: 50 }
-        NumberAnimation { target: buttonsRow; property: "x"; to: -6; duration: 50 }
-        NumberAnimation { target: buttonsRow; property: "x"; to: 0; duration: 50 }
+        NumberAnimation { target: buttonsRow; property: "x"; to: 8; duration: Theme.animShake }
+        NumberAnimation { target: buttonsRow; property: "x"; to: -8; duration: Theme.animShake }
+        NumberAnimation { target: buttonsRow; property: "x"; to: 6; duration: Theme.animShake }
+        NumberAnimation { target: buttonsRow; property: "x"; to: -6; duration: Theme.animShake }
+        NumberAnimation { target: buttonsRow; property: "x"; to: 0; duration: Theme.animShake }
     }
 
     Column {
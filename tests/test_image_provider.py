@@ -0,0 +1,192 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+test_image_provider.py - TopicImageProvider and ThumbnailCache.
+
+Remote images are served by ``http.server`` in a background thread; the
+provider's ``load`` is called directly, as its worker jobs do.
+
+Run with ``python -m pytest tests`` or ``python -m unittest discover tests``.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QSize  # noqa: E402
+from PySide6.QtGui import QColor, QGuiApplication, QImage  # noqa: E402
+
+from src.models import image_provider  # noqa: E402
+from src.models.image_provider import ThumbnailCache, TopicImageProvider  # noqa: E402
+from src.models.network import HttpClient  # noqa: E402
+
+_BOUNDS = QSize(64, 64)
+_CAP = 64 * 1024
+
+
+def _png(width: int, height: int, color: str = "red") -> bytes:
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(QColor(color))
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(data)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes: /small.png, /tagged.png (with an ETag), /big.png (with
+    Content-Length) and /unsized.png (a big body without Content-Length)."""
+
+    protocol_version = "HTTP/1.0"
+
+    def do_GET(self) -> None:
+        self.server.requests.append(self.path)
+        if self.path == "/tagged.png":
+            etag = f'"{self.server.tag}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(self.server.tagged)))
+            self.end_headers()
+            self.wfile.write(self.server.tagged)
+            return
+        if self.path == "/small.png":
+            body = self.server.small
+        elif self.path in ("/big.png", "/unsized.png"):
+            body = b"\0" * (_CAP * 4)
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        if self.path != "/unsized.png":
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except OSError:
+            pass  # client gave up on an oversized body
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class ImageProviderTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QGuiApplication.instance() or QGuiApplication([])
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.daemon_threads = True
+        cls.server.small = _png(200, 100)
+        cls.server.tagged, cls.server.tag = _png(100, 100), "v1"
+        cls.server.requests = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.mkdtemp()
+        self.content_dir = os.path.join(self.tmpdir, "content")
+        os.makedirs(self.content_dir)
+        self.http = HttpClient()
+        self.server.requests.clear()
+        self.server.tagged, self.server.tag = _png(100, 100), "v1"
+        self.cache_dir = os.path.join(self.tmpdir, "thumbnails")
+
+    def tearDown(self) -> None:
+        self.http.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _provider(self) -> TopicImageProvider:
+        cache = ThumbnailCache(self.cache_dir)
+        return TopicImageProvider(cache, self.content_dir, self.http,
+                                  max_source_bytes=_CAP)
+
+    # --- Size cap ---
+
+    def test_remote_image_is_thumbnailed(self) -> None:
+        image = self._provider().load(self.base + "/small.png", _BOUNDS)
+        self.assertEqual((image.width(), image.height()), (64, 32))
+
+    def test_remote_image_over_cap_by_content_length(self) -> None:
+        with self.assertRaisesRegex(ValueError, "larger than"):
+            self._provider().load(self.base + "/big.png", _BOUNDS)
+
+    def test_remote_image_over_cap_while_streaming(self) -> None:
+        with self.assertRaisesRegex(ValueError, "larger than"):
+            self._provider().load(self.base + "/unsized.png", _BOUNDS)
+
+    def test_local_image_over_cap(self) -> None:
+        with open(os.path.join(self.content_dir, "big.png"), "wb") as f:
+            f.write(b"\0" * (_CAP + 1))
+        with self.assertRaisesRegex(ValueError, "larger than"):
+            self._provider().load("big.png", _BOUNDS)
+
+    # --- Remote revalidation ---
+
+    def test_remote_image_cached_within_ttl(self) -> None:
+        provider = self._provider()
+        provider.load(self.base + "/tagged.png", _BOUNDS)
+        provider.load(self.base + "/tagged.png", _BOUNDS)
+        self.assertEqual(self.server.requests, ["/tagged.png"])
+
+    def test_remote_image_revalidated_after_ttl(self) -> None:
+        provider = self._provider()
+        url = self.base + "/tagged.png"
+        self.assertEqual(provider.load(url, _BOUNDS).pixelColor(0, 0), QColor("red"))
+        with mock.patch.object(image_provider, "REMOTE_TTL_S", 0):
+            # Unchanged: 304, served from the cache
+            self.assertEqual(provider.load(url, _BOUNDS).pixelColor(0, 0), QColor("red"))
+            self.server.tagged, self.server.tag = _png(100, 100, "blue"), "v2"
+            self.assertEqual(provider.load(url, _BOUNDS).pixelColor(0, 0), QColor("blue"))
+        self.assertEqual(len(self.server.requests), 3)
+
+    # --- Cache ---
+
+    def test_index_written_in_batches_and_on_flush(self) -> None:
+        cache = ThumbnailCache(self.cache_dir)
+        index_path = os.path.join(self.cache_dir, "index.json")
+        cache.remember("a", "1" * 40)
+        self.assertFalse(os.path.exists(index_path))
+        cache.flush()
+        self.assertEqual(ThumbnailCache(self.cache_dir).content_hash("a"), "1" * 40)
+
+        for i in range(image_provider._INDEX_SAVE_EVERY):
+            cache.remember(f"key{i}", "2" * 40)
+        self.assertEqual(ThumbnailCache(self.cache_dir).content_hash("key0"), "2" * 40)
+
+    def test_budget_enforced_at_construction(self) -> None:
+        cache = ThumbnailCache(self.cache_dir)
+        image = QImage(_png(256, 256))
+        for i in range(4):
+            cache.put(f"{i:040x}", _BOUNDS, image)
+        size = cache.total_bytes // 4
+        cache = ThumbnailCache(self.cache_dir, max_bytes=size * 2)
+        self.assertLessEqual(cache.total_bytes, size * 2 * 0.8)
+        self.assertEqual(cache.total_bytes, sum(
+            entry.stat().st_size for entry in os.scandir(self.cache_dir)
+            if entry.name.endswith(".png")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+test_incremental_parser.py - Stable question ids across content edits.
+
+Each test parses a small topic, edits it and checks which id every
+question (named by its ``vraag``) ends up with.
+
+Run with ``python -m pytest tests`` or ``python -m unittest discover tests``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.content_parser import parse_content  # noqa: E402
+from src.models.incremental_parser import (  # noqa: E402
+    IncrementalParser,
+    ParseState,
+    parse_incremental,
+)
+from src.models.progress import ProgressTracker  # noqa: E402
+
+
+def _doc(*names: str) -> str:
+    """A topic with one open question per name, separated by paragraphs."""
+    parts = ["# Onderwerp\n"]
+    for name in names:
+        parts.append(f"Uitleg bij {name}.\n\n:::open\nvraag: {name}\n"
+                     f"kernwoorden: {name.lower()}\n:::\n")
+    return "\n".join(parts)
+
+
+def _ids(state: ParseState) -> dict[str, int]:
+    return {q.vraag: q.id for q in state.questions}
+
+
+class IncrementalParserTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.state = parse_incremental(_doc("A", "B", "C"))
+
+    def test_first_parse_numbers_like_parse_content(self) -> None:
+        self.assertEqual(_ids(self.state), {"A": 0, "B": 1, "C": 2})
+        self.assertEqual(self.state.result()["markdown"],
+                         parse_content(_doc("A", "B", "C"))["markdown"])
+
+    def test_insert_above_keeps_later_ids(self) -> None:
+        state = parse_incremental(_doc("X", "A", "B", "C"), self.state)
+        self.assertEqual(_ids(state), {"X": 3, "A": 0, "B": 1, "C": 2})
+
+    def test_moved_block_keeps_id(self) -> None:
+        state = parse_incremental(_doc("C", "A", "B"), self.state)
+        self.assertEqual(_ids(state), {"C": 2, "A": 0, "B": 1})
+
+    def test_edited_block_keeps_id(self) -> None:
+        edited = _doc("A", "B", "C").replace("vraag: B", "vraag: B (herzien)")
+        state = parse_incremental(edited, self.state)
+        self.assertEqual(_ids(state), {"A": 0, "B (herzien)": 1, "C": 2})
+
+    def test_deleted_id_is_never_reused(self) -> None:
+        state = parse_incremental(_doc("A", "C"), self.state)
+        self.assertEqual(_ids(state), {"A": 0, "C": 2})
+        state = parse_incremental(_doc("A", "D", "C"), state)
+        self.assertEqual(_ids(state), {"A": 0, "D": 3, "C": 2})
+        self.assertEqual(state.mask, 0b1101)
+
+    def test_table_round_trip(self) -> None:
+        state = parse_incremental(_doc("X", "A", "B", "C"), self.state)
+        table = json.loads(json.dumps(state.table()))
+        restored = ParseState.from_table(table)
+        self.assertIsNone(restored.text)
+        self.assertEqual(restored.ids, state.ids)
+
+        state = parse_incremental(_doc("A", "Y", "B", "C", "X"), restored)
+        self.assertEqual(_ids(state), {"A": 0, "Y": 4, "B": 1, "C": 2, "X": 3})
+
+    def test_inconsistent_table_is_rejected(self) -> None:
+        table = self.state.table()
+        table["ids"] = [0, 0, 1]
+        with self.assertRaises(ValueError):
+            ParseState.from_table(table)
+
+    def test_parser_save_and_load(self) -> None:
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir, True)
+        path = os.path.join(tmpdir, "progress.log.ids")
+        parser = IncrementalParser()
+        parser.state("t", _doc("A", "B", "C"))
+        parser.state("t", _doc("X", "A", "B", "C"))
+        parser.save(path, ["t"])
+
+        parser = IncrementalParser()
+        parser.load(path)
+        self.assertEqual(_ids(parser.state("t", _doc("X", "A", "C"))),
+                         {"X": 3, "A": 0, "C": 2})
+
+
+class ProgressMaskTest(unittest.TestCase):
+
+    def test_deleted_question_is_not_counted(self) -> None:
+        parser = IncrementalParser()
+        tracker = ProgressTracker()
+        content = {"t": _doc("A", "B", "C")}
+
+        def load_topics() -> None:
+            tracker.set_topics([("t", "s")],
+                               lambda topic_id: parser.question_mask(topic_id, content[topic_id]))
+
+        load_topics()
+        # Questions are answered from a parsed topic, which fixes its ids
+        parser.state("t", content["t"])
+        tracker.record("t", 0, True)   # A
+        tracker.record("t", 1, True)   # B
+        self.assertEqual(tracker.topic("t")["answered"], 2)
+
+        content["t"] = _doc("A", "C")
+        load_topics()
+        self.assertEqual(tracker.topic("t"), tracker.subject("s"))
+        self.assertEqual({k: tracker.topic("t")[k] for k in ("answered", "correct", "total")},
+                         {"answered": 1, "correct": 1, "total": 2})
+
+        # A new question gets a fresh id, so B's progress does not move to it
+        content["t"] = _doc("A", "D", "C")
+        load_topics()
+        self.assertEqual(tracker.topic("t")["answered"], 1)
+        self.assertEqual(tracker.question_state("t", 3), 0)
+        tracker.record("t", 3, False)
+        self.assertEqual({k: tracker.topic("t")[k] for k in ("answered", "correct", "total")},
+                         {"answered": 2, "correct": 1, "total": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
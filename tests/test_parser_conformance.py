@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+test_parser_conformance.py - The conformance harness as a regression test.
+
+Runs ``main.py conformance`` on a fixed seed, and checks the block scanner
+against ``_BLOCK_RE`` on the pathological inputs directly.
+
+Run with ``python -m pytest tests`` or ``python -m unittest discover tests``.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.content_parser import _BLOCK_RE, _scan_blocks  # noqa: E402
+from src.models.parser_conformance import PATHOLOGICAL, main  # noqa: E402
+
+_SEED = 20260419
+
+
+class ConformanceTest(unittest.TestCase):
+
+    def test_harness_passes_on_fixed_seed(self) -> None:
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(["-n", "200", "--seed", str(_SEED), "--no-qml"])
+        self.assertEqual(code, 0, out.getvalue())
+        self.assertIn(f"Checked 200 documents (seed {_SEED})", out.getvalue())
+
+    def test_scanner_matches_regex_on_pathological_input(self) -> None:
+        for name, build in PATHOLOGICAL.items():
+            for n in (0, 1, 2, 3, 50, 400):
+                text = build(n)
+                with self.subTest(name=name, n=n):
+                    self.assertEqual(
+                        [(b.start, b.end, b.type, b.body) for b in _scan_blocks(text)],
+                        [(m.start(), m.end(), m.group(1), m.group(2))
+                         for m in _BLOCK_RE.finditer(text)])
+                    # Starting mid-text, as the incremental parser does
+                    pos = len(text) // 2
+                    self.assertEqual(
+                        [(b.start, b.end) for b in _scan_blocks(text, pos)],
+                        [m.span() for m in _BLOCK_RE.finditer(text, pos)])
+
+
+if __name__ == "__main__":
+    unittest.main()
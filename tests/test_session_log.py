@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+test_session_log.py - Study sessions survive a restart and a crash.
+
+Each test builds fresh ``AppStore``/``StudyTimer`` pairs on one data
+directory, the way ``main.py`` wires them, to stand in for app restarts.
+
+Run with ``python -m pytest tests`` or ``python -m unittest discover tests``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import QCoreApplication  # noqa: E402
+
+from src.models.app_store import AppStore  # noqa: E402
+from src.models.study_timer import StudyTimer  # noqa: E402
+
+
+class SessionLogTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.tmpdir, "sessions.log")
+        self.checkpoint_path = os.path.join(self.tmpdir, "timer.json")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _start_app(self) -> tuple[AppStore, StudyTimer]:
+        store = AppStore()
+        store.openSessionLog(self.log_path)
+        timer = StudyTimer(store)
+        timer.openCheckpoint(self.checkpoint_path)
+        return store, timer
+
+    def _write_crash_checkpoint(self, subject_id: str, seconds: float) -> None:
+        with open(self.checkpoint_path, "w", encoding="utf-8") as f:
+            json.dump({"subjectId": subject_id, "elapsed": seconds, "savedAt": 0}, f)
+
+    def test_sessions_survive_restart(self) -> None:
+        store, _timer = self._start_app()
+        store.addSession("wiskunde", 1500)
+        store.addSessions([{"id": "imported", "subjectId": "biologie", "duration": 60}])
+
+        store, _timer = self._start_app()
+        self.assertEqual(sorted((s["subjectId"], s["duration"]) for s in store.sessions),
+                         [("biologie", 60), ("wiskunde", 1500)])
+        # Importing the same session again adds nothing
+        store.addSessions([{"id": "imported", "subjectId": "biologie", "duration": 60}])
+        self.assertEqual(len(store.sessions), 2)
+
+    def test_crash_checkpoint_is_recorded_once(self) -> None:
+        self._write_crash_checkpoint("wiskunde", 600.4)
+        store, _timer = self._start_app()
+        self.assertEqual([s["duration"] for s in store.sessions], [600])
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+        store, _timer = self._start_app()
+        self.assertEqual([s["duration"] for s in store.sessions], [600])
+
+    def test_checkpoint_kept_when_log_write_fails(self) -> None:
+        # A directory in place of the log makes every append fail
+        os.mkdir(self.log_path)
+        self._write_crash_checkpoint("wiskunde", 300)
+        self._start_app()
+        self.assertTrue(os.path.exists(self.checkpoint_path))
+
+        os.rmdir(self.log_path)
+        store, _timer = self._start_app()
+        self.assertEqual([s["duration"] for s in store.sessions], [300])
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_torn_last_line_is_skipped(self) -> None:
+        store, _timer = self._start_app()
+        store.addSession("wiskunde", 100)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write('{"id": "torn", "subj')
+
+        store, _timer = self._start_app()
+        store.addSession("biologie", 200)
+        store, _timer = self._start_app()
+        self.assertEqual([s["duration"] for s in store.sessions], [100, 200])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: 2026 compiledkernel-idk
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+test_updater.py - NetworkManager and AppUpdater against a local HTTP server.
+
+A stand-in for the GitHub releases API and its download host runs on
+``http.server`` in a background thread, so update check, download with
+progress, cancellation and failure can be exercised without the network.
+
+Run with ``python -m pytest tests`` or ``python -m unittest discover tests``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import QCoreApplication  # noqa: E402
+
+from src.models.network import NetworkManager  # noqa: E402
+from src.models.updater import AppUpdater  # noqa: E402
+
+_CHUNK = 65536
+_PAYLOAD = bytes(range(256)) * (_CHUNK * 8 // 256)  # 8 chunks
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes: /release, /binary, /slow (streams slowly) and /missing (404)."""
+
+    def do_GET(self) -> None:
+        base = f"http://127.0.0.1:{self.server.server_port}"
+        if self.path == "/release":
+            body = json.dumps({
+                "tag_name": "v99.0.0",
+                "assets": [{"name": AppUpdater._get_asset_name(),
+                            "browser_download_url": base + self.server.asset_path}],
+            }).encode()
+            self._send(body, "application/json")
+        elif self.path in ("/binary", "/slow"):
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(_PAYLOAD)))
+            self.end_headers()
+            for start in range(0, len(_PAYLOAD), _CHUNK):
+                try:
+                    self.wfile.write(_PAYLOAD[start:start + _CHUNK])
+                    self.wfile.flush()
+                except OSError:
+                    return  # client went away (cancelled)
+                if self.path == "/slow":
+                    time.sleep(0.2)
+        else:
+            self.send_error(404)
+
+    def _send(self, body: bytes, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def _wait_until(predicate: Callable[[], bool], timeout: float = 10.0) -> bool:
+    """Process Qt events until *predicate* holds or *timeout* passes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def _open_fds() -> "int | None":
+    """Number of open file descriptors, where the platform exposes it."""
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None
+
+
+class UpdaterTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.daemon_threads = True
+        cls.server.asset_path = "/binary"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.server.asset_path = "/binary"
+        self.tmpdir = tempfile.mkdtemp()
+        self._old_tempdir, tempfile.tempdir = tempfile.tempdir, self.tmpdir
+        self.network = NetworkManager()
+
+    def tearDown(self) -> None:
+        self.network.shutdown()
+        tempfile.tempdir = self._old_tempdir
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _updater(self, path: str = "/release") -> AppUpdater:
+        return AppUpdater(self.network, release_url=self.base + path)
+
+    def _checked_updater(self) -> AppUpdater:
+        updater = self._updater()
+        updater.checkForUpdates()
+        self.assertTrue(_wait_until(lambda: updater.updateStatus == "available"))
+        return updater
+
+    # --- NetworkManager ---
+
+    def test_fast_failure_reaches_receivers(self) -> None:
+        failures: list[str] = []
+
+        def job(_task):
+            raise ValueError("boom")
+
+        self.network.submit(job, on_failure=failures.append)
+        time.sleep(0.2)  # let the job finish before the event loop runs
+        self.assertTrue(_wait_until(lambda: failures == ["boom"]))
+
+    def test_cancelled_job(self) -> None:
+        cancelled: list[bool] = []
+        started = threading.Event()
+
+        def job(task):
+            started.set()
+            while True:
+                task.check_cancelled()
+                time.sleep(0.01)
+
+        task = self.network.submit(job, on_cancel=lambda: cancelled.append(True))
+        self.assertTrue(started.wait(5))
+        task.cancel()
+        self.assertTrue(_wait_until(lambda: cancelled == [True]))
+
+    def test_http_error_fails(self) -> None:
+        failures: list[str] = []
+        self.network.submit(lambda task: task.http.get(self.base + "/missing").read(),
+                            on_failure=failures.append)
+        self.assertTrue(_wait_until(lambda: bool(failures)))
+        self.assertIn("404", failures[0])
+
+    # --- AppUpdater ---
+
+    def test_check_finds_update(self) -> None:
+        updater = self._checked_updater()
+        self.assertTrue(updater.updateAvailable)
+        self.assertEqual(updater.latestVersion, "99.0.0")
+
+    def test_check_failure_is_silent(self) -> None:
+        updater = self._updater("/missing")
+        updater.checkForUpdates()
+        self.assertEqual(updater.updateStatus, "checking")
+        self.assertTrue(_wait_until(lambda: updater.updateStatus == "idle"))
+        self.assertFalse(updater.updateAvailable)
+
+    def test_download_reports_progress(self) -> None:
+        updater = self._checked_updater()
+        progress: list[float] = []
+        updater.downloadProgressChanged.connect(
+            lambda: progress.append(updater.downloadProgress))
+        updater.downloadUpdate()
+        self.assertTrue(_wait_until(lambda: updater.updateStatus == "ready"))
+        self.assertEqual(progress[-1], 1.0)
+        self.assertTrue(any(0.0 < p < 1.0 for p in progress))
+        self.assertEqual(progress, sorted(progress))
+        with open(updater._downloaded_path, "rb") as f:
+            self.assertEqual(f.read(), _PAYLOAD)
+
+    def test_download_cancel(self) -> None:
+        self.server.asset_path = "/slow"
+        updater = self._checked_updater()
+        updater.downloadUpdate()
+        self.assertTrue(_wait_until(lambda: updater.downloadProgress > 0.0))
+        updater.cancelDownload()
+        self.assertTrue(_wait_until(lambda: updater.updateStatus == "available"))
+        self.assertEqual(updater.downloadProgress, 0.0)
+        self.assertTrue(_wait_until(lambda: not os.listdir(self.tmpdir)))
+
+    def test_download_failure(self) -> None:
+        self.server.asset_path = "/missing"
+        updater = self._checked_updater()
+        fds = _open_fds()
+        updater.downloadUpdate()
+        self.assertTrue(_wait_until(lambda: updater.updateStatus == "error"))
+        self.assertEqual(os.listdir(self.tmpdir), [])
+        if fds is not None:
+            self.assertLessEqual(_open_fds(), fds)
+
+
+if __name__ == "__main__":
+    unittest.main()